@@ -4,6 +4,7 @@ from dicetables.dicepool_collection import (
     WorstOfDicePool,
     UpperMidOfDicePool,
     LowerMidOfDicePool,
+    SelectedOfDicePool,
 )
 from dicetables.dicepool import DicePool
 from dicetables.dicerecord import DiceRecord
@@ -26,6 +27,8 @@ from dicetables.eventsinfo import (
     mean,
     stddev,
     percentage_points,
+    iter_percentage_points,
+    percentage_points_chunks,
     percentage_axes,
     stats,
     full_table_string,
@@ -56,15 +59,18 @@ __all__ = [
     "ParseError",
     "Parser",
     "Roller",
+    "SelectedOfDicePool",
     "StrongDie",
     "UpperMidOfDicePool",
     "WeightedDie",
     "WorstOfDicePool",
     "events_range",
     "full_table_string",
+    "iter_percentage_points",
     "mean",
     "percentage_axes",
     "percentage_points",
+    "percentage_points_chunks",
     "stats",
     "stddev",
 ]
@@ -2,47 +2,189 @@
 AdditiveEvents is the general case for DiceTable - an IntegerEvents that can combine with other IntegerEvents.
 """
 
-from typing import TypeVar, Type, Dict
+from types import MappingProxyType
+from typing import TypeVar, Type, Dict, Iterable, Mapping, Optional, Tuple, Union
 
-from dicetables.eventsbases.integerevents import IntegerEvents
+from dicetables.eventsbases.integerevents import EventsVerifier, IntegerEvents, unwrap_trusted
 from dicetables.factory.eventsfactory import EventsFactory
-from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.dictcombiner import DictCombiner, is_dense
+from dicetables.tools.indexedvalues import IndexedValues, generate_indexed_values_from_dict
+from dicetables.tools.moments import PendingPowerSums, PowerSums, get_power_sums
+from dicetables.tools.powercache import combine_all_events, combine_events
 
 
 def scrub_zeroes(dictionary):
     return {key: val for key, val in dictionary.items() if val}
 
 
+def get_events_storage(events, trusted=False):
+    """
+    dense events are stored as IndexedValues. sparse events, and anything that is not a valid
+    dictionary of ints, are stored as a dict.
+
+    :param events: {event: occurrences} or IndexedValues
+    :param trusted: True means `events` is a valid {int: int>0} that nothing else will mutate, so it
+        is neither scrubbed nor copied.
+    :return: (dict, None) or (None, IndexedValues)
+    """
+    if isinstance(events, IndexedValues):
+        return None, events
+    if trusted:
+        if is_dense(events):
+            return None, generate_indexed_values_from_dict(events)
+        return (events if type(events) is dict else dict(events)), None
+    table = scrub_zeroes(events)
+    if table and EventsVerifier.is_all_ints(table.keys()) and is_dense(table):
+        return None, generate_indexed_values_from_dict(table)
+    return table, None
+
+
+def get_lazy_power_sums(events: IntegerEvents) -> Union[PowerSums, PendingPowerSums]:
+    """
+    :return: the PowerSums of `events`, or the PendingPowerSums of AdditiveEvents that have not
+        worked them out yet. a PendingPowerSums holds these and not the events.
+    """
+    if isinstance(events, AdditiveEvents):
+        lazy = events._get_lazy_power_sums()
+        if lazy is not None:
+            return lazy
+    return events.get_power_sums()
+
+
 T = TypeVar("T", bound="AdditiveEvents")
 
 
 class AdditiveEvents(IntegerEvents):
-    def __init__(self, events_dict):
+    def __init__(self, events_dict: Union[Dict[int, int], IndexedValues]):
         """
 
         :param events_dict: {event: occurrences}\n
             event=int. occurrences=int >=0
-            total occurrences > 0
+            total occurrences > 0\n
+            or IndexedValues\n
+            or TrustedEvents
+
+        events made by EventsFactory from a combine, add_die, ... are passed in as TrustedEvents and
+        are not verified. see `dicetables.eventsbases.integerevents.set_always_verify`. a subclass
+        gets the TrustedEvents as well and should pass it to this `__init__` unchanged.
         """
-        self._table = scrub_zeroes(events_dict)
-        super(AdditiveEvents, self).__init__()
+        events_dict, trusted = unwrap_trusted(events_dict)
+        self._table, self._values = get_events_storage(events_dict, trusted)
+        self._power_sums = None
+        self._pending_power_sums = None
+        super(AdditiveEvents, self).__init__(verify=not trusted)
         EventsFactory.check(self.__class__)
 
+    def _verify_events(self):
+        if self._values is None:
+            super(AdditiveEvents, self)._verify_events()
+        else:
+            EventsVerifier().verify_indexed_values(self._values)
+
     @classmethod
     def new(cls: Type[T]) -> T:
-        return EventsFactory.new(cls)
+        new_events = EventsFactory.new(cls)
+        new_events.get_power_sums()
+        return new_events
 
     def get_dict(self) -> Dict[int, int]:
-        return self._table.copy()
+        if self._values is None:
+            return self._table.copy()
+        return self._values.get_dict()
+
+    def events_view(self) -> Mapping[int, int]:
+        """
+
+        :return: a read-only view of the stored events. no copy. see
+            `dicetables.tools.indexedvalues.IndexedValuesView`
+        """
+        if self._values is None:
+            return MappingProxyType(self._table)
+        return self._values.view()
+
+    def get_indexed_values(self) -> Optional[IndexedValues]:
+        """
+
+        :return: dense events are stored as IndexedValues, which is returned (do not mutate it).
+            sparse events are stored as a dict and this returns None.
+        """
+        return self._values
+
+    def get_power_sums(self) -> PowerSums:
+        """
+        made once. events made by combining events that have power sums carry them along as
+        `PendingPowerSums`, which are worked out here without reading the events.
+        see `dicetables.tools.moments`.
+        """
+        if self._power_sums is None and self._pending_power_sums is not None:
+            self._power_sums = self._pending_power_sums.get()
+            self._pending_power_sums = None
+        if self._power_sums is None:
+            if self._values is None:
+                items = self._table.items()
+            else:
+                items = enumerate(self._values.raw_values, self._values.start_index)
+            self._power_sums = get_power_sums(items)
+        return self._power_sums
 
     def __str__(self):
-        min_event = min(self._table.keys())
-        max_event = max(self._table.keys())
+        if self._values is None:
+            min_event, max_event = min(self._table.keys()), max(self._table.keys())
+        else:
+            min_event, max_event = self._values.index_range
         return "table from {} to {}".format(min_event, max_event)
 
+    def __eq__(self, other):
+        if type(self) is type(other) and self._values is not None and other._values is not None:
+            return self._values == other._values
+        return super(AdditiveEvents, self).__eq__(other)
+
+    def _from_combined(self: T, dictionary, events_times) -> T:
+        """
+
+        :param dictionary: this combined with every (events, times) in `events_times`
+        :return: the new events with the power sums carried along, so they are never read again.
+        """
+        new_events = EventsFactory.from_dictionary(self, dictionary, trusted=True)
+        new_events._pending_power_sums = self._get_pending_power_sums(events_times)
+        return new_events
+
+    def _get_pending_power_sums(self, events_times, remove=False):
+        """
+
+        :return: the power sums of this combined with (or divided by) `events_times`, worked out
+            when they are asked for. None when this has no power sums to start from.
+        """
+        base = self._get_lazy_power_sums()
+        if base is None:
+            return None
+        power_sums_times = [(get_lazy_power_sums(events), times) for events, times in events_times]
+        return PendingPowerSums(base, power_sums_times, remove)
+
+    def _get_lazy_power_sums(self) -> Optional[Union[PowerSums, PendingPowerSums]]:
+        """:return: the power sums, the PendingPowerSums or None. does not work anything out."""
+        if self._power_sums is None:
+            return self._pending_power_sums
+        return self._power_sums
+
     def combine(self: T, events: IntegerEvents, times: int = 1) -> T:
-        dictionary = DictCombiner(self.get_dict()).combine_by_fastest(events.get_dict(), times)
-        return EventsFactory.from_dictionary(self, dictionary)
+        """
+        uses the fastest method. if `events` is a ProtoDie combined more than once, its n-fold
+        combination comes from the power cache. see `dicetables.tools.powercache`.
+        """
+        dictionary = combine_events(self.events_view(), events, times)
+        return self._from_combined(dictionary, [(events, times)])
+
+    def combine_all(self: T, events_times: Iterable[Tuple[IntegerEvents, int]]) -> T:
+        """
+        combine with several events at once. the partial products are merged pairwise in a balanced
+        tree. see `dicetables.tools.mergeplanner`.
+
+        :param events_times: [(events, times), ...] times=int>=0
+        """
+        events_times = list(events_times)
+        dictionary = combine_all_events(self.events_view(), events_times)
+        return self._from_combined(dictionary, events_times)
 
     def combine_by_flattened_list(self: T, events: IntegerEvents, times: int = 1) -> T:
         """
@@ -50,20 +192,43 @@ class AdditiveEvents(IntegerEvents):
         :WARNING - UNSAFE METHOD: len(flattened_list) = total occurrences of events.
             if this list is too big, it will raise MemoryError or OverflowError
         """
-        dictionary = DictCombiner(self.get_dict()).combine_by_flattened_list(
-            events.get_dict(), times
+        dictionary = DictCombiner(self.events_view()).combine_by_flattened_list(
+            events.events_view(), times
         )
-        return EventsFactory.from_dictionary(self, dictionary)
+        return self._from_combined(dictionary, [(events, times)])
 
     def combine_by_dictionary(self: T, events: IntegerEvents, times: int = 1) -> T:
-        dictionary = DictCombiner(self.get_dict()).combine_by_dictionary(events.get_dict(), times)
-        return EventsFactory.from_dictionary(self, dictionary)
+        dictionary = DictCombiner(self.events_view()).combine_by_dictionary(
+            events.events_view(), times
+        )
+        return self._from_combined(dictionary, [(events, times)])
 
     def combine_by_indexed_values(self: T, events: IntegerEvents, times: int = 1) -> T:
-        dictionary = DictCombiner(self.get_dict()).combine_by_indexed_values(
-            events.get_dict(), times
+        dictionary = DictCombiner(self.events_view()).combine_by_indexed_values(
+            events.events_view(), times
         )
-        return EventsFactory.from_dictionary(self, dictionary)
+        return self._from_combined(dictionary, [(events, times)])
+
+    def combine_by_squaring(self: T, events: IntegerEvents, times: int = 1) -> T:
+        dictionary = DictCombiner(self.events_view()).combine_by_squaring(
+            events.events_view(), times
+        )
+        return self._from_combined(dictionary, [(events, times)])
+
+    def combine_by_packed_int(self: T, events: IntegerEvents, times: int = 1) -> T:
+        dictionary = DictCombiner(self.events_view()).combine_by_packed_int(
+            events.events_view(), times
+        )
+        return self._from_combined(dictionary, [(events, times)])
+
+    def combine_by_numpy(self: T, events: IntegerEvents, times: int = 1) -> T:
+        """
+
+        numpy is optional.  If it is not installed, or the answer might overflow a numpy int,
+        this uses `combine_by_packed_int`.
+        """
+        dictionary = DictCombiner(self.events_view()).combine_by_numpy(events.events_view(), times)
+        return self._from_combined(dictionary, [(events, times)])
 
     def remove(self: T, events: IntegerEvents, times: int = 1) -> T:
         """
@@ -71,5 +236,5 @@ class AdditiveEvents(IntegerEvents):
         :WARNING - UNSAFE METHOD: There is no record of what you added to an AdditiveEvents.
             If you remove what you haven't added, no error will be raised, but you will have bugs.
         """
-        dictionary = DictCombiner(self.get_dict()).remove_by_tuple_list(events.get_dict(), times)
+        dictionary = DictCombiner(self.events_view()).remove_by_fastest(events.events_view(), times)
         return EventsFactory.from_dictionary(self, dictionary)
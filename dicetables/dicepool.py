@@ -1,16 +1,22 @@
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Tuple
 
+from dicetables.dieevents import Interned
 from dicetables.eventsbases.protodie import ProtoDie
-from dicetables.tools.orderedcombinations import ordered_combinations_of_events
+from dicetables.tools.orderedcombinations import (
+    iter_face_counts_of_events,
+    iter_ordered_combinations_of_events,
+    ordered_combinations_of_events,
+)
 
 
-class DicePool(object):
+class DicePool(object, metaclass=Interned):
     def __init__(self, input_die: ProtoDie, pool_size: int):
         if pool_size < 1:
             raise ValueError("Minimum DicePool size is 1")
         self._input_die = input_die
         self._pool_size = pool_size
-        self._rolls = ordered_combinations_of_events(input_die, pool_size)
+        self._rolls = None
 
     @property
     def die(self) -> ProtoDie:
@@ -22,7 +28,39 @@ class DicePool(object):
 
     @property
     def rolls(self) -> Dict[Tuple[int, ...], int]:
-        return self._rolls.copy()
+        """
+        {sorted roll: occurrences}. every roll is listed the first time this is called, which can be
+        very expensive. the dice pool collections do not use it.
+        """
+        return dict(self.rolls_view())
+
+    def rolls_view(self, workers: int = 1) -> Mapping[Tuple[int, ...], int]:
+        """
+        a read-only `rolls` with no copy. the rolls are listed once and stored on the pool, so every
+        collection and every caller of the same pool shares them.
+
+        :param workers: int >= 1. the number of processes that list the rolls if they are not stored
+            yet. see `dicetables.tools.orderedcombinations.ordered_combinations_of_events`.
+        """
+        if self._rolls is None:
+            self._rolls = ordered_combinations_of_events(self._input_die, self._pool_size, workers)
+        return MappingProxyType(self._rolls)
+
+    def iter_rolls(self) -> Iterator[Tuple[Tuple[int, ...], int]]:
+        """
+        (sorted roll, occurrences) in sorted order. iterates the stored rolls if they were listed.
+        otherwise, makes each roll as it goes and stores nothing.
+        """
+        if self._rolls is not None:
+            return iter(self._rolls.items())
+        return iter_ordered_combinations_of_events(self._input_die, self._pool_size)
+
+    def iter_face_counts(self) -> Iterator[Tuple[Tuple[int, ...], int]]:
+        """
+        (counts, occurrences) in the same order as `iter_rolls`. counts[index] is how many dice rolled
+        the index-th lowest face of `die`. nothing is stored.
+        """
+        return iter_face_counts_of_events(self._input_die, self._pool_size)
 
     def __eq__(self, other):
         if not isinstance(other, DicePool):
@@ -1,16 +1,20 @@
-from typing import Dict
+from functools import partial
+from typing import Dict, Iterable, List, Mapping, Tuple
 
-from dicetables.dieevents import ProtoDie
+from dicetables.dieevents import Interned, ProtoDie, get_intern_table
 from dicetables.dicepool import DicePool
+from dicetables.tools.orderstatistics import get_many_selected_sums, get_selected_sums
 
 
-class DicePoolCollection(ProtoDie):
+class DicePoolCollection(ProtoDie, metaclass=Interned):
     """
     The abstract class for all DicePoolCollection objects. A DicePoolCollection creates a new die by selecting from a
     DicePool. Select determines how many rolls are selected from the pool of total rolls.
     Different implementations determine which particular rolls to select.
     """
 
+    __slots__ = ("_dice_pool", "_select")
+
     def __init__(self, pool: DicePool, select: int):
         """
 
@@ -21,12 +25,18 @@ class DicePoolCollection(ProtoDie):
         if select > self._dice_pool.size:
             raise ValueError("you cannot select more dice than the pool_size.")
         self._select = select
-        self._dict = self._generate_dict()
         super(DicePoolCollection, self).__init__()
 
     def _generate_dict(self):
         raise NotImplementedError
 
+    def _create_dict(self):
+        return self._generate_dict()
+
+    def _get_selected_sums(self, selected_indices):
+        pool = self._dice_pool
+        return get_selected_sums(pool.die.events_view(), pool.size, selected_indices)
+
     def get_pool(self) -> DicePool:
         return self._dice_pool
 
@@ -34,7 +44,7 @@ class DicePoolCollection(ProtoDie):
         return self._select
 
     def get_dict(self) -> Dict[int, int]:
-        return self._dict.copy()
+        return self._events.copy()
 
     def get_size(self) -> int:
         return self._dice_pool.die.get_size() * self._select
@@ -66,14 +76,15 @@ class BestOfDicePool(DicePoolCollection):
     BestOfDicePool(DicePool(Die(6), 4), 3) is the best 3 rolls from four six-sided dice.
     """
 
+    __slots__ = ()
+
     def __init__(self, pool: DicePool, select: int):
         super().__init__(pool, select)
 
     def _generate_dict(self):
-        ordered_combinations = self._dice_pool.rolls
         start_at = self._dice_pool.size - self._select
         stop_before = self._dice_pool.size
-        return generate_events_dict(ordered_combinations, start_at, stop_before)
+        return self._get_selected_sums(range(start_at, stop_before))
 
 
 class WorstOfDicePool(DicePoolCollection):
@@ -82,14 +93,15 @@ class WorstOfDicePool(DicePoolCollection):
     WorstOfDicePool(DicePool(Die(6), 4), 3) is the worst 3 rolls from four six-sided dice.
     """
 
+    __slots__ = ()
+
     def __init__(self, pool: DicePool, select: int):
         super().__init__(pool, select)
 
     def _generate_dict(self):
-        ordered_combinations = self._dice_pool.rolls
         start_at = 0
         stop_before = self._select
-        return generate_events_dict(ordered_combinations, start_at, stop_before)
+        return self._get_selected_sums(range(start_at, stop_before))
 
 
 class UpperMidOfDicePool(DicePoolCollection):
@@ -101,15 +113,16 @@ class UpperMidOfDicePool(DicePoolCollection):
     (1, 1, 2, 3, 4), select=3 takes (1, 2, 3) and select=2 takes (2, 3).
     """
 
+    __slots__ = ()
+
     def __init__(self, pool: DicePool, select: int):
         super().__init__(pool, select)
 
     def _generate_dict(self):
-        ordered_combinations = self._dice_pool.rolls
         end_slice, extra = divmod(self._dice_pool.size - self._select, 2)
         start_at = end_slice + extra
         stop_before = self._dice_pool.size - end_slice
-        return generate_events_dict(ordered_combinations, start_at, stop_before)
+        return self._get_selected_sums(range(start_at, stop_before))
 
 
 class LowerMidOfDicePool(DicePoolCollection):
@@ -121,20 +134,123 @@ class LowerMidOfDicePool(DicePoolCollection):
     (1, 1, 2, 3, 4), select=3 takes (1, 2, 3) and select=2 takes (1, 2).
     """
 
+    __slots__ = ()
+
     def __init__(self, pool: DicePool, select: int):
         super().__init__(pool, select)
 
     def _generate_dict(self):
-        ordered_combinations = self._dice_pool.rolls
         end_slice, extra = divmod(self._dice_pool.size - self._select, 2)
         start_at = end_slice
         stop_before = self._dice_pool.size - (end_slice + extra)
-        return generate_events_dict(ordered_combinations, start_at, stop_before)
+        return self._get_selected_sums(range(start_at, stop_before))
+
+
+class SelectedOfDicePool(DicePoolCollection):
+    """
+    Take the rolls at any positions of the sorted rolls of a DicePool of [pool_size] * [input_die].
+    0 is the lowest roll and -1 is the highest.
+    SelectedOfDicePool(DicePool(Die(6), 5), (-1, -3, -5)) is the 1st, 3rd and 5th highest rolls from
+    five six-sided dice. It is stored as the positions from the lowest: (0, 2, 4).
+    """
+
+    __slots__ = ("_selected",)
+
+    def __init__(self, pool: DicePool, selected: Iterable[int]):
+        """
+
+        :param pool: the dice pool to select from
+        :param selected: positions in the sorted roll, -pool.size <= position < pool.size.
+            repeats are ignored.
+        """
+        self._selected = get_positions(pool.size, selected)
+        super().__init__(pool, len(self._selected))
+
+    @classmethod
+    def _get_intern_args(cls, pool: DicePool, selected: Iterable[int]):
+        """the intern key uses the positions from `get_positions`, the same as `from_selections`"""
+        return (pool, get_positions(pool.size, selected)), {}
+
+    @classmethod
+    def from_selections(
+        cls, pool: DicePool, selections: Iterable[Iterable[int]]
+    ) -> List["SelectedOfDicePool"]:
+        """
+        a SelectedOfDicePool for every selection, all worked out in one pass.
+        see `dicetables.tools.orderstatistics.get_many_selected_sums`.
+        """
+        all_selected = [get_positions(pool.size, selected) for selected in selections]
+        all_events = get_many_selected_sums(pool.die.events_view(), pool.size, all_selected)
+        intern_table = get_intern_table()
+        answer = []
+        for selected, events in zip(all_selected, all_events):
+            make = partial(cls._from_events, pool, selected, events)
+            if intern_table is None:
+                answer.append(make())
+            else:
+                answer.append(intern_table.get_instance(cls, (pool, selected), {}, make))
+        return answer
+
+    @classmethod
+    def _from_events(
+        cls, pool: DicePool, selected: Tuple[int, ...], events: Dict[int, int]
+    ) -> "SelectedOfDicePool":
+        """
+        :param selected: positions from `get_positions`
+        :param events: the events of `selected`. they are not made again.
+        """
+        die = cls.__new__(cls)
+        die._selected = selected
+        die._dice_pool = pool
+        die._select = len(selected)
+        ProtoDie.__init__(die, events)
+        return die
+
+    def _generate_dict(self):
+        return self._get_selected_sums(self._selected)
+
+    def get_selected(self) -> Tuple[int, ...]:
+        """:return: the selected positions from the lowest roll. 0 is the lowest."""
+        return self._selected
+
+    def __str__(self):
+        return "Selected {} of {}".format(
+            self._selected, self._dice_pool.die.multiply_str(self._dice_pool.size)
+        )
+
+    def __repr__(self):
+        return "{}({!r}, {})".format(self.__class__.__name__, self._dice_pool, self._selected)
+
+
+def get_positions(pool_size: int, selected: Iterable[int]) -> Tuple[int, ...]:
+    """
+
+    :return: sorted positions from 0 with no repeats. a negative position counts from pool_size.
+    :raises: ValueError for a position outside -pool_size <= position < pool_size
+    """
+    positions = set()
+    for position in selected:
+        if not -pool_size <= position < pool_size:
+            raise ValueError(
+                "selected positions must be from {} to {}. got: {}".format(
+                    -pool_size, pool_size - 1, position
+                )
+            )
+        positions.add(position % pool_size)
+    return tuple(sorted(positions))
 
 
 def generate_events_dict(ordered_combinations, start_at, stop_before) -> Dict[int, int]:
+    """
+    sums `key[start_at:stop_before]` of every key in `DicePool.rolls`. the collections use
+    `dicetables.tools.orderstatistics.get_selected_sums`, which does not list the rolls.
+
+    :param ordered_combinations: `DicePool.rolls`, `DicePool.rolls_view()` or `DicePool.iter_rolls()`
+    """
+    if isinstance(ordered_combinations, Mapping):
+        ordered_combinations = ordered_combinations.items()
     master_dict = {}
-    for key, val in ordered_combinations.items():
+    for key, val in ordered_combinations:
         master_key = sum(key[start_at:stop_before])
         master_dict[master_key] = master_dict.get(master_key, 0) + val
     return master_dict
@@ -2,7 +2,8 @@
 An immutable record of dice added to and removed from DiceTable
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 from dicetables.eventsbases.eventerrors import DiceRecordError
 from dicetables.eventsbases.protodie import ProtoDie
@@ -42,6 +43,7 @@ class DiceRecord(object):
         RecordVerifier.check_types(dice_number_dict)
         RecordVerifier.check_negative(dice_number_dict)
         self._record = scrub_zeroes(dice_number_dict)
+        self._hash = None
 
     @classmethod
     def new(cls) -> "DiceRecord":
@@ -50,6 +52,10 @@ class DiceRecord(object):
     def get_dict(self) -> Dict[ProtoDie, int]:
         return self._record.copy()
 
+    def record_view(self) -> Mapping[ProtoDie, int]:
+        """:return: a read-only {die: number} with no copy"""
+        return MappingProxyType(self._record)
+
     def get_number(self, query_die: ProtoDie) -> int:
         return self._record.get(query_die, 0)
 
@@ -68,10 +74,15 @@ class DiceRecord(object):
     def __eq__(self, other):
         if not isinstance(other, DiceRecord):
             return False
-        return self.get_dict() == other.get_dict()
+        return self._record == other._record
 
     def __ne__(self, other):
         return not self == other
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._record.items()))
+        return self._hash
+
     def __repr__(self):
         return "DiceRecord({!r})".format(self._record)
@@ -2,7 +2,7 @@
 DiceTable and DetailedDiceTable compute combination of Die events
 """
 
-from typing import TypeVar
+from typing import Mapping, Type, TypeVar
 
 from dicetables import DiceRecord
 from dicetables.additiveevents import AdditiveEvents
@@ -10,6 +10,8 @@ from dicetables.eventsbases.protodie import ProtoDie
 from dicetables.eventsinfo import EventsCalculations, EventsInformation
 from dicetables.factory.eventsfactory import EventsFactory
 from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.powercache import combine_all_events, combine_events
+from dicetables.tools.tablecache import get_table_cache
 
 T = TypeVar("T", bound="DiceTable")
 
@@ -17,8 +19,15 @@ T = TypeVar("T", bound="DiceTable")
 class DiceTable(AdditiveEvents):
     def __init__(self, events_dict: dict, dice_record: DiceRecord):
         self._record = dice_record
+        self._matches_record = False
         super(DiceTable, self).__init__(events_dict)
 
+    @classmethod
+    def new(cls: Type[T]) -> T:
+        new_table = super(DiceTable, cls).new()
+        new_table._matches_record = True
+        return new_table
+
     def dice_data(self) -> DiceRecord:
         return self._record
 
@@ -27,7 +36,7 @@ class DiceTable(AdditiveEvents):
 
         :return: sorted copy of dice list: [(die, number of dice), ...]
         """
-        return sorted(self._record.get_dict().items())
+        return sorted(self._record.record_view().items())
 
     def number_of_dice(self, query_die: ProtoDie) -> int:
         return self._record.get_number(query_die)
@@ -57,10 +66,52 @@ class DiceTable(AdditiveEvents):
         :param die: any subclass of ProtoDie: Die, ModDie, WeightedDie, ModWeightedDie, Modifier,
             StrongDie, Exploding, ExplodingOn
         :param times: int>= 0
+
+        if the table cache is on and this table was made from `DiceTable.new()`, the events come from
+        the cache. see `dicetables.tools.tablecache`.
         """
         dice_data = self._record.add_die(die, times)
-        dictionary = DictCombiner(self.get_dict()).combine_by_fastest(die.get_dict(), times)
-        return EventsFactory.from_dictionary_and_dice(self, dictionary, dice_data)
+        table_cache = get_table_cache()
+        if table_cache is None or not self._matches_record:
+            dictionary = combine_events(self.events_view(), die, times)
+        else:
+            dictionary = table_cache.get_events(dice_data)
+        new_table = EventsFactory.from_dictionary_and_dice(
+            self, dictionary, dice_data, trusted=True
+        )
+        new_table._matches_record = self._matches_record
+        new_table._pending_power_sums = self._get_pending_power_sums([(die, times)])
+        return new_table
+
+    def add_dice(self: T, dice: Mapping[ProtoDie, int]) -> T:
+        """
+        add several kinds of dice and make only one new table. the powers of the dice and this table
+        are merged pairwise in a balanced tree. see `dicetables.tools.mergeplanner`.
+
+        :param dice: {die: times, ...} times=int>=0
+        """
+        dice_data = self._record
+        for die, times in dice.items():
+            dice_data = dice_data.add_die(die, times)
+        table_cache = get_table_cache()
+        if table_cache is None or not self._matches_record:
+            dictionary = combine_all_events(self.events_view(), dice.items())
+        else:
+            dictionary = table_cache.get_events(dice_data)
+        new_table = EventsFactory.from_dictionary_and_dice(
+            self, dictionary, dice_data, trusted=True
+        )
+        new_table._matches_record = self._matches_record
+        new_table._pending_power_sums = self._get_pending_power_sums(dice.items())
+        return new_table
+
+    @classmethod
+    def from_record(cls: Type[T], dice_record: DiceRecord) -> T:
+        """
+
+        :return: a new table with all the dice in `dice_record`
+        """
+        return cls.new().add_dice(dice_record.record_view())
 
     def remove_die(self: T, die: ProtoDie, times=1) -> T:
         """
@@ -68,10 +119,28 @@ class DiceTable(AdditiveEvents):
         :param die: any subclass of ProtoDie: Die, ModDie, WeightedDie, ModWeightedDie, Modifier,
             StrongDie, Exploding, ExplodingOn
         :param times: 0 <= int <= number of "die" in table
+
+        only events from the table cache are trusted. a table made with events that do not match its
+        record can divide into nonsense, so the answer is verified. the cache is only used by tables
+        made from `DiceTable.new()`.
+        the power sums are carried along. see `dicetables.tools.moments`.
         """
         dice_data = self._record.remove_die(die, times)
-        dictionary = DictCombiner(self.get_dict()).remove_by_tuple_list(die.get_dict(), times)
-        return EventsFactory.from_dictionary_and_dice(self, dictionary, dice_data)
+        table_cache = get_table_cache()
+        dictionary = None
+        if table_cache is not None and self._matches_record:
+            dictionary = table_cache.get_cached_events(dice_data)
+        trusted = dictionary is not None
+        if dictionary is None:
+            dictionary = DictCombiner(self.events_view()).remove_by_fastest(
+                die.events_view(), times
+            )
+        new_table = EventsFactory.from_dictionary_and_dice(
+            self, dictionary, dice_data, trusted=trusted
+        )
+        new_table._matches_record = self._matches_record
+        new_table._pending_power_sums = self._get_pending_power_sums([(die, times)], remove=True)
+        return new_table
 
     def __eq__(self, other):
         return super(DiceTable, self).__eq__(other) and self.dice_data() == other.dice_data()
@@ -107,9 +176,13 @@ class DetailedDiceTable(DiceTable):
 
         :return: a new DetailedDiceTable with the `calc_includes_zeroes` boolean switched
         """
-        return EventsFactory.from_params(
-            self, {"calc_includes_zeroes": not self.calc_includes_zeroes}
+        new_table = EventsFactory.from_params(
+            self, {"calc_includes_zeroes": not self.calc_includes_zeroes}, trusted=True
         )
+        new_table._power_sums = self._power_sums
+        new_table._pending_power_sums = self._pending_power_sums
+        new_table._matches_record = self._matches_record
+        return new_table
 
     def __eq__(self, other):
         return (
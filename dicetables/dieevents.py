@@ -1,20 +1,148 @@
 """
 All the descendants of ProtoDie.  These are IntegerEvents that represent different types of dice.
+
+There is an optional intern table so that equal dice made anywhere are the same instance.  It is off
+by default.  Turn it on with :code:`set_intern_table(InternTable())` and off with
+:code:`set_intern_table(None)`.
 """
 
+import inspect
 import itertools
-from typing import Dict, Iterable, Tuple
+import threading
+import weakref
+from collections import namedtuple
+from functools import partial
+from typing import Dict, Iterable, Optional, Tuple
 
 from dicetables.eventsbases.protodie import ProtoDie
 
+InternInfo = namedtuple("InternInfo", ["hits", "misses", "entries"])
+
+
+class InternTable(object):
+    """
+    a weak-value table of {(class, args, kwargs): instance}. an instance is removed when nothing else
+    refers to it.
+    """
+
+    def __init__(self):
+        self._instances = weakref.WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_instance(self, cls, args: tuple, kwargs: dict, make=None):
+        """
+
+        :param make: a function of no arguments that makes the instance. None is
+            cls(*args, **kwargs).
+        :return: the interned instance of cls(*args, **kwargs). it is made and added if it is not in the
+            table. if the args cannot be made into a key, this returns a new instance.
+        """
+        if make is None:
+            make = partial(type.__call__, cls, *args, **kwargs)
+        key = get_intern_key(cls, args, kwargs)
+        if key is None:
+            return make()
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._hits += 1
+                return instance
+            self._misses += 1
+        instance = make()
+        with self._lock:
+            return self._instances.setdefault(key, instance)
+
+    def clear(self) -> None:
+        """empties the table and resets the counters."""
+        with self._lock:
+            self._instances.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def intern_info(self) -> InternInfo:
+        with self._lock:
+            return InternInfo(hits=self._hits, misses=self._misses, entries=len(self._instances))
+
+
+def get_intern_key(cls, args: tuple, kwargs: dict) -> Optional[tuple]:
+    """
+
+    :return: a hashable key of the class and the exact args (with their types) or None
+    """
+    try:
+        key = (cls, tuple(map(_make_key, args)), _make_key(kwargs) if kwargs else None)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _make_key(value):
+    value_type = type(value)
+    if value_type is tuple or value_type is list:
+        return value_type, tuple(map(_make_key, value))
+    if value_type is dict:
+        return dict, tuple(sorted((_make_key(key), _make_key(val)) for key, val in value.items()))
+    return value_type, value
+
+
+_intern_table = None
+
+
+def get_intern_table() -> Optional[InternTable]:
+    """:return: the table that the dice use or None if interning is off."""
+    return _intern_table
+
+
+def set_intern_table(intern_table: Optional[InternTable]) -> None:
+    """:param intern_table: an InternTable to turn interning on. None to turn it off."""
+    global _intern_table
+    _intern_table = intern_table
+
+
+class Interned(type):
+    """
+    the metaclass of the dice (and DicePool). when the intern table is on, making an instance gets it
+    from the table.
+    """
+
+    _signatures = weakref.WeakKeyDictionary()
+
+    def __call__(cls, *args, **kwargs):
+        if _intern_table is None:
+            return super(Interned, cls).__call__(*args, **kwargs)
+        args, kwargs = cls._get_intern_args(*args, **kwargs)
+        return _intern_table.get_instance(cls, args, kwargs)
 
-class Modifier(ProtoDie):
+    def _get_intern_args(cls, *args, **kwargs):
+        """
+        :return: (args, kwargs) to make and intern the instance with. a class overrides this (with a
+            classmethod) so that different args for the same instance share one key.
+        """
+        return args, kwargs
+
+    @property
+    def __signature__(cls):
+        """the signature of __init__ without self, so that `inspect.signature` and Parser still work"""
+        signature = Interned._signatures.get(cls)
+        if signature is None:
+            init_signature = inspect.signature(cls.__init__)
+            parameters = list(init_signature.parameters.values())[1:]
+            signature = Interned._signatures[cls] = init_signature.replace(parameters=parameters)
+        return signature
+
+
+class Modifier(ProtoDie, metaclass=Interned):
     """
     stores and returns info for a modifier to add to the final die roll.
     :code:`Modifier(-3)` rolls -3 and only -3. A Modifier's size and weight are
     always 0.
     """
 
+    __slots__ = ("_mod",)
+
     def __init__(self, modifier: int):
         self._mod = modifier
         super(Modifier, self).__init__()
@@ -28,9 +156,12 @@ class Modifier(ProtoDie):
     def get_weight(self):
         return 0
 
-    def get_dict(self):
+    def _create_dict(self):
         return {self._mod: 1}
 
+    def get_dict(self) -> Dict[int, int]:
+        return self._events.copy()
+
     def weight_info(self):
         return str(self)
 
@@ -44,12 +175,14 @@ class Modifier(ProtoDie):
         return "Modifier({})".format(self._mod)
 
 
-class Die(ProtoDie):
+class Die(ProtoDie, metaclass=Interned):
     """
     stores and returns info for a basic Die.
     :code:`Die(4)` rolls 1, 2, 3, 4 with equal weight
     """
 
+    __slots__ = ("_die_size",)
+
     def __init__(self, die_size: int):
         """
 
@@ -64,9 +197,12 @@ class Die(ProtoDie):
     def get_weight(self):
         return 0
 
-    def get_dict(self) -> Dict[int, int]:
+    def _create_dict(self):
         return dict.fromkeys(range(1, self._die_size + 1), 1)
 
+    def get_dict(self) -> Dict[int, int]:
+        return self._events.copy()
+
     def weight_info(self):
         return "{}\n    No weights".format(self)
 
@@ -87,6 +223,8 @@ class ModDie(Die):
     :code:`ModDie(4, -1)` rolls 0, 1, 2, 3 with equal weight
     """
 
+    __slots__ = ("_mod",)
+
     def __init__(self, die_size: int, modifier: int):
         """
 
@@ -99,7 +237,7 @@ class ModDie(Die):
     def get_modifier(self) -> int:
         return self._mod
 
-    def get_dict(self) -> Dict[int, int]:
+    def _create_dict(self):
         return dict.fromkeys(range(1 + self._mod, self.get_size() + 1 + self._mod), 1)
 
     def multiply_str(self, number):
@@ -112,12 +250,14 @@ class ModDie(Die):
         return "ModDie({}, {})".format(self.get_size(), self._mod)
 
 
-class WeightedDie(ProtoDie):
+class WeightedDie(ProtoDie, metaclass=Interned):
     """
     stores and returns info for die with different chances for different rolls.
     :code:`WeightedDie({1:1, 2:5})` rolls 1 once for every five times that 2 is rolled.
     """
 
+    __slots__ = ("_raw_dic",)
+
     def __init__(self, dictionary_input: Dict[int, int]):
         """
 
@@ -149,9 +289,12 @@ class WeightedDie(ProtoDie):
     def get_weight(self):
         return sum(self._raw_dic.values())
 
-    def get_dict(self) -> Dict[int, int]:
+    def _create_dict(self):
         return {key: value for key, value in self._raw_dic.items() if value}
 
+    def get_dict(self) -> Dict[int, int]:
+        return self._events.copy()
+
     def weight_info(self):
         max_roll_str_len = len(str(self.get_size()))
         out = str(self) + "\n"
@@ -179,6 +322,8 @@ class ModWeightedDie(WeightedDie):
     rolls 0 once for every five times that 2 is rolled.
     """
 
+    __slots__ = ("_mod",)
+
     def __init__(self, dictionary_input: Dict[int, int], modifier: int):
         """
 
@@ -192,8 +337,8 @@ class ModWeightedDie(WeightedDie):
     def get_modifier(self) -> int:
         return self._mod
 
-    def get_dict(self):
-        return {roll + self._mod: weight for roll, weight in self.get_raw_dict().items() if weight}
+    def _create_dict(self):
+        return {roll + self._mod: weight for roll, weight in self._raw_dic.items() if weight}
 
     def multiply_str(self, number):
         return "{}D{}{:+}  W:{}".format(
@@ -207,7 +352,7 @@ class ModWeightedDie(WeightedDie):
         return "ModWeightedDie({}, {})".format(self.get_raw_dict(), self._mod)
 
 
-class StrongDie(ProtoDie):
+class StrongDie(ProtoDie, metaclass=Interned):
     """
     stores and returns info for a stronger version of another die (including
     StrongDie if you're feeling especially silly).
@@ -215,6 +360,8 @@ class StrongDie(ProtoDie):
     :code:`StrongDie(ModDie(3, -1), 2)` rolls (1-1)*2, (2-1)*2, (3-1)*2 with equal weight.
     """
 
+    __slots__ = ("_multiplier", "_original")
+
     def __init__(self, input_die: ProtoDie, multiplier: int):
         """
 
@@ -238,11 +385,14 @@ class StrongDie(ProtoDie):
         """returns an instance of the original die"""
         return self._original
 
-    def get_dict(self) -> Dict[int, int]:
+    def _create_dict(self):
         return {
-            roll * self._multiplier: weight for roll, weight in self._original.get_dict().items()
+            roll * self._multiplier: weight for roll, weight in self._original.events_view().items()
         }
 
+    def get_dict(self) -> Dict[int, int]:
+        return self._events.copy()
+
     def weight_info(self):
         return self._original.weight_info().replace(str(self._original), str(self))
 
@@ -256,7 +406,7 @@ class StrongDie(ProtoDie):
         return "StrongDie({!r}, {})".format(self._original, self._multiplier)
 
 
-class Exploding(ProtoDie):
+class Exploding(ProtoDie, metaclass=Interned):
     """
     Stores and returns info for an exploding version of another die.
     Each time the highest number is rolled, you
@@ -273,6 +423,8 @@ class Exploding(ProtoDie):
     instantiation VERY slow. The time is proportional to explosions and die_size.
     """
 
+    __slots__ = ("_original", "_explosions")
+
     def __init__(self, input_die: ProtoDie, explosions: int = 2):
         """
 
@@ -282,7 +434,6 @@ class Exploding(ProtoDie):
         self._original = input_die
         self._explosions = explosions
         self._raise_error_for_negative_explosions()
-        self._dict = self._get_exploding_dict()
         super(Exploding, self).__init__()
 
     def _raise_error_for_negative_explosions(self):
@@ -290,7 +441,7 @@ class Exploding(ProtoDie):
             raise ValueError('"explosions" must be >=0.')
 
     def _get_exploding_dict(self):
-        base_dict = self._original.get_dict()
+        base_dict = self._original.events_view()
 
         new_dict = {}
         for explosion_level in range(self._explosions + 1):
@@ -328,8 +479,11 @@ class Exploding(ProtoDie):
         """returns an instance of the original die"""
         return self._original
 
+    def _create_dict(self):
+        return self._get_exploding_dict()
+
     def get_dict(self) -> Dict[int, int]:
-        return self._dict.copy()
+        return self._events.copy()
 
     def weight_info(self):
         return "{}\nExploding adds weight: 1".format(
@@ -346,7 +500,7 @@ class Exploding(ProtoDie):
         return "Exploding({!r}, {})".format(self._original, self._explosions)
 
 
-class ExplodingOn(ProtoDie):
+class ExplodingOn(ProtoDie, metaclass=Interned):
     """
     Stores and returns info for an exploding version of another die.
     Each time the values in (explodes_on) are rolled, the die continues to roll,
@@ -364,6 +518,8 @@ class ExplodingOn(ProtoDie):
     with size which gets overshadowed by the first factor.
     """
 
+    __slots__ = ("_explodes_on", "_explosions", "_original")
+
     def __init__(self, input_die: ProtoDie, explodes_on: Iterable[int], explosions: int = 2):
         """
 
@@ -376,11 +532,10 @@ class ExplodingOn(ProtoDie):
         self._original = input_die
         self._raise_error_for_bad_explodes_on()
         self._raise_error_for_negative_explosions()
-        self._dict = self._get_exploding_dict()
         super(ExplodingOn, self).__init__()
 
     def _raise_error_for_bad_explodes_on(self):
-        base_dict = self._original.get_dict()
+        base_dict = self._original.events_view()
         if any(key not in base_dict for key in self._explodes_on):
             raise ValueError('"explodes_on" value not present in input_die.get_dict()')
 
@@ -389,7 +544,7 @@ class ExplodingOn(ProtoDie):
             raise ValueError('"explosions" value must be >= 0.')
 
     def _get_exploding_dict(self):
-        base_dict = self._original.get_dict()
+        base_dict = self._original.events_view()
         answer = {}
         for level in range(self._explosions + 1):
             roll_and_weight_modifiers = self._get_roll_and_weight_mods(level, base_dict)
@@ -445,8 +600,11 @@ class ExplodingOn(ProtoDie):
         """returns an instance of the original die"""
         return self._original
 
+    def _create_dict(self):
+        return self._get_exploding_dict()
+
     def get_dict(self) -> Dict[int, int]:
-        return self._dict.copy()
+        return self._events.copy()
 
     def weight_info(self):
         base_weight_info = self._original.weight_info().replace(str(self._original), str(self))
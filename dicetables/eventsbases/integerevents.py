@@ -1,10 +1,68 @@
 """
 The abstract class for sets of events that can be represented by integers.
+
+Events that the library makes from a known-good dictionary (the result of a combine, add_die,
+remove_die, ...) are trusted and skip verification.  EventsFactory passes them to the constructor
+wrapped in `TrustedEvents`.  To verify everything anyway (for testing), call
+:code:`set_always_verify(True)` or set the environment variable DICETABLES_ALWAYS_VERIFY=1.
 """
 
-from typing import Dict
+import os
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 from dicetables.eventsbases.eventerrors import InvalidEventsError
+from dicetables.tools.moments import PowerSums, get_power_sums
+
+ALWAYS_VERIFY_ENV_VARIABLE = "DICETABLES_ALWAYS_VERIFY"
+
+_always_verify = os.environ.get(ALWAYS_VERIFY_ENV_VARIABLE, "") not in ("", "0")
+
+
+def get_always_verify() -> bool:
+    return _always_verify
+
+
+def set_always_verify(always_verify: bool) -> None:
+    """:param always_verify: True means trusted events are verified as well."""
+    global _always_verify
+    _always_verify = always_verify
+
+
+class TrustedEvents(Mapping):
+    """
+    a valid {int: int>0} (or IndexedValues) that nothing else will mutate. EventsFactory wraps
+    trusted events in it and passes it to the constructor in place of the events dict. AdditiveEvents
+    unwraps it and skips verification.
+
+    the `__init__` of a subclass gets this read-only mapping. passing it on to the parent `__init__`
+    unchanged keeps it trusted. `copy()` is a plain dict, the same as `dict.copy`, and a new dict
+    passed to the parent is verified.
+    """
+
+    __slots__ = ("events",)
+
+    def __init__(self, events):
+        self.events = events
+
+    def __getitem__(self, key):
+        return self.events[key]
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def copy(self) -> Dict[int, int]:
+        return dict(self)
+
+
+def unwrap_trusted(events) -> Tuple[object, bool]:
+    """:return: (events in the TrustedEvents, True unless always verify is on) or (events, False)"""
+    if isinstance(events, TrustedEvents):
+        return events.events, not _always_verify
+    return events, False
 
 
 class EventsVerifier(object):
@@ -23,14 +81,34 @@ class EventsVerifier(object):
         if any(occurrence <= 0 for occurrence in events_dict.values()):
             raise InvalidEventsError("no negative or zero occurrences in Events.get_dict()")
 
+    def verify_indexed_values(self, indexed_values):
+        """
+
+        :param indexed_values: IndexedValues with nonzero values at both ends
+        :raises: InvalidEventsError
+        """
+        values = indexed_values.raw_values
+        if not self.is_all_ints(values):
+            raise InvalidEventsError("all values must be ints")
+        if values[0] <= 0 or values[-1] <= 0 or any(occurrence < 0 for occurrence in values):
+            raise InvalidEventsError("no negative or zero occurrences in Events.get_dict()")
+
     @staticmethod
     def is_all_ints(iterable):
         return all(isinstance(value, int) for value in iterable)
 
 
 class IntegerEvents(object):
-    def __init__(self):
+    __slots__ = ()
+
+    def __init__(self, verify: bool = True):
+        """:param verify: False skips `_verify_events`. only for events that are known to be good."""
         super(IntegerEvents, self).__init__()
+        if verify:
+            self._verify_events()
+
+    def _verify_events(self):
+        """:raises: InvalidEventsError"""
         EventsVerifier().verify_get_dict(self.get_dict())
 
     def get_dict(self) -> Dict[int, int]:
@@ -45,8 +123,24 @@ class IntegerEvents(object):
             )
         )
 
+    def events_view(self) -> Mapping[int, int]:
+        """
+
+        :return: a read-only {event: occurrences}. events that store their dict return it without
+            copying. the default wraps get_dict().
+        """
+        return MappingProxyType(self.get_dict())
+
+    def get_power_sums(self) -> PowerSums:
+        """
+
+        :return: exact (total, sum of occurrences * event ** k for k = 1 to 4). see
+            `dicetables.tools.moments`. immutable events cache it.
+        """
+        return get_power_sums(self.events_view().items())
+
     def __eq__(self, other):
-        return type(self) is type(other) and self.get_dict() == other.get_dict()
+        return type(self) is type(other) and self.events_view() == other.events_view()
 
     def __ne__(self, other):
         return not self == other
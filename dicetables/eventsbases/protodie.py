@@ -2,7 +2,11 @@
 The abstract class for any die represented by a set of events
 """
 
-from dicetables.eventsbases.integerevents import IntegerEvents
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from dicetables.eventsbases.integerevents import EventsVerifier, IntegerEvents
+from dicetables.tools.moments import PowerSums, get_power_sums
 
 
 class ProtoDie(IntegerEvents):
@@ -18,11 +22,36 @@ class ProtoDie(IntegerEvents):
     - get_dict() - returns: {int: int > 0}
     - __repr__
     - __str__
+
+    dice are immutable. get_dict() is called once at init and stored. see `events_view`.
+    the sort key, hash and power sums are made once, the first time they are needed.
     """
 
-    def __init__(self):
+    __slots__ = ("_events", "_sort_key", "_hash", "_power_sums", "__weakref__")
+
+    def __init__(self, events: Optional[Dict[int, int]] = None):
+        """:param events: events that were already made. None calls `_create_dict`."""
+        self._events = self._create_dict() if events is None else events
+        self._sort_key = None
+        self._hash = None
+        self._power_sums = None
         super(ProtoDie, self).__init__()
 
+    def _create_dict(self) -> Dict[int, int]:
+        """called once at init. the dice in this library make their dict here and copy it in get_dict."""
+        return self.get_dict()
+
+    def _verify_events(self):
+        EventsVerifier().verify_get_dict(self._events)
+
+    def events_view(self) -> Mapping[int, int]:
+        return MappingProxyType(self._events)
+
+    def get_power_sums(self) -> PowerSums:
+        if self._power_sums is None:
+            self._power_sums = get_power_sums(self._events.items())
+        return self._power_sums
+
     def get_size(self) -> int:
         raise NotImplementedError
 
@@ -47,27 +76,47 @@ class ProtoDie(IntegerEvents):
     def __repr__(self):
         raise NotImplementedError
 
-    def __hash__(self):
-        return hash(
-            "hash of {!r}, {}, {}, {}".format(
-                self, self.get_size(), self.get_weight(), self.get_dict()
+    def get_sort_key(self) -> Tuple[int, int, Tuple[Tuple[int, int], ...], str]:
+        """
+
+        :return: (size, weight, sorted events, repr). dice sort and compare by this.
+        """
+        if self._sort_key is None:
+            self._sort_key = (
+                self.get_size(),
+                self.get_weight(),
+                tuple(sorted(self._events.items())),
+                repr(self),
             )
-        )
+        return self._sort_key
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.get_sort_key())
+        return self._hash
+
+    def __getstate__(self):
+        """the hash of a str changes between processes, so the cached hash is not pickled."""
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name != "__weakref__" and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state["_hash"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def __lt__(self, other):
-        return (self.get_size(), self.get_weight(), sorted(self.get_dict().items()), repr(self)) < (
-            other.get_size(),
-            other.get_weight(),
-            sorted(other.get_dict().items()),
-            repr(other),
-        )
+        return self.get_sort_key() < other.get_sort_key()
 
     def __eq__(self, other):
-        return super(ProtoDie, self).__eq__(other) and (
-            self.get_size(),
-            self.get_weight(),
-            repr(self),
-        ) == (other.get_size(), other.get_weight(), repr(other))
+        if self is other:
+            return True
+        return type(self) is type(other) and self.get_sort_key() == other.get_sort_key()
 
     def __le__(self, other):
         return self < other or self == other
@@ -4,6 +4,7 @@ A factory class for creating instances of AdditiveEvent and its descendants.
 
 from dicetables.dicerecord import DiceRecord
 from dicetables.eventsbases.eventerrors import InvalidEventsError, DiceRecordError
+from dicetables.eventsbases.integerevents import TrustedEvents
 from dicetables.factory.errorhandler import EventsFactoryErrorHandler
 from dicetables.factory.factorytools import StaticDict, Getter
 from dicetables.factory.warninghandler import EventsFactoryWarningHandler
@@ -117,23 +118,34 @@ class EventsFactory(object):
                 EventsFactoryWarningHandler(cls).raise_warning("CHECK", events_class)
 
     @classmethod
-    def from_dictionary(cls, events, dictionary):
+    def from_dictionary(cls, events, dictionary, trusted=False):
+        """
+        :param trusted: True means `dictionary` is a valid {int: int>0} that nothing else will mutate.
+            the new events skip verification. see `dicetables.eventsbases.integerevents`.
+        """
         passed_in_values = {"get_dict": dictionary}
-        return cls._construct_from(events, passed_in_values)
+        return cls._construct_from(events, passed_in_values, trusted)
 
     @classmethod
-    def from_dictionary_and_dice(cls, events, dictionary, dice):
+    def from_dictionary_and_dice(cls, events, dictionary, dice, trusted=False):
+        """:param trusted: see `from_dictionary`"""
         passed_in_values = {"get_dict": dictionary, "dice_data": dice}
-        return cls._construct_from(events, passed_in_values)
+        return cls._construct_from(events, passed_in_values, trusted)
 
     @classmethod
-    def from_params(cls, events, name_value_param_dict):
-        return cls._construct_from(events, name_value_param_dict)
+    def from_params(cls, events, name_value_param_dict, trusted=False):
+        """:param trusted: see `from_dictionary`"""
+        return cls._construct_from(events, name_value_param_dict, trusted)
 
     @classmethod
-    def _construct_from(cls, events, passed_in_values):
+    def _construct_from(cls, events, passed_in_values, trusted=False):
         constructor_class = events.__class__
         factory_class = cls._get_nearest_factory_class(constructor_class)
+        if trusted:
+            passed_in_values = dict(passed_in_values)
+            if "get_dict" not in passed_in_values:
+                passed_in_values["get_dict"] = cls._getters.get("get_dict").get_from(events)
+            passed_in_values["get_dict"] = TrustedEvents(passed_in_values["get_dict"])
         args = cls._get_args(events, factory_class, passed_in_values)
         return cls._construct(constructor_class, factory_class, args)
 
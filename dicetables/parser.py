@@ -7,6 +7,7 @@ from dicetables.dicepool_collection import (
     WorstOfDicePool,
     UpperMidOfDicePool,
     LowerMidOfDicePool,
+    SelectedOfDicePool,
 )
 from dicetables.dicepool import DicePool
 from dicetables.dieevents import (
@@ -62,6 +63,7 @@ class Parser(object):
             WorstOfDicePool,
             UpperMidOfDicePool,
             LowerMidOfDicePool,
+            SelectedOfDicePool,
             DicePool,
         }
         self._param_types = {
@@ -83,7 +85,7 @@ class Parser(object):
     ) -> "Parser":
         """
         Creates a parser with a functioning limit checker from `dicetables.tools.limit_checker.LimitChecker`
-        For explanation of how or why to change `max_dice_pool_combinations_per_dict_size`, and
+        For explanation of how or why to change `max_dice_pool_steps`, `max_dice_pool_size` and
         `max_dice_pool_calls`, see
         `Parser <http://dice-tables.readthedocs.io/en/latest/implementation_details/parser.html#limits-and-dicepool-objects>`_
 
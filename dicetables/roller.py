@@ -11,7 +11,7 @@ class Roller(object):
         :param events: any IntegerEvents
         :param random_generator: any instance of random.Random. defaults to python default random instance
         """
-        self._alias_table = AliasTable(events.get_dict())
+        self._alias_table = AliasTable(events.events_view())
         self._random_generator = random_generator
         if not self._random_generator:
             self._random_generator = random.Random()
@@ -0,0 +1,99 @@
+"""
+the byte-budgeted LRU cache that PowerCache and TableCache are built on.
+
+Entries are kept in an OrderedDict from least to most recently used.  Each entry remembers its size in
+bytes, and the least recently used entries are evicted whenever the total goes over the budget.
+"""
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Mapping
+
+DEFAULT_MAX_BYTES = 2**25
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "entries", "current_bytes", "max_bytes"]
+)
+
+
+class ByteBudgetCache(object):
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+
+        :param max_bytes: int >= 0. 0 means nothing is stored.
+        """
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _get_value(self, key):
+        """
+        call with the lock held. a found key becomes the most recently used and counts as a hit.
+        misses are counted by the caller.
+
+        :return: the stored value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _store(self, key, value, size: int) -> None:
+        """does nothing if `key` is already stored or `size` is over the whole budget."""
+        with self._lock:
+            if size > self._max_bytes or key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+            self._evict_to(self._max_bytes)
+
+    def _evict_to(self, max_bytes):
+        while self._current_bytes > max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._current_bytes -= size
+            self._evictions += 1
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """evicts the least recently used entries until the cache fits the new budget."""
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict_to(max_bytes)
+
+    def clear(self) -> None:
+        """empties the cache and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._reset_counters()
+
+    def _reset_counters(self):
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def cache_info(self):
+        with self._lock:
+            return self._make_info()
+
+    def _make_info(self):
+        """call with the lock held."""
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            current_bytes=self._current_bytes,
+            max_bytes=self._max_bytes,
+        )
+
+
+def get_size_in_bytes(events: Mapping[int, int]) -> int:
+    """:return: the bytes of the stored occurrences. one sys.getsizeof per event."""
+    return sum(sys.getsizeof(value) for value in events.values())
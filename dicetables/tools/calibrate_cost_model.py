@@ -0,0 +1,170 @@
+"""
+re-calibrates the cost model that DictCombiner uses to pick the fastest combine method.
+
+run with :code:`python -m dicetables.tools.calibrate_cost_model` (or :code:`dicetables-calibrate`).
+it times every method on a grid of sample problems, fits the coefficients of the cost model and writes
+them to the calibration file.  the new model is used the next time dicetables is imported.
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from dicetables.tools.cost_model import (
+    WORK_ESTIMATES,
+    CostModel,
+    get_calibration_path,
+    get_combine_features,
+)
+from dicetables.tools.dictcombiner import DictCombiner
+
+MIN_TIMING_SECONDS = 0.005
+TIMING_REPEATS = 3
+
+
+def get_sample_problems() -> List[Tuple[dict, dict, int]]:
+    """:return: [(main dict, input dict, times), ...] spanning the crossovers between methods"""
+    six_sided = {value: 1 for value in range(1, 7)}
+    main_dicts = [{0: 1}] + [
+        DictCombiner({0: 1}).combine_by_packed_int(six_sided, times) for times in (3, 30, 120)
+    ]
+    input_dicts = [
+        {1: 1, 2: 1},
+        six_sided,
+        {value: 1 for value in range(1, 21)},
+        {value: 1 for value in range(1, 101)},
+        {value: value for value in range(1, 7)},
+        {1: 2**80, 2: 3**50, 3: 1},
+    ]
+    all_times = (1, 3, 10, 40)
+    return [
+        (main_dict, input_dict, times)
+        for main_dict in main_dicts
+        for input_dict in input_dicts
+        for times in all_times
+    ]
+
+
+def time_call(function: Callable, *args) -> float:
+    """:return: best time in seconds of one call"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_TIMING_SECONDS:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(TIMING_REPEATS - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def fit_coefficients(work_and_seconds: Sequence[Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    least squares fit of seconds = overhead + per_unit * work, minimizing the relative error.
+
+    :param work_and_seconds: [(work, seconds>0), ...] may not be empty
+    :return: (overhead>=0, per_unit>=0)
+    """
+    inverse = [1.0 / seconds for _, seconds in work_and_seconds]
+    scaled_work = [work / seconds for work, seconds in work_and_seconds]
+    uu = sum(value * value for value in inverse)
+    uv = sum(left * right for left, right in zip(inverse, scaled_work))
+    vv = sum(value * value for value in scaled_work)
+    u_total = sum(inverse)
+    v_total = sum(scaled_work)
+
+    determinant = uu * vv - uv * uv
+    if determinant > 0:
+        overhead = (u_total * vv - v_total * uv) / determinant
+        per_unit = (v_total * uu - u_total * uv) / determinant
+        if overhead >= 0 and per_unit >= 0:
+            return overhead, per_unit
+    overhead_only = (u_total / uu, 0.0)
+    per_unit_only = (0.0, v_total / vv if vv else 0.0)
+    return min(
+        overhead_only, per_unit_only, key=lambda pair: _relative_error(pair, work_and_seconds)
+    )
+
+
+def _relative_error(coefficients, work_and_seconds):
+    overhead, per_unit = coefficients
+    return sum(
+        ((overhead + per_unit * work) / seconds - 1) ** 2 for work, seconds in work_and_seconds
+    )
+
+
+def calibrate(
+    methods: Optional[Sequence[str]] = None,
+    problems: Optional[Sequence[Tuple[dict, dict, int]]] = None,
+    max_predicted_seconds: float = 0.1,
+) -> CostModel:
+    """
+    :param methods: defaults to every method in WORK_ESTIMATES
+    :param problems: [(main dict, input dict, times), ...] defaults to `get_sample_problems()`
+    :param max_predicted_seconds: problems that the default model predicts will take longer than
+        this are skipped.
+    :return: a CostModel. methods without any usable problems keep their default coefficients.
+    """
+    if methods is None:
+        methods = list(WORK_ESTIMATES.keys())
+    if problems is None:
+        problems = get_sample_problems()
+    default_model = CostModel.default()
+    measurements = {method: [] for method in methods}
+    for main_dict, input_dict, times in problems:
+        features = get_combine_features(main_dict, input_dict, times)
+        usable = DictCombiner(main_dict).get_usable_combine_methods(input_dict, times)
+        for method in methods:
+            if method not in usable:
+                continue
+            if default_model.predict(method, features) > max_predicted_seconds:
+                continue
+            combiner = DictCombiner(main_dict)
+            seconds = time_call(getattr(combiner, "combine_by_" + method), input_dict, times)
+            measurements[method].append((WORK_ESTIMATES[method](features), seconds))
+
+    coefficients = {
+        method: fit_coefficients(work_and_seconds)
+        for method, work_and_seconds in measurements.items()
+        if work_and_seconds
+    }
+    return CostModel(coefficients)
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="time the DictCombiner methods on this machine and save a cost model."
+    )
+    parser.add_argument(
+        "--output",
+        default=get_calibration_path(),
+        help="where to write the calibration file. default: %(default)s",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=0.1,
+        help="skip sample problems predicted to take longer than this. default: %(default)s",
+    )
+    parsed = parser.parse_args(args)
+
+    model = calibrate(max_predicted_seconds=parsed.max_seconds)
+    directory = os.path.dirname(os.path.abspath(parsed.output))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    model.save(parsed.output)
+    for method, (overhead, per_unit) in sorted(model.get_coefficients().items()):
+        print("{:<15} overhead: {:.3e}  per unit: {:.3e}".format(method, overhead, per_unit))
+    print("saved to {}".format(parsed.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+A cost model that predicts how long each DictCombiner method takes to combine two dictionaries.
+
+Every method has a work estimate computed from `CombineFeatures`.  The predicted time of a method is
+`overhead + per_unit * work`.  The coefficients depend on the machine, so they can be re-calibrated
+with :code:`python -m dicetables.tools.calibrate_cost_model`.  That writes a calibration file which
+is loaded when this module is imported.
+
+The calibration file is at `get_calibration_path()`.  Set the environment variable
+DICETABLES_COST_MODEL to use a different file.
+"""
+
+import json
+import os
+import warnings
+from collections import namedtuple
+from math import isfinite
+from typing import Dict, Iterable, Tuple
+
+CALIBRATION_ENV_VARIABLE = "DICETABLES_COST_MODEL"
+
+CombineFeatures = namedtuple(
+    "CombineFeatures",
+    [
+        "main_size",
+        "main_span",
+        "input_size",
+        "input_span",
+        "total_occurrences",
+        "times",
+        "max_bits",
+    ],
+)
+"""
+- main_size, input_size: number of events in the dictionaries
+- main_span, input_span: max(dictionary) - min(dictionary) + 1
+- total_occurrences: total occurrences of the dictionary being combined
+- times: how many times it is combined
+- max_bits: all occurrences in the answer are < 2 ** max_bits
+"""
+
+
+def get_combine_features(main_dict: dict, input_dict: dict, times: int) -> CombineFeatures:
+    """
+    :main_dict: {int: int>0, ...}
+    :input_dict: {int: int>0, ...}
+    """
+    times = max(times, 0)
+    total_occurrences = sum(input_dict.values())
+    max_bits = sum(main_dict.values()).bit_length() + times * total_occurrences.bit_length()
+    return CombineFeatures(
+        main_size=len(main_dict),
+        main_span=max(main_dict) - min(main_dict) + 1,
+        input_size=len(input_dict),
+        input_span=max(input_dict) - min(input_dict) + 1,
+        total_occurrences=total_occurrences,
+        times=times,
+        max_bits=max_bits,
+    )
+
+
+def _average_value_digits(features):
+    """python ints use 30-bit digits. values grow from small to max_bits over the combination."""
+    return 1 + features.max_bits / 60
+
+
+def _sequential_pairs(features, main_uses_span, inner_loop_size):
+    """
+    number of (event, new_event) pairs when combining one copy at a time.
+    after k copies, an array is main_span + k * (input_span - 1) long and a dict has at most
+    main_size * (number of multisets of k input events) events.
+    """
+    growth = features.input_span - 1
+    final_span = features.main_span + features.times * growth
+    main_size = features.main_span if main_uses_span else features.main_size
+    if features.input_size == 1:
+        return features.times * inner_loop_size * main_size
+    multisets = 1
+    pairs = 0
+    for copies in range(features.times):
+        full_size = features.main_span + copies * growth
+        if main_uses_span or main_size * multisets >= final_span:
+            remaining = features.times - copies
+            average_size = full_size + (remaining - 1) * growth / 2
+            return pairs + remaining * inner_loop_size * average_size
+        pairs += inner_loop_size * min(main_size * multisets, full_size)
+        multisets = multisets * (copies + features.input_size) // (copies + 1)
+    return pairs
+
+
+def _final_power_span(features):
+    return features.times * (features.input_span - 1) + 1
+
+
+def dictionary_work(features: CombineFeatures) -> float:
+    pairs = _sequential_pairs(features, False, features.input_size)
+    return pairs * _average_value_digits(features)
+
+
+def flattened_list_work(features: CombineFeatures) -> float:
+    pairs = _sequential_pairs(features, False, features.total_occurrences)
+    return pairs * _average_value_digits(features)
+
+
+def indexed_values_work(features: CombineFeatures) -> float:
+    pairs = _sequential_pairs(features, True, features.input_size)
+    return (pairs + features.times * features.input_size * features.input_span) * (
+        _average_value_digits(features)
+    )
+
+
+def squaring_work(features: CombineFeatures) -> float:
+    power_span = _final_power_span(features)
+    pairs = power_span**2 / 2 + features.main_span * power_span
+    return pairs * _average_value_digits(features)
+
+
+def packed_int_work(features: CombineFeatures) -> float:
+    """karatsuba multiplication of the packed ints plus packing and unpacking."""
+    slot_digits = 1 + features.max_bits / 30
+    power_digits = _final_power_span(features) * slot_digits
+    main_digits = features.main_span * slot_digits
+    bigger, smaller = max(power_digits, main_digits), min(power_digits, main_digits)
+    return power_digits**1.585 + bigger * smaller**0.585 + bigger + smaller
+
+
+def numpy_work(features: CombineFeatures) -> float:
+    pairs = _sequential_pairs(features, True, features.input_span)
+    return pairs + features.main_span + _final_power_span(features)
+
+
+WORK_ESTIMATES = {
+    "dictionary": dictionary_work,
+    "flattened_list": flattened_list_work,
+    "indexed_values": indexed_values_work,
+    "squaring": squaring_work,
+    "packed_int": packed_int_work,
+    "numpy": numpy_work,
+}
+
+DEFAULT_COEFFICIENTS = {
+    "dictionary": (5.0e-06, 4.0e-08),
+    "flattened_list": (6.4e-06, 7.4e-08),
+    "indexed_values": (3.0e-05, 3.1e-08),
+    "squaring": (2.1e-05, 4.1e-08),
+    "packed_int": (4.2e-05, 1.2e-08),
+    "numpy": (2.5e-05, 5.2e-09),
+}
+"""{method: (overhead in seconds, seconds per unit of work)}"""
+
+
+class CostModel(object):
+    def __init__(self, coefficients: Dict[str, Tuple[float, float]]):
+        """
+
+        :param coefficients: {method: (overhead, per_unit), ...} for any of the keys in WORK_ESTIMATES.
+            methods without coefficients use DEFAULT_COEFFICIENTS.
+        """
+        unknown = set(coefficients.keys()) - set(WORK_ESTIMATES.keys())
+        if unknown:
+            raise ValueError("unknown methods: {}".format(sorted(unknown)))
+        self._coefficients = DEFAULT_COEFFICIENTS.copy()
+        for method, (overhead, per_unit) in coefficients.items():
+            self._coefficients[method] = (float(overhead), float(per_unit))
+
+    @classmethod
+    def default(cls) -> "CostModel":
+        return cls({})
+
+    def get_coefficients(self) -> Dict[str, Tuple[float, float]]:
+        return self._coefficients.copy()
+
+    def predict(self, method: str, features: CombineFeatures) -> float:
+        """:return: predicted time in seconds"""
+        overhead, per_unit = self._coefficients[method]
+        return overhead + per_unit * WORK_ESTIMATES[method](features)
+
+    def get_fastest(self, features: CombineFeatures, methods: Iterable[str]) -> str:
+        """
+        :param methods: may not be empty. ties go to the first method.
+        """
+        return min(methods, key=lambda method: self.predict(method, features))
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {key: list(value) for key, value in self._coefficients.items()}, file, indent=2
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "CostModel":
+        """
+        :raises: ValueError if the file is not {method: [overhead, per_unit], ...} with finite,
+            non-negative numbers for methods in WORK_ESTIMATES.
+        """
+        with open(path) as file:
+            raw = json.load(file)
+        if not isinstance(raw, dict):
+            raise ValueError("cost model must be a JSON object. got: {!r}".format(raw))
+        coefficients = {}
+        for method, value in raw.items():
+            if method not in WORK_ESTIMATES:
+                raise ValueError("unknown method: {!r}".format(method))
+            if not isinstance(value, list) or len(value) != 2 or not all(map(_is_cost, value)):
+                raise ValueError(
+                    "{!r} must be [overhead, per_unit] >= 0. got: {!r}".format(method, value)
+                )
+            coefficients[method] = tuple(value)
+        return cls(coefficients)
+
+    def __eq__(self, other):
+        return isinstance(other, CostModel) and self._coefficients == other._coefficients
+
+    def __repr__(self):
+        return "CostModel({!r})".format(self._coefficients)
+
+
+def _is_cost(value) -> bool:
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and isfinite(value)
+        and value >= 0
+    )
+
+
+def get_calibration_path() -> str:
+    default_path = os.path.join(os.path.expanduser("~"), ".dicetables", "cost_model.json")
+    return os.environ.get(CALIBRATION_ENV_VARIABLE, default_path)
+
+
+def load_cost_model() -> CostModel:
+    """
+    :return: the model in the calibration file, or the default model if there is no file.
+    """
+    path = get_calibration_path()
+    if not os.path.exists(path):
+        return CostModel.default()
+    try:
+        return CostModel.load(path)
+    except (ValueError, TypeError, KeyError, OSError) as error:
+        warnings.warn(
+            "could not load cost model from {}: {!r}. using defaults.".format(path, error)
+        )
+        return CostModel.default()
+
+
+_cost_model = load_cost_model()
+
+
+def get_cost_model() -> CostModel:
+    return _cost_model
+
+
+def set_cost_model(cost_model: CostModel) -> None:
+    global _cost_model
+    _cost_model = cost_model
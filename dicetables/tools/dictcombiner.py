@@ -5,7 +5,8 @@ the "get_dict()" method.
 THIS IS A SPECIFIC TOOL. IT HAS SEVERAL IMPORTANT CONSTRAINTS. USE WITH CAUTION.
 
 if you mutate the __init__ dictionary elsewhere, IT WILL AFFECT IT HERE. (but it will
-not mutate any dictionaries passed to it.)
+not mutate any dictionaries passed to it.) so read-only views work as well as dicts. an
+IndexedValuesView is used without building a new IndexedValues.
     this class is for speed, so there is minimal copying. it is specifically
     designed to be instantiated once, used and then immediately discarded.
 
@@ -14,7 +15,17 @@ not mutate any dictionaries passed to it.)
 :variable - dictionary: {int: int>0, ...}
 """
 
-from dicetables.tools.indexedvalues import generate_indexed_values_from_dict
+from heapq import heapify, heappop, heappush
+
+from dicetables.tools import cost_model, numpy_backend
+from dicetables.tools.indexedvalues import (
+    IndexedValues,
+    convolve_by_packed_int,
+    generate_indexed_values_from_dict,
+)
+
+SAFE_LIMIT_FLATTENED_LIST_LEN = 10**4
+SMALL_COMBINE_WORK = 32
 
 
 class DictCombiner(object):
@@ -71,6 +82,65 @@ class DictCombiner(object):
             new_indexed_values = new_indexed_values.combine_with_dictionary(dictionary)
         return new_indexed_values.get_dict()
 
+    def combine_by_squaring(self, dictionary: dict, times: int) -> dict:
+        """
+        builds the `times`-fold combination of `dictionary` by repeated squaring and
+        then combines it with the DictCombiner once.
+
+        :dictionary: {int: int>0, ...}
+        """
+        if times <= 0:
+            return self.get_dict()
+        to_combine = generate_indexed_values_from_dict(dictionary).power(times)
+        new_indexed_values = generate_indexed_values_from_dict(self._dict)
+        return new_indexed_values.combine_with_indexed_values(to_combine).get_dict()
+
+    def combine_by_packed_int(self, dictionary: dict, times: int) -> dict:
+        """
+        same as `combine_by_squaring`, but every convolution is done by packing the values into
+        large ints and multiplying them.
+
+        :dictionary: {int: int>0, ...}
+        """
+        if times <= 0:
+            return self.get_dict()
+        to_combine = generate_indexed_values_from_dict(dictionary).power(
+            times, convolve_by_packed_int
+        )
+        new_indexed_values = generate_indexed_values_from_dict(self._dict)
+        return new_indexed_values.combine_with_indexed_values(
+            to_combine, convolve_by_packed_int
+        ).get_dict()
+
+    def combine_by_numpy(self, dictionary: dict, times: int) -> dict:
+        """
+        uses numpy.convolve if numpy is installed and the answer is guaranteed to fit in a numpy int.
+        otherwise it falls back to `combine_by_packed_int`.
+
+        :dictionary: {int: int>0, ...}
+        """
+        dtype = numpy_backend.get_safe_dtype(self._get_max_bits(dictionary, times))
+        if times <= 0 or dtype is None:
+            return self.combine_by_packed_int(dictionary, times)
+        base = generate_indexed_values_from_dict(self._dict)
+        to_combine = generate_indexed_values_from_dict(dictionary)
+        new_values = numpy_backend.convolve_many_times(
+            base.raw_values, to_combine.raw_values, times, dtype
+        )
+        new_start_index = base.start_index + times * to_combine.start_index
+        return IndexedValues(new_start_index, new_values).get_dict()
+
+    def _get_max_bits(self, dictionary, times):
+        """all occurrences of the combined dictionary are < 2 ** max_bits"""
+        main_bits = sum(self._dict.values()).bit_length()
+        to_combine_bits = sum(dictionary.values()).bit_length()
+        return main_bits + times * to_combine_bits
+
+    def _can_use_numpy(self, dictionary, times):
+        if not is_dense(self._dict) or not is_dense(dictionary):
+            return False
+        return numpy_backend.get_safe_dtype(self._get_max_bits(dictionary, times)) is not None
+
     def combine_by_fastest(self, dictionary: dict, times: int) -> dict:
         """
         :dictionary: {int: int>0, ...}
@@ -79,6 +149,9 @@ class DictCombiner(object):
             "dictionary": self.combine_by_dictionary,
             "flattened_list": self.combine_by_flattened_list,
             "indexed_values": self.combine_by_indexed_values,
+            "squaring": self.combine_by_squaring,
+            "packed_int": self.combine_by_packed_int,
+            "numpy": self.combine_by_numpy,
         }
         method = self.get_fastest_combine_method(dictionary, times)
 
@@ -86,36 +159,65 @@ class DictCombiner(object):
 
     def get_fastest_combine_method(self, dictionary, times):
         """
+        the usable method that the current cost model predicts is fastest.
+        see `dicetables.tools.cost_model`. when there are fewer than `SMALL_COMBINE_WORK`
+        (event, new_event) pairs, asking the cost model costs more than the combination, so this
+        is "dictionary".
+
         :dictionary: {int: int>0, ...}
         """
-        first_comparison = self._compare_tuple_list_with_flattened_list(dictionary)
-        second_comparison = self._compare_with_indexed_values(first_comparison, times, dictionary)
-        return second_comparison
+        if len(self._dict) * len(dictionary) * times < SMALL_COMBINE_WORK:
+            return "dictionary"
+        features = cost_model.get_combine_features(self._dict, dictionary, times)
+        methods = self.get_usable_combine_methods(dictionary, times)
+        return cost_model.get_cost_model().get_fastest(features, methods)
 
-    @staticmethod
-    def _compare_tuple_list_with_flattened_list(dictionary):
-        max_occurrences_to_events_ratio_for_flattened_list = 1.3
-        safe_limit_flattened_list_len = 10**4
-        total_occurrences = sum(dictionary.values())
+    def get_usable_combine_methods(self, dictionary, times):
+        """
+        "flattened_list" is only usable when the flattened list is small enough. "numpy" is only
+        usable when numpy is installed, the dictionaries are not sparse and the answer fits in a
+        numpy int.
 
-        if total_occurrences >= safe_limit_flattened_list_len:
-            return "dictionary"
+        :dictionary: {int: int>0, ...}
+        """
+        methods = ["dictionary", "indexed_values", "squaring", "packed_int"]
+        if sum(dictionary.values()) < SAFE_LIMIT_FLATTENED_LIST_LEN:
+            methods.append("flattened_list")
+        if self._can_use_numpy(dictionary, times):
+            methods.append("numpy")
+        return methods
+
+    def remove_by_indexed_values(self, dictionary: dict, times: int) -> dict:
+        """
+        exact polynomial division. see `IndexedValues.remove_indexed_values`
 
-        occurrences_to_events_ratio = float(total_occurrences) / len(dictionary)
-        if occurrences_to_events_ratio > max_occurrences_to_events_ratio_for_flattened_list:
-            return "dictionary"
-        return "flattened_list"
+        :dictionary: {int: int>0, ...} MUST have been combined at least `times` times.
+        """
+        to_remove = generate_indexed_values_from_dict(dictionary)
+        new_indexed_values = generate_indexed_values_from_dict(self._dict)
+        return new_indexed_values.remove_indexed_values(to_remove, times).get_dict()
 
-    def _compare_with_indexed_values(self, first_method, times, dictionary):
-        size_of_dict_to_combine = len(dictionary)
-        min_size_for_indexed_values = get_indexed_values_min(
-            first_method, size_of_dict_to_combine, times
-        )
-        size_of_main_dict = len(self._dict)
-        if size_of_main_dict < min_size_for_indexed_values:
-            return first_method
-        else:
-            return "indexed_values"
+    def remove_by_dictionary(self, dictionary: dict, times: int) -> dict:
+        """
+        exact polynomial division that only visits events, never the span between them, so sparse
+        events are not made dense. O(answer size * dictionary size) for every copy removed.
+
+        :dictionary: {int: int>0, ...} MUST have been combined at least `times` times.
+        """
+        answer = self._dict
+        for _ in range(times):
+            answer = remove_once_by_dictionary(answer, dictionary)
+        return dict(answer)
+
+    def remove_by_fastest(self, dictionary: dict, times: int) -> dict:
+        """
+        `remove_by_indexed_values` for dense events and `remove_by_dictionary` for sparse events.
+
+        :dictionary: {int: int>0, ...} MUST have been combined at least `times` times.
+        """
+        if is_dense(self._dict):
+            return self.remove_by_indexed_values(dictionary, times)
+        return self.remove_by_dictionary(dictionary, times)
 
     def remove_by_tuple_list(self, dictionary, times):
         """
@@ -161,6 +263,39 @@ class DictCombiner(object):
         return freq_at_new_event
 
 
+def remove_once_by_dictionary(dictionary, to_remove):
+    """
+    long division from the lowest event. the lowest remaining event of `dictionary` can only come
+    from the lowest event of `to_remove`, which gives the next event of the answer.
+
+    :return: {int: int} `dictionary` divided by `to_remove`
+    """
+    to_remove_items = sorted(to_remove.items())
+    lowest_event, lowest_occurrences = to_remove_items[0]
+    max_answer_event = max(dictionary) - to_remove_items[-1][0]
+    remainder = dict(dictionary)
+    events = list(remainder)
+    heapify(events)
+    answer = {}
+    while events:
+        event = heappop(events)
+        occurrences = remainder.pop(event)
+        new_event = event - lowest_event
+        if new_event > max_answer_event:
+            break
+        if not occurrences:
+            continue
+        new_occurrences = occurrences // lowest_occurrences
+        answer[new_event] = new_occurrences
+        for removed_event, removed_occurrences in to_remove_items[1:]:
+            target = new_event + removed_event
+            if target not in remainder:
+                remainder[target] = 0
+                heappush(events, target)
+            remainder[target] -= new_occurrences * removed_occurrences
+    return answer
+
+
 def flatten_events_tuples(dictionary):
     flattened_list = []
     for event, freq in dictionary.items():
@@ -168,47 +303,12 @@ def flatten_events_tuples(dictionary):
     return flattened_list
 
 
-def get_indexed_values_min(first_method, size_of_dict_to_combine, combine_times):
+def is_dense(dictionary):
     """
-    {'first method': {size of input dict: {combine times: size of Dictcombiner.get_dict(), ...}, ...}, ... }
+    True if a list from min(dictionary) to max(dictionary) would not be mostly zeroes.
 
-    :first_method: 'flattened_list', 'dictionary'
+    :dictionary: {int: int>0, ...}
     """
-    choices = {
-        "flattened_list": {
-            2: {10: 200, 20: 100, 100: 50, 500: 1},
-            4: {2: 100, 5: 50, 10: 10, 20: 1},
-            6: {1: 100, 4: 50, 10: 1},
-            8: {1: 100, 3: 50, 5: 10, 10: 1},
-            20: {1: 50, 3: 10, 4: 1},
-            50: {1: 50, 3: 1},
-            100: {1: 100, 2: 1},
-        },
-        "dictionary": {
-            2: {10: 100, 50: 50, 100: 1},
-            4: {2: 100, 10: 50, 50: 1},
-            6: {2: 50, 10: 10, 20: 1},
-            8: {1: 100, 3: 50, 10: 1},
-            10: {1: 100, 3: 50, 5: 1},
-            20: {1: 50, 3: 10, 4: 1},
-            50: {1: 50, 2: 10, 3: 1},
-            100: {1: 100, 2: 1},
-        },
-    }
-    keys_are_input_dict_size = choices[first_method]
-
-    closest_dict_size = get_best_key(size_of_dict_to_combine, keys_are_input_dict_size)
-    keys_are_times = keys_are_input_dict_size[closest_dict_size]
-    closest_times = get_best_key(combine_times, keys_are_times)
-    min_size_for_indexed_values = keys_are_times[closest_times]
-    return min_size_for_indexed_values
-
-
-def get_best_key(value, dictionary):
-    sorted_keys = sorted(dictionary.keys())
-    best_key = sorted_keys[0]
-    for test in sorted_keys:
-        if value < test:
-            break
-        best_key = test
-    return best_key
+    max_span_to_size_ratio = 4
+    span = max(dictionary) - min(dictionary) + 1
+    return span <= max_span_to_size_ratio * len(dictionary)
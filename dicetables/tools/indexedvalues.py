@@ -3,6 +3,10 @@ tool for combining dictionaries.
 IndexedValues is a list with a start index.  It is for simulating dictionaries of {int: int>0}
 """
 
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+from itertools import accumulate, compress, count, repeat
+from operator import add, mul, sub
+
 
 def generate_indexed_values(sorted_tuple_list):
     """
@@ -18,9 +22,15 @@ def generate_indexed_values_from_dict(input_dict) -> "IndexedValues":
     """
 
     :param input_dict: may not be empty.\n
-        {int: int>0, ...}
+        {int: int>0, ...} or IndexedValuesView (its IndexedValues is returned without copying)
     """
-    return generate_indexed_values(sorted(input_dict.items()))
+    if isinstance(input_dict, IndexedValuesView):
+        return input_dict.indexed_values
+    start_val = min(input_dict)
+    values = [0] * (max(input_dict) - start_val + 1)
+    for index, value in input_dict.items():
+        values[index - start_val] = value
+    return IndexedValues(start_val, values)
 
 
 def make_start_index_and_list(sorted_tuple_list):
@@ -34,6 +44,8 @@ def make_start_index_and_list(sorted_tuple_list):
 
 
 class IndexedValues(object):
+    __slots__ = ("_start_index", "_values")
+
     def __init__(self, start_index, sorted_values):
         """
 
@@ -56,19 +68,46 @@ class IndexedValues(object):
 
     @property
     def index_range(self):
-        return self.start_index, len(self.raw_values) + self.start_index - 1
+        return self.start_index, len(self._values) + self.start_index - 1
 
     def get_dict(self):
         return {
-            index + self.start_index: value for index, value in enumerate(self.raw_values) if value
+            index: value for index, value in enumerate(self._values, self._start_index) if value
         }
 
+    def items(self):
+        """:return: [(index, value), ...] for every value that is not zero"""
+        return [
+            (index, value) for index, value in enumerate(self._values, self._start_index) if value
+        ]
+
+    def items_include_zeroes(self):
+        """:return: [(index, value), ...] for every value"""
+        return list(enumerate(self._values, self._start_index))
+
+    def get_total(self):
+        return sum(self._values)
+
     def get_value_at_key(self, key):
         index = key - self.start_index
-        if index < 0 or index >= len(self.raw_values):
+        if index < 0 or index >= len(self._values):
             return 0
         else:
-            return self.raw_values[index]
+            return self._values[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, IndexedValues):
+            return False
+        return self._start_index == other._start_index and self._values == other._values
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def view(self):
+        """:return: a read-only {index: value} mapping of the values that are not zero. no copy."""
+        return IndexedValuesView(self)
 
     def combine_with_dictionary(self, no_zero_values_dict):
         """
@@ -92,6 +131,280 @@ class IndexedValues(object):
         new_raw_values = list(map(add_many, *container_for_lists_to_combine))
         return IndexedValues(new_start_index, new_raw_values)
 
+    def combine_with_indexed_values(self, other, convolution=None):
+        """
+        :param other: IndexedValues
+        :param convolution: function(list, list) -> list. the exact convolution of two lists.
+            defaults to `convolve`
+        """
+        if convolution is None:
+            convolution = convolve
+        new_start_index = self.start_index + other.start_index
+        return IndexedValues(new_start_index, convolution(self._values, other._values))
+
+    def power(self, times, convolution=None):
+        """
+        combines IndexedValues with itself `times` times by repeated squaring.
+
+        :param times: int >= 0
+        :param convolution: see `combine_with_indexed_values`
+        :return: IndexedValues. if times == 0, returns the identity: IndexedValues(0, [1])
+        """
+        answer = IndexedValues(0, [1])
+        square = self
+        while times > 0:
+            if times % 2:
+                answer = answer.combine_with_indexed_values(square, convolution)
+            times //= 2
+            if times:
+                square = square.combine_with_indexed_values(square, convolution)
+        return answer
+
+    def remove_indexed_values(self, other, times=1):
+        """
+        the inverse of combining with `other` `times` times, by exact polynomial division.
+        if `other` is evenly spaced equal values (like a Die or a StrongDie), this is O(len) for
+        every copy removed. otherwise, `other.power(times)` is removed in one pass.
+
+        :param other: IndexedValues. it MUST have been combined with self at least `times` times.
+            otherwise, the answer is nonsense.
+        :param times: int >= 0
+        """
+        if times <= 0:
+            return IndexedValues(self.start_index, self._values)
+        new_start_index = self.start_index - times * other.start_index
+        step = get_uniform_step(other._values)
+        if step:
+            width = (len(other._values) - 1) // step + 1
+            new_values = self._values
+            for _ in range(times):
+                new_values = deconvolve_by_ones(new_values, width, step)
+            occurrences = other._values[0] ** times
+            if occurrences != 1:
+                new_values = [value // occurrences for value in new_values]
+            return IndexedValues(new_start_index, new_values)
+        divisor = other.power(times, convolve_by_packed_int)
+        return IndexedValues(new_start_index, deconvolve(self._values, divisor._values))
+
+
+class IndexedValuesView(Mapping):
+    """
+    a read-only {index: value} mapping of the nonzero values of an IndexedValues. it shares the list
+    of the IndexedValues, so making one is O(1). keys are in order.
+    """
+
+    __slots__ = ("_indexed_values", "_len")
+
+    def __init__(self, indexed_values: IndexedValues):
+        self._indexed_values = indexed_values
+        self._len = None
+
+    @property
+    def indexed_values(self) -> IndexedValues:
+        return self._indexed_values
+
+    def __getitem__(self, key):
+        values = self._indexed_values._values
+        index = key - self._indexed_values._start_index if isinstance(key, int) else -1
+        if 0 <= index < len(values) and values[index]:
+            return values[index]
+        raise KeyError(key)
+
+    def __iter__(self):
+        values = self._indexed_values._values
+        return compress(count(self._indexed_values._start_index), values)
+
+    def __len__(self):
+        if self._len is None:
+            values = self._indexed_values._values
+            self._len = len(values) - values.count(0)
+        return self._len
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def keys(self):
+        return _IndexedValuesKeys(self)
+
+    def values(self):
+        return _IndexedValuesValues(self)
+
+    def items(self):
+        return _IndexedValuesItems(self)
+
+    def copy(self):
+        """:return: a new dict"""
+        return self._indexed_values.get_dict()
+
+    def __eq__(self, other):
+        if isinstance(other, IndexedValuesView):
+            return self._indexed_values == other._indexed_values
+        return super(IndexedValuesView, self).__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "IndexedValuesView({!r})".format(self.copy())
+
+
+class _IndexedValuesKeys(KeysView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self._mapping)
+
+
+class _IndexedValuesValues(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return filter(None, self._mapping.indexed_values._values)
+
+
+class _IndexedValuesItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return zip(iter(self._mapping), filter(None, self._mapping.indexed_values._values))
+
+
+def get_uniform_step(values):
+    """
+    :param values: [int>=0, ...] values[0] != 0 and values[-1] != 0
+    :return: the distance between values if the values are equal and evenly spaced with zeroes
+        in between, else 0.  [3] -> 1, [2, 2, 2] -> 1, [1, 0, 0, 1] -> 3, [1, 2] -> 0
+    """
+    step = 1
+    while step < len(values) and not values[step]:
+        step += 1
+    evenly_spaced = values[::step]
+    if evenly_spaced.count(values[0]) != len(evenly_spaced):
+        return 0
+    if values.count(0) != len(values) - len(evenly_spaced):
+        return 0
+    return step
+
+
+def deconvolve(dividend, divisor):
+    """
+    exact synthetic division.  the inverse of `convolve`.
+
+    :param dividend: the convolution of `divisor` and some other list
+    :param divisor: may not be empty. divisor[0] != 0\n
+        [int>=0, ...]
+    :return: list of len(dividend) - len(divisor) + 1
+    """
+    max_terms_for_loop = 20
+    size = len(dividend) - len(divisor) + 1
+    leading_value = divisor[0]
+    terms = [(offset, value) for offset, value in enumerate(divisor) if offset and value]
+    if len(terms) <= max_terms_for_loop:
+        return _deconvolve_by_loop(dividend, leading_value, terms, size)
+
+    reversed_tail = divisor[:0:-1]
+    tail_size = len(reversed_tail)
+    quotient = []
+    for index in range(size):
+        if index >= tail_size:
+            overlap = sum(map(mul, quotient[index - tail_size :], reversed_tail))
+        elif index:
+            overlap = sum(map(mul, quotient, reversed_tail[-index:]))
+        else:
+            overlap = 0
+        quotient.append((dividend[index] - overlap) // leading_value)
+    return quotient
+
+
+def _deconvolve_by_loop(dividend, leading_value, terms, size):
+    """faster than summing slices when the divisor has only a few non-zero values."""
+    quotient = []
+    for index in range(size):
+        remainder = dividend[index]
+        for offset, value in terms:
+            if offset > index:
+                break
+            remainder -= value * quotient[index - offset]
+        quotient.append(remainder // leading_value)
+    return quotient
+
+
+def deconvolve_by_ones(dividend, width, step=1):
+    """
+    `deconvolve` by a divisor of `width` ones, `step` apart, in O(len(dividend)).
+
+    with y = x**step, 1 + y + ... + y**(width-1) == (1 - y**width) / (1 - y), so multiply by
+    (1 - y) (take differences) and divide by (1 - y**width) (running totals).
+    """
+    span = (width - 1) * step + 1
+    size = len(dividend) - span + 1
+    head = dividend[:size]
+    differences = head[:step] + list(map(sub, head[step:], head))
+    period = width * step
+    quotient = [0] * size
+    for start in range(min(period, size)):
+        quotient[start::period] = accumulate(differences[start::period])
+    return quotient
+
+
+def convolve(first_list, second_list):
+    """
+    :param first_list: may not be empty\n
+        [int>=0, ...]
+    :param second_list: may not be empty\n
+        [int>=0, ...]
+    :return: list of len(first_list) + len(second_list) - 1
+    """
+    if len(first_list) < len(second_list):
+        first_list, second_list = second_list, first_list
+    size = len(first_list)
+    answer = [0] * (size + len(second_list) - 1)
+    for offset, occurrences in enumerate(second_list):
+        if occurrences:
+            stop = offset + size
+            answer[offset:stop] = map(
+                add, answer[offset:stop], map(mul, first_list, repeat(occurrences))
+            )
+    return answer
+
+
+def convolve_by_packed_int(first_list, second_list):
+    """
+    exact convolution by kronecker substitution. each list is packed into one int with a fixed
+    number of bytes per value.  the product of the two ints is the packed convolution.
+
+    :param first_list: may not be empty\n
+        [int>=0, ...]
+    :param second_list: may not be empty\n
+        [int>=0, ...]
+    :return: list of len(first_list) + len(second_list) - 1
+    """
+    largest_possible = min(len(first_list), len(second_list)) * max(first_list) * max(second_list)
+    slot_bytes = largest_possible.bit_length() // 8 + 1
+    product = pack_list(first_list, slot_bytes) * pack_list(second_list, slot_bytes)
+    return unpack_int(product, slot_bytes, len(first_list) + len(second_list) - 1)
+
+
+def pack_list(values, slot_bytes):
+    """
+    :param values: [int>=0, ...] all values < 256 ** slot_bytes
+    """
+    return int.from_bytes(
+        b"".join(value.to_bytes(slot_bytes, "little") for value in values), "little"
+    )
+
+
+def unpack_int(number, slot_bytes, size):
+    """the inverse of `pack_list`"""
+    raw_bytes = number.to_bytes(slot_bytes * size, "little")
+    return [
+        int.from_bytes(raw_bytes[start : start + slot_bytes], "little")
+        for start in range(0, len(raw_bytes), slot_bytes)
+    ]
+
 
 def add_many(*args):
     return sum(args)
@@ -5,10 +5,7 @@ from typing import Iterable, Type, Optional, Any, Union
 
 from dicetables.dicepool import DicePool
 from dicetables.eventsbases.protodie import ProtoDie
-from dicetables.tools.orderedcombinations import (
-    count_unique_combination_keys,
-    largest_permitted_pool_size,
-)
+from dicetables.tools.orderstatistics import count_selected_sums_steps
 
 
 DieOrPool = Union[Type[ProtoDie], Type[DicePool]]
@@ -122,16 +119,8 @@ class LimitChecker(AbstractLimitChecker):
         self.max_explosions = max_explosions
         self.max_dice_calls = max_dice
         self.max_dice_pool_calls = max_dice_pools
-        self.max_dice_pool_combinations_per_dict_size = {
-            2: 600,
-            3: 8700,
-            4: 30000,
-            5: 55000,
-            6: 70000,
-            7: 100000,
-            12: 200000,
-            30: 250000,
-        }
+        self.max_dice_pool_size = 500
+        self.max_dice_pool_steps = 750000
 
     def assert_numbers_of_calls_within_limits(self, call_classes: Iterable[DieOrPool]) -> None:
         class_list = list(call_classes)
@@ -179,18 +168,20 @@ class LimitChecker(AbstractLimitChecker):
         if input_die is None or pool_size is None:
             return
 
-        dict_size = len(input_die.get_dict())
-        pool_limit = 0
-        for key, limit in sorted(self.max_dice_pool_combinations_per_dict_size.items()):
-            if key > dict_size:
-                break
-            pool_limit = limit
-
-        score = count_unique_combination_keys(input_die, pool_size)
-        if score > pool_limit:
-            max_pool_size = largest_permitted_pool_size(input_die, pool_limit)
-            msg = "{!r} has a get_dict() of size: {}\n".format(input_die, dict_size)
+        events = input_die.events_view()
+        if pool_size > self.max_dice_pool_size or (
+            count_selected_sums_steps(events, pool_size) > self.max_dice_pool_steps
+        ):
+            msg = "{!r} has a get_dict() of size: {}\n".format(input_die, len(events))
             explanation = "For this die, the largest permitted pool_size is {}".format(
-                max_pool_size
+                self._get_largest_pool_size(events)
             )
             raise LimitsError(msg + explanation)
+
+    def _get_largest_pool_size(self, events):
+        pool_size = 0
+        while pool_size < self.max_dice_pool_size and (
+            count_selected_sums_steps(events, pool_size + 1) <= self.max_dice_pool_steps
+        ):
+            pool_size += 1
+        return pool_size
@@ -0,0 +1,231 @@
+"""
+exact moments of IntegerEvents from integer power sums.
+
+One pass over the events makes the power sums: total occurrences, and the sums of
+occurrences * event ** k for k = 1 to 4.  Every moment is then exact integer arithmetic
+(a Fraction).  Only the square roots in stddev and skewness are rounded, to any precision.
+
+The power sums of two events combined are found from the power sums of each (binomial theorem), so
+combining and removing dice carry them along without reading the new events.  They are carried as
+`PendingPowerSums` and only worked out when asked for.
+"""
+
+from collections import namedtuple
+from decimal import Context, Decimal
+from fractions import Fraction
+from typing import Iterable, Optional, Tuple
+
+PowerSums = namedtuple("PowerSums", ["total", "first", "second", "third", "fourth"])
+"""
+- total: sum of occurrences
+- first, second, third, fourth: sum of occurrences * event ** k
+"""
+
+
+def get_power_sums(items: Iterable[Tuple[int, int]]) -> PowerSums:
+    """
+
+    :param items: [(event, occurrences), ...]
+    """
+    total = first = second = third = fourth = 0
+    for event, occurrences in items:
+        total += occurrences
+        if event:
+            product = occurrences * event
+            first += product
+            product *= event
+            second += product
+            product *= event
+            third += product
+            fourth += product * event
+    return PowerSums(total, first, second, third, fourth)
+
+
+IDENTITY = PowerSums(1, 0, 0, 0, 0)
+"""the power sums of {0: 1}"""
+
+_BINOMIALS = ((1,), (1, 1), (1, 2, 1), (1, 3, 3, 1), (1, 4, 6, 4, 1))
+
+
+def combine_power_sums(first: PowerSums, second: PowerSums) -> PowerSums:
+    """
+
+    :return: the power sums of `first` events combined with `second` events
+    """
+    total_a, first_a, second_a, third_a, fourth_a = first
+    total_b, first_b, second_b, third_b, fourth_b = second
+    return PowerSums(
+        total_a * total_b,
+        total_a * first_b + first_a * total_b,
+        total_a * second_b + 2 * first_a * first_b + second_a * total_b,
+        total_a * third_b + 3 * (first_a * second_b + second_a * first_b) + third_a * total_b,
+        total_a * fourth_b
+        + 4 * (first_a * third_b + third_a * first_b)
+        + 6 * second_a * second_b
+        + fourth_a * total_b,
+    )
+
+
+def get_power_sums_power(power_sums: PowerSums, times: int) -> PowerSums:
+    """
+
+    :return: the power sums of events combined with itself `times` times. times <= 0 is IDENTITY.
+    """
+    answer = IDENTITY
+    while times > 0:
+        if times & 1:
+            answer = combine_power_sums(answer, power_sums)
+        times >>= 1
+        if times:
+            power_sums = combine_power_sums(power_sums, power_sums)
+    return answer
+
+
+def remove_power_sums(power_sums: PowerSums, removed: PowerSums) -> Optional[PowerSums]:
+    """
+    the inverse of `combine_power_sums`.
+
+    :return: the power sums that combine with `removed` to make `power_sums` or None if there are
+        none. (the events did not contain `removed`.)
+    """
+    total = removed.total
+    answer = []
+    for power in range(5):
+        rest = sum(
+            coefficient * answer[index] * removed[power - index]
+            for index, coefficient in enumerate(_BINOMIALS[power][:power])
+        )
+        quotient, remainder = divmod(power_sums[power] - rest, total)
+        if remainder:
+            return None
+        answer.append(quotient)
+    return PowerSums(*answer)
+
+
+class PendingPowerSums(object):
+    """
+    power sums that are worked out the first time they are asked for: `base` combined with (or, with
+    `remove`, divided by) the power sums of every (events, times).  `base` and the power sums of the
+    events are PowerSums or other PendingPowerSums, so a chain of combines costs nothing until the
+    end of the chain is asked for.  the events themselves are never held.  every link is worked out
+    once and then drops its operands.
+    """
+
+    __slots__ = ("_base", "_power_sums_times", "_remove", "_resolved", "_answer")
+
+    def __init__(self, base, power_sums_times: Iterable[Tuple[object, int]], remove: bool = False):
+        """
+
+        :param base: PowerSums or PendingPowerSums
+        :param power_sums_times: [(PowerSums or PendingPowerSums of the events, times), ...]
+        :param remove: True means divide `base` by the events.
+        """
+        self._base = base
+        self._power_sums_times = list(power_sums_times)
+        self._remove = remove
+        self._resolved = False
+        self._answer = None
+
+    def get(self) -> Optional[PowerSums]:
+        """:return: the power sums or None if a removal did not divide. (see `remove_power_sums`)"""
+        chain = []
+        link = self
+        while isinstance(link, PendingPowerSums) and not link._resolved:
+            chain.append(link)
+            link = link._base
+        power_sums = link._answer if isinstance(link, PendingPowerSums) else link
+        for pending in reversed(chain):
+            if power_sums is not None:
+                power_sums = pending._apply(power_sums)
+            pending._answer = power_sums
+            pending._resolved = True
+            pending._base = pending._power_sums_times = None
+        return power_sums
+
+    def _apply(self, power_sums):
+        operand = IDENTITY
+        for events_power_sums, times in self._power_sums_times:
+            if times > 0:
+                if isinstance(events_power_sums, PendingPowerSums):
+                    events_power_sums = events_power_sums.get()
+                    if events_power_sums is None:
+                        return None
+                power = get_power_sums_power(events_power_sums, times)
+                operand = combine_power_sums(operand, power)
+        if self._remove:
+            return remove_power_sums(power_sums, operand)
+        return combine_power_sums(power_sums, operand)
+
+
+def get_mean(power_sums: PowerSums) -> Fraction:
+    return Fraction(power_sums.first, power_sums.total)
+
+
+def get_central_moments(power_sums: PowerSums) -> Tuple[Fraction, Fraction, Fraction]:
+    """
+
+    :return: (variance, third central moment, fourth central moment)
+    """
+    total, first, second, third, fourth = power_sums
+    variance = get_variance(power_sums)
+    third_central = Fraction(total**2 * third - 3 * total * first * second + 2 * first**3, total**3)
+    fourth_central = Fraction(
+        total**3 * fourth
+        - 4 * total**2 * first * third
+        + 6 * total * first**2 * second
+        - 3 * first**4,
+        total**4,
+    )
+    return variance, third_central, fourth_central
+
+
+def get_variance(power_sums: PowerSums) -> Fraction:
+    total, first, second = power_sums[:3]
+    return Fraction(total * second - first**2, total**2)
+
+
+def get_stddev(power_sums: PowerSums, precision: int = 28) -> Decimal:
+    """
+
+    :param precision: significant digits
+    """
+    return sqrt_fraction(get_variance(power_sums), precision)
+
+
+def get_skewness(power_sums: PowerSums, precision: int = 28) -> Decimal:
+    """
+    third central moment / variance ** 1.5
+
+    :param precision: significant digits
+    :raises: ZeroDivisionError when the variance is zero
+    """
+    variance, third_central, _ = get_central_moments(power_sums)
+    if not variance:
+        raise ZeroDivisionError("skewness of events with zero variance")
+    context = Context(prec=precision + 5)
+    ratio = to_decimal(third_central / variance, context)
+    answer = ratio / sqrt_fraction(variance, precision + 5)
+    return Context(prec=precision).plus(answer)
+
+
+def get_kurtosis(power_sums: PowerSums) -> Fraction:
+    """
+    excess kurtosis: fourth central moment / variance ** 2 - 3. a normal distribution is 0.
+
+    :raises: ZeroDivisionError when the variance is zero
+    """
+    variance, _, fourth_central = get_central_moments(power_sums)
+    if not variance:
+        raise ZeroDivisionError("kurtosis of events with zero variance")
+    return fourth_central / variance**2 - 3
+
+
+def to_decimal(fraction: Fraction, context: Context) -> Decimal:
+    return context.divide(Decimal(fraction.numerator), Decimal(fraction.denominator))
+
+
+def sqrt_fraction(fraction: Fraction, precision: int) -> Decimal:
+    """:param precision: significant digits"""
+    context = Context(prec=precision + 2)
+    answer = to_decimal(fraction, context).sqrt(context)
+    return Context(prec=precision).plus(answer)
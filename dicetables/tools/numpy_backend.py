@@ -0,0 +1,60 @@
+"""
+optional numpy backend for DictCombiner and EventsCalculations.
+
+numpy is not a requirement of dicetables.  When it is installed, combinations whose answer is
+guaranteed to fit in a 64-bit int are done with `numpy.convolve`.  Anything that might overflow
+is left to the exact, pure-python methods.
+"""
+
+from typing import List, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def is_numpy_available() -> bool:
+    return numpy is not None
+
+
+def get_safe_dtype(max_bits: int):
+    """
+    :param max_bits: every value that numpy will calculate is < 2 ** max_bits
+    :return: numpy.int64, numpy.uint64 or None if numpy is not installed or the values are too big
+    """
+    if numpy is None:
+        return None
+    if max_bits <= 63:
+        return numpy.int64
+    if max_bits <= 64:
+        return numpy.uint64
+    return None
+
+
+def convolve_many_times(
+    base_list: List[int], to_combine_list: List[int], times: int, dtype
+) -> List[int]:
+    """
+    convolve `base_list` with `to_combine_list` `times` times.
+
+    :param dtype: from `get_safe_dtype`. it is the caller's job to make sure nothing overflows.
+    :return: list of python ints
+    """
+    answer = numpy.array(base_list, dtype=dtype)
+    to_combine = numpy.array(to_combine_list, dtype=dtype)
+    for _ in range(times):
+        answer = numpy.convolve(answer, to_combine)
+    return answer.tolist()
+
+
+def get_scaled_float_array(values: Sequence[int], shift: int, factor: float):
+    """
+    :return: numpy.float64 array of (value >> shift) * factor. see
+        `dicetables.eventsinfo.get_fast_pct_scale`
+    :raises: ImportError if numpy is not installed
+    """
+    if numpy is None:
+        raise ImportError("numpy is not installed. pip install dicetables[numpy]")
+    scaled = numpy.fromiter(map(shift.__rrshift__, values), dtype=numpy.float64, count=len(values))
+    return scaled * factor
@@ -1,6 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations_with_replacement
 from math import factorial
-from typing import Dict, Tuple
+from typing import Dict, Iterator, List, Sequence, Tuple
 
 from dicetables.eventsbases.integerevents import IntegerEvents
 
@@ -23,10 +24,141 @@ def largest_permitted_pool_size(events, max_number_of_keys):
     return pool_size - 1
 
 
-def ordered_combinations_of_events(events: IntegerEvents, times: int) -> Dict[Tuple[int, ...], int]:
-    base_dict = events.get_dict()
-    ordered_combinations = combinations_with_replacement(sorted(base_dict.keys()), times)
-    return {key: get_combination_occurrences(key, base_dict) for key in ordered_combinations}
+def ordered_combinations_of_events(
+    events: IntegerEvents, times: int, workers: int = 1
+) -> Dict[Tuple[int, ...], int]:
+    """
+    :param workers: int >= 1. more than one splits the combinations by leading (lowest) face, and
+        by how many times it is rolled, across a `concurrent.futures.ProcessPoolExecutor` with this
+        many processes. the answer is the same.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    base_dict = dict(events.events_view())
+    if workers == 1 or times < 2 or len(base_dict) < 2:
+        return dict(iter_ordered_combinations_of_events(events, times))
+
+    faces = sorted(base_dict)
+    jobs = [
+        (base_dict, faces[index:], leading_count, times)
+        for index in range(len(faces))
+        for leading_count in range(times, 0, -1)
+        if leading_count == times or index < len(faces) - 1
+    ]
+    answer = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial_combinations in executor.map(_get_combinations_with_leading_face, jobs):
+            answer.update(partial_combinations)
+    return answer
+
+
+def _get_combinations_with_leading_face(job):
+    """
+    :param job: (base_dict, [leading face, higher faces, ...], leading_count, times)
+    :return: the combinations that start with exactly `leading_count` leading faces
+    """
+    base_dict, faces, leading_count, times = job
+    leading = (faces[0],) * leading_count
+    higher_faces = faces[1:]
+    remaining = times - leading_count
+    factor = get_factorial(times) // (get_factorial(leading_count) * get_factorial(remaining))
+    factor *= base_dict[faces[0]] ** leading_count
+    higher_occurrences = iter_occurrences([base_dict[face] for face in higher_faces], remaining)
+    return {
+        leading + rest: factor * occurrences
+        for rest, occurrences in zip(
+            combinations_with_replacement(higher_faces, remaining), higher_occurrences
+        )
+    }
+
+
+def iter_ordered_combinations_of_events(
+    events: IntegerEvents, times: int
+) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """yields (sorted combination, occurrences) one at a time in sorted order. nothing is stored."""
+    faces = sorted(events.events_view().items())
+    return zip(
+        combinations_with_replacement([face for face, _ in faces], times),
+        iter_occurrences([weight for _, weight in faces], times),
+    )
+
+
+def iter_face_counts_of_events(
+    events: IntegerEvents, times: int
+) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """
+    the compact form of `iter_ordered_combinations_of_events`. a combination is the number of times
+    each face is rolled.
+
+    :return: (counts, occurrences) in the same order. counts[index] is for the index-th lowest face.
+    """
+    weights = [weight for _, weight in sorted(events.events_view().items())]
+    return ((tuple(counts), occurrences) for counts, occurrences in _iter_counts(weights, times))
+
+
+def iter_occurrences(weights: Sequence[int], times: int) -> Iterator[int]:
+    """
+    the occurrences of every sorted combination of `times` faces in order. the weights are the
+    weights of the faces from lowest to highest.
+    """
+    return (occurrences for _, occurrences in _iter_counts(weights, times))
+
+
+def _iter_counts(weights: Sequence[int], times: int) -> Iterator[Tuple[List[int], int]]:
+    """
+    yields (counts, occurrences) from (times, 0, ..., 0) to (0, ..., 0, times). counts is the same
+    list every time.
+
+    To get the next combination, take one die off the highest face below the top face that has any
+    and put it, and every die on the top face, on the next face up.  Only three counts change, so the
+    occurrences are updated from the ratio of the changed factorials and weights.
+    """
+    top = len(weights) - 1
+    counts = [0] * len(weights)
+    if not weights:
+        if not times:
+            yield counts, 1
+        return
+    counts[0] = times
+    occurrences = weights[0] ** times
+    yield counts, occurrences
+    if top < 1 or times < 1:
+        return
+    powers = [get_powers(weight, times) for weight in weights]
+    while True:
+        on_top = counts[top]
+        index = top - 1
+        while index >= 0 and not counts[index]:
+            index -= 1
+        if index < 0:
+            return
+        numerator = counts[index] * powers[index + 1][on_top + 1]
+        denominator = weights[index] * (on_top + 1) * powers[top][on_top]
+        counts[index] -= 1
+        counts[top] = 0
+        counts[index + 1] = on_top + 1
+        occurrences = occurrences * numerator // denominator
+        yield counts, occurrences
+
+
+def get_powers(weight: int, times: int) -> List[int]:
+    """:return: [weight ** 0, weight ** 1, ..., weight ** times]"""
+    if weight == 1:
+        return [1] * (times + 1)
+    answer = [1]
+    for _ in range(times):
+        answer.append(answer[-1] * weight)
+    return answer
+
+
+_factorials = [1]
+
+
+def get_factorial(number: int) -> int:
+    """factorials are cached up to the largest `number` asked for."""
+    while len(_factorials) <= number:
+        _factorials.append(_factorials[-1] * len(_factorials))
+    return _factorials[number]
 
 
 def get_combination_occurrences(combination, base_dict):
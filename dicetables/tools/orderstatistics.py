@@ -0,0 +1,131 @@
+"""
+the sum of selected order statistics of a pool of dice, without listing the rolls.
+
+Sort every roll of `pool_size` dice from lowest to highest.  The selected indices are positions in
+that sorted roll: for 4D6, best 3 is {1, 2, 3} and worst 1 is {0}.
+
+Going through the faces from lowest to highest, a roll is fully described by how many dice show
+each face.  After the lower faces have taken `assigned` dice, a face that takes `count` more dice
+fills sorted positions `assigned` to `assigned + count - 1`, adds `face * (selected positions in
+that range)` to the sum and can be placed in `C(pool_size - assigned, count) * weight ** count`
+ways.  So the only state is (dice assigned, partial sum) -> occurrences.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+
+def get_selected_sums(
+    events: Mapping[int, int], pool_size: int, selected_indices: Iterable[int]
+) -> Dict[int, int]:
+    """
+
+    :param events: {face: weight>0, ...} may not be empty.
+    :param pool_size: int >= 1
+    :param selected_indices: positions in the sorted roll, 0 <= index < pool_size. 0 is the lowest
+        die. repeats are ignored.
+    :return: {sum of the selected dice: occurrences}
+    """
+    return get_many_selected_sums(events, pool_size, [selected_indices])[0]
+
+
+def get_many_selected_sums(
+    events: Mapping[int, int], pool_size: int, index_sets: Iterable[Iterable[int]]
+) -> List[Dict[int, int]]:
+    """
+    `get_selected_sums` for every set of indices in one pass over the faces. the ways to place each
+    face are worked out once for all of them, and equal sets are only worked out once.
+
+    :return: [{sum of the selected dice: occurrences}, ...] in the order of `index_sets`. equal sets
+        share one dict.
+    """
+    selected_counts = []
+    positions = {}
+    answer_positions = []
+    for selected_indices in index_sets:
+        selected_count = tuple(get_selected_count(pool_size, selected_indices))
+        if selected_count not in positions:
+            positions[selected_count] = len(selected_counts)
+            selected_counts.append(selected_count)
+        answer_positions.append(positions[selected_count])
+
+    faces = sorted(events.items())
+    last_face = len(faces) - 1
+    states = [None] * (pool_size + 1)
+    states[0] = [{0: 1} for _ in selected_counts]
+    for face_index, (face, weight) in enumerate(faces):
+        new_states = [None] * (pool_size + 1)
+        for assigned, all_partial_sums in enumerate(states):
+            if all_partial_sums is None:
+                continue
+            remaining = pool_size - assigned
+            if face_index == last_face:
+                counts_and_ways = [(remaining, weight**remaining)]
+            else:
+                counts_and_ways = get_counts_and_ways(remaining, weight)
+            for count, ways in counts_and_ways:
+                if new_states[assigned + count] is None:
+                    new_states[assigned + count] = [{} for _ in selected_counts]
+                for selected_count, partial_sums, new_partial_sums in zip(
+                    selected_counts, all_partial_sums, new_states[assigned + count]
+                ):
+                    added = face * (selected_count[assigned + count] - selected_count[assigned])
+                    for partial_sum, occurrences in partial_sums.items():
+                        key = partial_sum + added
+                        new_partial_sums[key] = new_partial_sums.get(key, 0) + occurrences * ways
+        states = new_states
+    return [states[pool_size][position] for position in answer_positions]
+
+
+def get_counts_and_ways(remaining: int, weight: int) -> List[Tuple[int, int]]:
+    """:return: [(count, C(remaining, count) * weight ** count) for count in 0 to remaining]"""
+    answer = [(0, 1)]
+    ways = 1
+    for count in range(1, remaining + 1):
+        ways = ways * (remaining - count + 1) // count * weight
+        answer.append((count, ways))
+    return answer
+
+
+def get_selected_count(pool_size: int, selected_indices: Iterable[int]) -> List[int]:
+    """
+
+    :return: answer[index] is the number of selected indices below `index`. len(answer) is
+        pool_size + 1
+    :raises: ValueError for an index outside 0 <= index < pool_size
+    """
+    selected = set(selected_indices)
+    if any(not 0 <= index < pool_size for index in selected):
+        raise ValueError(
+            "selected indices must be from 0 to {}. got: {}".format(pool_size - 1, sorted(selected))
+        )
+    answer = [0]
+    for index in range(pool_size):
+        answer.append(answer[-1] + (index in selected))
+    return answer
+
+
+def count_selected_sums_steps(events: Mapping[int, int], pool_size: int) -> int:
+    """
+    an upper bound on the number of additions in `get_selected_sums` when every die is selected.
+    every other selection takes fewer.
+
+    before the i-th face, the dice assigned so far show the i lower faces, so `assigned` dice have
+    at most `assigned * (face[i - 1] - face[0]) + 1` sums and at most one sum per multiset of faces.
+    the last face only takes the remaining dice.
+    """
+    faces = sorted(events)
+    steps = 0
+    for face_index in range(len(faces)):
+        span = faces[face_index - 1] - faces[0] if face_index else 0
+        multisets = 1
+        for assigned in range(pool_size + 1):
+            if assigned and face_index:
+                multisets = multisets * (assigned + face_index - 1) // assigned
+            elif assigned:
+                break
+            partial_sums = min(assigned * span + 1, multisets)
+            if face_index == len(faces) - 1:
+                steps += partial_sums
+            else:
+                steps += partial_sums * (pool_size - assigned + 1)
+    return steps
@@ -0,0 +1,99 @@
+"""
+a process-wide LRU cache of the n-fold combination of a die with itself.
+
+DiceTable.add_die and AdditiveEvents.combine use it whenever a ProtoDie is added more than once, so
+building 3D6 a thousand times only combines D6 with itself once.  Powers are stored as the dicts that
+`combine_by_fastest` makes, so a sparse power costs its number of events, not its span.  The byte
+budget and the LRU eviction come from `dicetables.tools.bytecache.ByteBudgetCache`.
+"""
+
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
+
+from dicetables.eventsbases.integerevents import IntegerEvents
+from dicetables.eventsbases.protodie import ProtoDie
+from dicetables.tools.bytecache import ByteBudgetCache, get_size_in_bytes
+from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.mergeplanner import merge_dictionaries
+
+
+class PowerCache(ByteBudgetCache):
+    def get_power(self, die, times: int) -> Mapping[int, int]:
+        """
+
+        :param die: any hashable IntegerEvents. usually a ProtoDie.
+        :param times: int >= 0
+        :return: a read-only view of die combined with itself `times` times.
+        """
+        key = (die, times)
+        with self._lock:
+            power = self._get_value(key)
+            if power is not None:
+                return power
+            self._misses += 1
+
+        power_dict = DictCombiner({0: 1}).combine_by_fastest(die.events_view(), times)
+        power = MappingProxyType(power_dict)
+        self._store(key, power, get_size_in_bytes(power))
+        return power
+
+    def combine(self, dictionary: Mapping[int, int], die, times: int) -> dict:
+        """
+        combine `dictionary` with the cached power of `die`.
+
+        :param dictionary: {int: int>0, ...}
+        """
+        power = self.get_power(die, times)
+        return DictCombiner(dictionary).combine_by_fastest(power, 1)
+
+
+_power_cache = PowerCache()
+
+
+def get_power_cache() -> PowerCache:
+    return _power_cache
+
+
+def combine_events(dictionary: Mapping[int, int], events: IntegerEvents, times: int) -> dict:
+    """
+    combine_by_fastest that uses the power cache when a ProtoDie is combined more than once.
+
+    :param dictionary: {int: int>0, ...}
+    """
+    if times > 1 and isinstance(events, ProtoDie):
+        return _power_cache.combine(dictionary, events, times)
+    return DictCombiner(dictionary).combine_by_fastest(events.events_view(), times)
+
+
+def get_power_dict(events: IntegerEvents, times: int) -> Mapping[int, int]:
+    """
+    :return: a read-only view of `events` combined with itself `times` times. from the power cache
+        for a ProtoDie.
+    """
+    if times == 1:
+        return events.events_view()
+    if isinstance(events, ProtoDie):
+        return _power_cache.get_power(events, times)
+    return DictCombiner({0: 1}).combine_by_fastest(events.events_view(), times)
+
+
+def combine_all_events(
+    dictionary: Mapping[int, int], events_times: Iterable[Tuple[IntegerEvents, int]]
+) -> dict:
+    """
+    combine `dictionary` with every (events, times) pair. each events is combined with itself first
+    (from the power cache for a ProtoDie).  those powers and `dictionary` are merged pairwise in a
+    balanced tree. see `dicetables.tools.mergeplanner`.
+
+    :param dictionary: {int: int>0, ...}
+    :param events_times: [(IntegerEvents, int>=0), ...]
+    """
+    powers = [get_power_dict(events, times) for events, times in events_times if times > 0]
+    if not is_identity(dictionary) or not powers:
+        powers.append(dictionary)
+    return merge_dictionaries(powers)
+
+
+def is_identity(dictionary: Mapping[int, int]) -> bool:
+    """:return: `dictionary` == {0: 1} without building a dict from a view"""
+    return len(dictionary) == 1 and dictionary.get(0) == 1
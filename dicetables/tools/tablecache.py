@@ -0,0 +1,112 @@
+"""
+an optional cache of DiceTable events keyed by DiceRecord.
+
+The events of a DiceTable are fully determined by its DiceRecord, so tables with the same dice share
+one entry no matter what order the dice were added in.  When a record is not in the cache, its
+events are built from the largest cached sub-record by combining only the missing dice.
+
+The cache is off by default.  Turn it on with :code:`set_table_cache(TableCache())` and off with
+:code:`set_table_cache(None)`.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from dicetables.dicerecord import DiceRecord
+from dicetables.tools.bytecache import DEFAULT_MAX_BYTES, ByteBudgetCache, get_size_in_bytes
+from dicetables.tools.powercache import combine_all_events
+
+TableCacheInfo = namedtuple(
+    "TableCacheInfo",
+    ["hits", "partial_hits", "misses", "evictions", "entries", "current_bytes", "max_bytes"],
+)
+"""
+- hits: the record was in the cache
+- partial_hits: built from a non-empty cached sub-record
+- misses: built from the empty record. get_cached_events counts every record it did not find.
+"""
+
+
+class TableCache(ByteBudgetCache):
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+
+        :param max_bytes: int >= 0. 0 means nothing is stored.
+        """
+        super(TableCache, self).__init__(max_bytes)
+        self._partial_hits = 0
+
+    def get_cached_events(self, record: DiceRecord) -> Optional[Mapping[int, int]]:
+        """
+
+        :return: a read-only view of the cached events or None. does not build anything.
+        """
+        with self._lock:
+            cached = self._get_value(record)
+            if cached is None:
+                self._misses += 1
+                return None
+            return MappingProxyType(cached[0])
+
+    def get_events(self, record: DiceRecord) -> Mapping[int, int]:
+        """
+        a read-only view of the cached events of `record` or the events built from its largest
+        cached sub-record. the answer is added to the cache.
+        """
+        counts = record.record_view()
+        if not counts:
+            return MappingProxyType({0: 1})
+        with self._lock:
+            cached = self._get_value(record)
+            if cached is not None:
+                return MappingProxyType(cached[0])
+            base_counts, events = self._get_largest_sub_record(counts)
+            if base_counts:
+                self._partial_hits += 1
+            else:
+                self._misses += 1
+
+        missing = [(die, number - base_counts.get(die, 0)) for die, number in counts.items()]
+        events = combine_all_events(events, missing)
+        self._store(record, (events, counts, sum(counts.values())), get_size_in_bytes(events))
+        return MappingProxyType(events)
+
+    def _get_largest_sub_record(self, counts):
+        """:return: (counts of the cached sub-record with the most dice, its events)"""
+        max_dice = sum(counts.values())
+        best_counts = {}
+        best_events = {0: 1}
+        best_dice = 0
+        best_key = None
+        for key, ((events, cached_counts, dice), _) in self._entries.items():
+            if dice <= best_dice or dice >= max_dice or len(cached_counts) > len(counts):
+                continue
+            if all(counts.get(die, 0) >= number for die, number in cached_counts.items()):
+                best_counts, best_events, best_dice, best_key = cached_counts, events, dice, key
+        if best_key is not None:
+            self._entries.move_to_end(best_key)
+        return best_counts, best_events
+
+    def _reset_counters(self):
+        super(TableCache, self)._reset_counters()
+        self._partial_hits = 0
+
+    def _make_info(self) -> TableCacheInfo:
+        return TableCacheInfo(
+            partial_hits=self._partial_hits, **super(TableCache, self)._make_info()._asdict()
+        )
+
+
+_table_cache = None
+
+
+def get_table_cache() -> Optional[TableCache]:
+    """:return: the cache that DiceTable uses or None if it is off."""
+    return _table_cache
+
+
+def set_table_cache(table_cache: Optional[TableCache]) -> None:
+    """:param table_cache: a TableCache to turn the cache on. None to turn it off."""
+    global _table_cache
+    _table_cache = table_cache
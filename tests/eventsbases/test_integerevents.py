@@ -2,10 +2,20 @@
 from __future__ import absolute_import
 
 import unittest
+from operator import setitem
 from sys import version_info
 
 from dicetables.eventsbases.eventerrors import InvalidEventsError
-from dicetables.eventsbases.integerevents import IntegerEvents, EventsVerifier
+from dicetables.eventsbases import integerevents
+from dicetables.eventsbases.integerevents import (
+    IntegerEvents,
+    EventsVerifier,
+    get_always_verify,
+    set_always_verify,
+    TrustedEvents,
+    unwrap_trusted,
+)
+from dicetables.tools.indexedvalues import IndexedValues
 
 
 class DummyEvents(IntegerEvents):
@@ -86,6 +96,34 @@ class TestIntegerEvents(unittest.TestCase):
         self.assertRaises(AttributeError, self.checker.verify_get_dict, [(1, 2, 3), (4, 5, 6)])
         self.assertRaises(InvalidEventsError, self.checker.verify_get_dict, {"a": "b"})
 
+    def test_EventsVerifier_verify_indexed_values_pass(self):
+        self.assertIsNone(self.checker.verify_indexed_values(IndexedValues(-3, [1, 0, 2**100])))
+
+    def test_EventsVerifier_verify_indexed_values_zero_at_ends(self):
+        for values in ([0, 1], [1, 0], [0]):
+            self.assert_my_regex(
+                InvalidEventsError,
+                "no negative or zero occurrences in Events.get_dict()",
+                self.checker.verify_indexed_values,
+                IndexedValues(0, values),
+            )
+
+    def test_EventsVerifier_verify_indexed_values_negative_occurrences(self):
+        self.assert_my_regex(
+            InvalidEventsError,
+            "no negative or zero occurrences in Events.get_dict()",
+            self.checker.verify_indexed_values,
+            IndexedValues(0, [1, -1, 1]),
+        )
+
+    def test_EventsVerifier_verify_indexed_values_non_int_occurrences(self):
+        self.assert_my_regex(
+            InvalidEventsError,
+            self.types_error,
+            self.checker.verify_indexed_values,
+            IndexedValues(0, [1, 1.0]),
+        )
+
     def test_IntegerEvents_checks_get_dict_at_init(self):
         self.assertRaises(InvalidEventsError, DummyEvents, {"a": "b"})
 
@@ -96,6 +134,12 @@ class TestIntegerEvents(unittest.TestCase):
         )
         self.assert_my_regex(NotImplementedError, message, IntegerEvents)
 
+    def test_IntegerEvents_events_view_is_read_only_get_dict(self):
+        view = DummyEvents({1: 2}).events_view()
+        self.assertEqual(view, {1: 2})
+        with self.assertRaises(TypeError):
+            view[1] = 3
+
     def test_IntegerEvents__eq__true(self):
         self.assertTrue(DummyEvents({1: 2}).__eq__(DummyEvents({1: 2})))
 
@@ -128,6 +172,63 @@ class TestIntegerEvents(unittest.TestCase):
     def test_IntegerEvents__ne__true_by_get_dict(self):
         self.assertTrue(DummyEvents({1: 2}).__ne__(DummyEvents({1: 2, 3: 4})))
 
+    def test_IntegerEvents_get_power_sums(self):
+        self.assertEqual(DummyEvents({-1: 2, 3: 1}).get_power_sums(), (3, 1, 11, 25, 83))
+
+
+class TestTrustedEvents(unittest.TestCase):
+    def setUp(self):
+        self.always_verify = get_always_verify()
+        set_always_verify(False)
+
+    def tearDown(self):
+        set_always_verify(self.always_verify)
+
+    def test_set_always_verify(self):
+        set_always_verify(True)
+        self.assertTrue(get_always_verify())
+        self.assertTrue(integerevents._always_verify)
+        set_always_verify(False)
+        self.assertFalse(get_always_verify())
+
+    def test_unwrap_trusted_plain_events(self):
+        events = {1: 1}
+        self.assertEqual(unwrap_trusted(events), (events, False))
+        self.assertIs(unwrap_trusted(events)[0], events)
+
+    def test_unwrap_trusted_TrustedEvents(self):
+        events = {1: 1}
+        answer, trusted = unwrap_trusted(TrustedEvents(events))
+        self.assertIs(answer, events)
+        self.assertTrue(trusted)
+
+    def test_unwrap_trusted_always_verify(self):
+        set_always_verify(True)
+        self.assertEqual(unwrap_trusted(TrustedEvents({1: 1})), ({1: 1}, False))
+
+    def test_TrustedEvents_is_a_read_only_mapping_of_events(self):
+        trusted = TrustedEvents({1: 2, 3: 4})
+        self.assertEqual(dict(trusted), {1: 2, 3: 4})
+        self.assertEqual(len(trusted), 2)
+        self.assertEqual(trusted[3], 4)
+        self.assertRaises(TypeError, setitem, trusted, 1, 1)
+
+    def test_TrustedEvents_copy_is_a_plain_dict(self):
+        events = {1: 2, 3: 4}
+        copy = TrustedEvents(events).copy()
+        self.assertEqual(copy, events)
+        self.assertIs(type(copy), dict)
+        self.assertIsNot(copy, events)
+
+    def test_IntegerEvents_verify_false_skips_verification(self):
+        class Unverified(DummyEvents):
+            def __init__(self, dictionary):
+                self._dictionary = dictionary
+                IntegerEvents.__init__(self, verify=False)
+
+        self.assertEqual(Unverified({1: -1}).get_dict(), {1: -1})
+        self.assertRaises(InvalidEventsError, DummyEvents, {1: -1})
+
 
 if __name__ == "__main__":
     unittest.main()
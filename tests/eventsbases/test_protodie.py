@@ -3,6 +3,7 @@ from __future__ import absolute_import
 
 import unittest
 
+from dicetables.eventsbases.eventerrors import InvalidEventsError
 from dicetables.eventsbases.protodie import ProtoDie
 
 
@@ -179,9 +180,41 @@ class TestProtoDie(unittest.TestCase):
         second = DummyDie(2, 3, {2: 2}, "a")
         self.assertFalse(second >= first)
 
+    def test_ProtoDie_get_sort_key(self):
+        die = DummyDie(2, 3, {4: 5, 1: 2}, "REPR")
+        self.assertEqual(die.get_sort_key(), (2, 3, ((1, 2), (4, 5)), "REPR"))
+
     def test_ProtoDie_hash(self):
-        hash_str = "hash of REPR, 2, 3, {4: 5}"
-        self.assertEqual(hash(DummyDie(2, 3, {4: 5}, "REPR")), hash(hash_str))
+        die = DummyDie(2, 3, {4: 5}, "REPR")
+        self.assertEqual(hash(die), hash((2, 3, ((4, 5),), "REPR")))
+        self.assertEqual(hash(die), hash(DummyDie(2, 3, {4: 5}, "REPR")))
+
+    def test_ProtoDie_sort_key_and_hash_are_made_once(self):
+        die = DummyDie(2, 3, {4: 5}, "REPR")
+        key = die.get_sort_key()
+        die.size = 100
+        die.repr_str = "changed"
+        self.assertIs(die.get_sort_key(), key)
+        self.assertEqual(hash(die), hash(key))
+
+    def test_ProtoDie_get_power_sums_is_made_once(self):
+        die = DummyDie(2, 3, {1: 2, 4: 5}, "REPR")
+        power_sums = die.get_power_sums()
+        self.assertEqual(power_sums, (7, 22, 82, 322, 1282))
+        self.assertIs(die.get_power_sums(), power_sums)
+
+    def test_ProtoDie_get_dict_is_called_once_at_init(self):
+        die = DummyDie(2, 3, {4: 5}, "REPR")
+        die.dictionary = {1: 1}
+        self.assertEqual(die.events_view(), {4: 5})
+        self.assertEqual(die.get_sort_key()[2], ((4, 5),))
+
+    def test_ProtoDie_events_view_is_read_only(self):
+        with self.assertRaises(TypeError):
+            DummyDie(2, 3, {4: 5}, "REPR").events_view()[4] = 1
+
+    def test_ProtoDie_init_verifies_events(self):
+        self.assertRaises(InvalidEventsError, DummyDie, 2, 3, {4: 0}, "REPR")
 
 
 if __name__ == "__main__":
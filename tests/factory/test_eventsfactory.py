@@ -3,6 +3,7 @@ from __future__ import absolute_import
 
 import unittest
 import warnings
+from unittest import mock
 from itertools import cycle
 from sys import version_info
 
@@ -10,6 +11,8 @@ from dicetables.additiveevents import AdditiveEvents
 from dicetables.dicerecord import DiceRecord
 from dicetables.dicetable import DiceTable, DetailedDiceTable
 from dicetables.dieevents import Die
+from dicetables.eventsbases import integerevents
+from dicetables.eventsbases.integerevents import get_always_verify, set_always_verify
 from dicetables.factory.errorhandler import EventsFactoryError
 from dicetables.factory.eventsfactory import EventsFactory, Loader, LoaderError
 from dicetables.factory.warninghandler import EventsFactoryWarning
@@ -546,6 +549,52 @@ class TestEventsFactory(unittest.TestCase):
         self.assertIs(type(new_events1), NewDiceTableNewInitUpdate)
         self.assertIs(type(new_events2), NewDiceTableNewInitUpdate)
 
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_EventsFactory_from_dictionary_trusted_skips_verification(self):
+        events = DiceTable.new()
+        new_events = EventsFactory.from_dictionary(events, {1: -1}, trusted=True)
+        self.assertEqual(new_events.get_dict(), {1: -1})
+        self.assertRaises(EventsFactoryError, EventsFactory.from_dictionary, events, {1: -1})
+
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_EventsFactory_from_dictionary_and_dice_trusted_skips_verification(self):
+        events = DetailedDiceTable.new()
+        new_events = EventsFactory.from_dictionary_and_dice(
+            events, {1: -1}, DiceRecord({Die(2): 2}), trusted=True
+        )
+        self.assertEqual(new_events.get_dict(), {1: -1})
+        self.assertEqual(new_events.get_list(), [(Die(2), 2)])
+
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_EventsFactory_from_params_trusted_skips_verification(self):
+        start = NewDiceTableNewInitUpdate({2: 2}, DiceRecord.new(), 5)
+        new_events = EventsFactory.from_params(start, {"get_dict": {1: -1}}, trusted=True)
+        self.assertEqual(new_events.get_dict(), {1: -1})
+        self.assertEqual(new_events.number, 5)
+
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_EventsFactory_trusted_when_constructed_from_factory_class(self):
+        events = NewDiceTableNewInitNoUpdate({1: 1}, DiceRecord.new(), 5)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            new_events = EventsFactory.from_dictionary(events, {1: -1}, trusted=True)
+        self.assertIs(type(new_events), DiceTable)
+        self.assertEqual(new_events.get_dict(), {1: -1})
+
+    def test_EventsFactory_trusted_always_verify(self):
+        always_verify = get_always_verify()
+        set_always_verify(True)
+        try:
+            self.assertRaises(
+                EventsFactoryError,
+                EventsFactory.from_dictionary,
+                DiceTable.new(),
+                {1: -1},
+                trusted=True,
+            )
+        finally:
+            set_always_verify(always_verify)
+
     def test_Events_Factory_warning_correct_message_raised_CHECK(self):
         will_warn_insert = (
             "TestEventsFactory.test_Events_Factory_warning_correct_message_raised_CHECK.<locals>."
@@ -1,10 +1,29 @@
 # pylint: disable=missing-docstring, invalid-name, too-many-public-methods
 
 
+import gc
 import unittest
-
-from dicetables.additiveevents import AdditiveEvents, scrub_zeroes
+import weakref
+from operator import setitem
+from types import MappingProxyType
+from unittest import mock
+
+from dicetables.additiveevents import (
+    AdditiveEvents,
+    get_events_storage,
+    get_lazy_power_sums,
+    scrub_zeroes,
+)
+from dicetables.dieevents import Die, WeightedDie
 from dicetables.eventsbases.eventerrors import InvalidEventsError
+from dicetables.eventsbases.integerevents import (
+    EventsVerifier,
+    get_always_verify,
+    set_always_verify,
+    TrustedEvents,
+)
+from dicetables.tools.indexedvalues import IndexedValues
+from dicetables.tools.moments import get_power_sums
 
 
 class TestAdditiveEvents(unittest.TestCase):
@@ -14,6 +33,155 @@ class TestAdditiveEvents(unittest.TestCase):
     def test_scrub_zeroes_zeroes_in_dict(self):
         self.assertEqual(scrub_zeroes({1: 2, 3: 0, 4: 1, 5: 0}), {1: 2, 4: 1})
 
+    def test_get_events_storage_dense(self):
+        self.assertEqual(
+            get_events_storage({3: 1, 1: 2, 2: 0, 4: 5}), (None, IndexedValues(1, [2, 0, 1, 5]))
+        )
+
+    def test_get_events_storage_sparse(self):
+        self.assertEqual(get_events_storage({0: 1, 100: 1, 3: 0}), ({0: 1, 100: 1}, None))
+
+    def test_get_events_storage_indexed_values(self):
+        values = IndexedValues(1, [1, 2])
+        self.assertEqual(get_events_storage(values), (None, values))
+
+    def test_get_events_storage_invalid_dicts_are_not_converted(self):
+        self.assertEqual(get_events_storage({}), ({}, None))
+        self.assertEqual(get_events_storage({1: 0}), ({}, None))
+        self.assertEqual(get_events_storage({1.0: 1}), ({1.0: 1}, None))
+
+    def test_AdditiveEvents_get_indexed_values(self):
+        self.assertEqual(
+            AdditiveEvents({1: 2, 2: 3}).get_indexed_values(), IndexedValues(1, [2, 3])
+        )
+        self.assertIsNone(AdditiveEvents({1: 2, 1000: 3}).get_indexed_values())
+
+    def test_AdditiveEvents_get_power_sums_dense_and_sparse(self):
+        for dictionary in ({-1: 2, 0: 1, 1: 3}, {-1: 2, 0: 1, 1: 3, 1000: 1}):
+            events = AdditiveEvents(dictionary)
+            self.assertEqual(events.get_power_sums(), get_power_sums(dictionary.items()))
+
+    def test_AdditiveEvents_get_power_sums_is_made_once(self):
+        events = AdditiveEvents({1: 2, 2: 3})
+        self.assertIs(events.get_power_sums(), events.get_power_sums())
+
+    def assert_power_sums_are_carried(self, events):
+        with mock.patch("dicetables.additiveevents.get_power_sums") as get_sums:
+            power_sums = events.get_power_sums()
+        self.assertEqual(get_sums.call_count, 0)
+        self.assertEqual(power_sums, get_power_sums(events.get_dict().items()))
+
+    def test_AdditiveEvents_combine_methods_carry_power_sums(self):
+        events = AdditiveEvents({-1: 2, 0: 1, 1: 3})
+        events.get_power_sums()
+        methods = [
+            events.combine,
+            events.combine_by_flattened_list,
+            events.combine_by_dictionary,
+            events.combine_by_indexed_values,
+            events.combine_by_squaring,
+            events.combine_by_packed_int,
+            events.combine_by_numpy,
+        ]
+        for method in methods:
+            for times in (0, 1, 3):
+                answer = method(WeightedDie({1: 2, 3: 1}), times)
+                self.assert_power_sums_are_carried(answer)
+
+    def test_AdditiveEvents_combine_all_carries_power_sums(self):
+        events = AdditiveEvents({1: 2, 2: 3})
+        other = AdditiveEvents({1: 1, 100: 2})
+        events.get_power_sums()
+        other.get_power_sums()
+        answer = events.combine_all(iter([(Die(4), 2), (other, 1)]))
+        self.assert_power_sums_are_carried(answer)
+
+    def test_AdditiveEvents_new_carries_power_sums_through_a_chain(self):
+        answer = AdditiveEvents.new()
+        for _ in range(200):
+            answer = answer.combine(Die(2))
+        self.assert_power_sums_are_carried(answer)
+
+    def test_AdditiveEvents_pending_power_sums_do_not_keep_the_operands(self):
+        other = AdditiveEvents.new().combine(Die(3), 2)
+        other_ref = weakref.ref(other)
+        answer = AdditiveEvents.new().combine(other)
+        del other
+        gc.collect()
+        self.assertIsNone(other_ref())
+        self.assertIsNotNone(answer._pending_power_sums)
+        self.assert_power_sums_are_carried(answer)
+
+    def test_get_lazy_power_sums(self):
+        pending = AdditiveEvents.new().combine(Die(3))
+        self.assertIs(get_lazy_power_sums(pending), pending._pending_power_sums)
+        self.assertIsNone(pending._power_sums)
+        die = Die(3)
+        self.assertIs(get_lazy_power_sums(die), die.get_power_sums())
+        self.assertEqual(
+            get_lazy_power_sums(AdditiveEvents({1: 2, 2: 3})), get_power_sums([(1, 2), (2, 3)])
+        )
+
+    def test_AdditiveEvents_combine_without_power_sums_does_not_read_events(self):
+        events = AdditiveEvents({1: 2, 2: 3})
+        with mock.patch("dicetables.additiveevents.get_power_sums") as get_sums:
+            answer = events.combine(Die(4), 2)
+        self.assertEqual(get_sums.call_count, 0)
+        self.assertIsNone(answer._pending_power_sums)
+        self.assertEqual(answer.get_power_sums(), get_power_sums(answer.get_dict().items()))
+
+    def test_AdditiveEvents_remove_does_not_carry_power_sums(self):
+        events = AdditiveEvents({1: 2, 2: 3}).combine(Die(4), 2)
+        answer = events.remove(Die(4), 2)
+        self.assertIsNone(answer._power_sums)
+        self.assertIsNone(answer._pending_power_sums)
+        self.assertEqual(answer.get_power_sums(), get_power_sums([(1, 2), (2, 3)]))
+
+    def test_AdditiveEvents_events_view_sparse(self):
+        events = AdditiveEvents({1: 2, 1000: 3})
+        self.assertEqual(events.events_view(), {1: 2, 1000: 3})
+        self.assertRaises(TypeError, setitem, events.events_view(), 1, 1)
+
+    def test_AdditiveEvents_events_view_dense_shares_indexed_values(self):
+        events = AdditiveEvents({1: 2, 3: 3})
+        view = events.events_view()
+        self.assertEqual(view, {1: 2, 3: 3})
+        self.assertIs(view.indexed_values, events.get_indexed_values())
+        self.assertRaises(TypeError, setitem, view, 1, 1)
+
+    def test_AdditiveEvents_combine_does_not_change_events(self):
+        events = AdditiveEvents({1: 2, 2: 3})
+        sparse = AdditiveEvents({1: 2, 1000: 3})
+        events.combine(Die(6), 3)
+        sparse.combine(Die(6), 1)
+        events.combine_by_dictionary(sparse)
+        events.remove(AdditiveEvents({1: 2, 2: 3}))
+        self.assertEqual(events.get_dict(), {1: 2, 2: 3})
+        self.assertEqual(sparse.get_dict(), {1: 2, 1000: 3})
+
+    def test_AdditiveEvents_init_with_indexed_values(self):
+        events = AdditiveEvents(IndexedValues(-1, [1, 0, 2]))
+        self.assertEqual(events.get_dict(), {-1: 1, 1: 2})
+        self.assertEqual(events, AdditiveEvents({-1: 1, 1: 2}))
+
+    def test_AdditiveEvents_init_with_bad_indexed_values_raises_error(self):
+        self.assertRaises(InvalidEventsError, AdditiveEvents, IndexedValues(0, [0, 1]))
+        self.assertRaises(InvalidEventsError, AdditiveEvents, IndexedValues(0, [1, -1, 1]))
+        self.assertRaises(InvalidEventsError, AdditiveEvents, IndexedValues(0, [1, 1.5]))
+
+    def test_AdditiveEvents_init_bad_values_in_dense_dict_raises_error(self):
+        self.assertRaises(InvalidEventsError, AdditiveEvents, {1: 1, 2: -1})
+        self.assertRaises(InvalidEventsError, AdditiveEvents, {1: 1, 2: 1.5})
+        self.assertRaises(InvalidEventsError, AdditiveEvents, {1: 1, 2: "a"})
+
+    def test_AdditiveEvents_sparse_and_dense_behave_the_same(self):
+        sparse = AdditiveEvents({-5: 1, 100: 2})
+        dense = AdditiveEvents({-5: 1, -4: 2})
+        self.assertEqual(str(sparse), "table from -5 to 100")
+        self.assertEqual(str(dense), "table from -5 to -4")
+        self.assertEqual(sparse.combine(dense).get_dict(), {-10: 1, -9: 2, 95: 2, 96: 4})
+        self.assertNotEqual(sparse, dense)
+
     def test_AdditiveEvents__class_method__new(self):
         self.assertEqual(AdditiveEvents.new().get_dict(), {0: 1})
 
@@ -73,11 +241,47 @@ class TestAdditiveEvents(unittest.TestCase):
         new = AdditiveEvents.new().combine_by_indexed_values(to_combine, 1)
         self.assertEqual(new, to_combine)
 
+    def test_AdditiveEvents_combine_by_squaring(self):
+        to_combine = AdditiveEvents({1: 1, 2: 2})
+        new = AdditiveEvents.new().combine_by_squaring(to_combine, 3)
+        self.assertEqual(new.get_dict(), {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_AdditiveEvents_combine_by_packed_int(self):
+        to_combine = AdditiveEvents({1: 1, 2: 2})
+        new = AdditiveEvents.new().combine_by_packed_int(to_combine, 3)
+        self.assertEqual(new.get_dict(), {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_AdditiveEvents_combine_by_numpy(self):
+        to_combine = AdditiveEvents({1: 1, 2: 2})
+        new = AdditiveEvents.new().combine_by_numpy(to_combine, 3)
+        self.assertEqual(new.get_dict(), {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_AdditiveEvents_combine_by_numpy_large_occurrences(self):
+        to_combine = AdditiveEvents({1: 1, 2: 2**100})
+        new = AdditiveEvents.new().combine_by_numpy(to_combine, 2)
+        self.assertEqual(new.get_dict(), {2: 1, 3: 2**101, 4: 2**200})
+
     def test_AdditiveEvents_combine(self):
         to_combine = AdditiveEvents({1: 1, 2: 2})
         new = AdditiveEvents.new().combine(to_combine, 1)
         self.assertEqual(new, to_combine)
 
+    def test_AdditiveEvents_combine_all(self):
+        events_times = [
+            (AdditiveEvents({1: 2, 3: 4}), 3),
+            (Die(6), 2),
+            (WeightedDie({1: 1, 2: 5}), 1),
+        ]
+        expected = AdditiveEvents({-1: 1, 1: 1})
+        for events, times in events_times:
+            expected = expected.combine_by_dictionary(events, times)
+        self.assertEqual(AdditiveEvents({-1: 1, 1: 1}).combine_all(events_times), expected)
+
+    def test_AdditiveEvents_combine_all_nothing_to_combine(self):
+        events = AdditiveEvents({1: 2, 3: 4})
+        self.assertEqual(events.combine_all([]), events)
+        self.assertEqual(events.combine_all([(Die(6), 0)]), events)
+
     def test_AdditiveEvents_combine_works_with_low_total_occurrences_events(self):
         low_ratio_events = AdditiveEvents({1: 1, 2: 1})
         new = AdditiveEvents.new().combine(low_ratio_events, 1)
@@ -158,6 +362,16 @@ class TestAdditiveEvents(unittest.TestCase):
         test = AdditiveEvents.new().combine_by_indexed_values(to_use)
         self.assertEqual(test.get_dict(), {1: 2})
 
+    def test_AdditiveEvents_combine_by_squaring_defaults_to_one_time(self):
+        to_use = AdditiveEvents({1: 2})
+        test = AdditiveEvents.new().combine_by_squaring(to_use)
+        self.assertEqual(test.get_dict(), {1: 2})
+
+    def test_AdditiveEvents_combine_by_packed_int_defaults_to_one_time(self):
+        to_use = AdditiveEvents({1: 2})
+        test = AdditiveEvents.new().combine_by_packed_int(to_use)
+        self.assertEqual(test.get_dict(), {1: 2})
+
     def test_AdditiveEvents_combine_by_flattened_list_defaults_to_one_time(self):
         to_use = AdditiveEvents({1: 2})
         test = AdditiveEvents.new().combine_by_flattened_list(to_use)
@@ -169,5 +383,96 @@ class TestAdditiveEvents(unittest.TestCase):
         self.assertEqual(test, AdditiveEvents.new())
 
 
+class TestTrustedAdditiveEvents(unittest.TestCase):
+    def setUp(self):
+        self.always_verify = get_always_verify()
+        set_always_verify(False)
+
+    def tearDown(self):
+        set_always_verify(self.always_verify)
+
+    def test_get_events_storage_trusted_dense_is_IndexedValues(self):
+        table, values = get_events_storage({1: 1, 2: 2, 3: 3}, trusted=True)
+        self.assertIsNone(table)
+        self.assertEqual(values.get_dict(), {1: 1, 2: 2, 3: 3})
+
+    def test_get_events_storage_trusted_sparse_dict_is_not_copied(self):
+        events = {1: 1, 100: 2}
+        self.assertEqual(get_events_storage(events, trusted=True), (events, None))
+        self.assertIs(get_events_storage(events, trusted=True)[0], events)
+
+    def test_get_events_storage_trusted_mapping_is_a_dict(self):
+        table, values = get_events_storage(MappingProxyType({1: 1, 100: 2}), trusted=True)
+        self.assertEqual(table, {1: 1, 100: 2})
+        self.assertIs(type(table), dict)
+        self.assertIsNone(values)
+
+    def test_trusted_events_skip_verification(self):
+        events = AdditiveEvents(TrustedEvents({1: -1, 100: 1}))
+        self.assertEqual(events.get_dict(), {1: -1, 100: 1})
+        self.assertRaises(InvalidEventsError, AdditiveEvents, {1: -1, 100: 1})
+
+    def test_trusted_events_trust_only_the_events_they_wrap(self):
+        AdditiveEvents(TrustedEvents({1: 1}))
+        self.assertRaises(InvalidEventsError, AdditiveEvents, {1: -1, 100: 1})
+
+    def test_trusted_events_in_subclass_init(self):
+        class Copying(AdditiveEvents):
+            factory_keys = ("get_dict",)
+
+            def __init__(self, events_dict):
+                self.original = events_dict.copy()
+                super(Copying, self).__init__(events_dict)
+
+        events = Copying({1: 1}).combine(Die(2))
+        self.assertIsInstance(events, Copying)
+        self.assertEqual(events.original, {2: 1, 3: 1})
+        self.assertIs(type(events.original), dict)
+
+    def test_trusted_events_passed_on_as_a_new_dict_are_verified(self):
+        class Changing(AdditiveEvents):
+            factory_keys = ("get_dict",)
+
+            def __init__(self, events_dict):
+                super(Changing, self).__init__({key: -1 for key in events_dict})
+
+        self.assertRaises(InvalidEventsError, Changing, TrustedEvents({1: 1}))
+
+    def test_trusted_events_always_verify(self):
+        set_always_verify(True)
+        self.assertRaises(InvalidEventsError, AdditiveEvents, TrustedEvents({1: -1, 100: 1}))
+
+    def test_combine_skips_verification(self):
+        events = AdditiveEvents({1: 1, 2: 1})
+        die_six, die_four = Die(6), Die(4)
+        with mock.patch.object(EventsVerifier, "verify_get_dict") as verify_get_dict:
+            with mock.patch.object(EventsVerifier, "verify_indexed_values") as verify_indexed:
+                answer = events.combine(die_six, 3)
+                events.combine_by_dictionary(die_six)
+                events.combine_by_indexed_values(die_six, 2)
+                events.combine_all([(die_six, 2), (die_four, 1)])
+        self.assertEqual(verify_get_dict.call_count + verify_indexed.call_count, 0)
+        self.assertEqual(answer.get_dict(), events.combine_by_dictionary(die_six, 3).get_dict())
+
+    def test_combine_always_verify(self):
+        set_always_verify(True)
+        events = AdditiveEvents({1: 1, 2: 1})
+        die = Die(6)
+        with mock.patch.object(
+            EventsVerifier, "verify_indexed_values", autospec=True
+        ) as verify_indexed:
+            events.combine(die, 3)
+        self.assertEqual(verify_indexed.call_count, 1)
+
+    def test_remove_is_verified(self):
+        events = AdditiveEvents({1: 1, 2: 1}).combine(Die(6), 2)
+        die = Die(6)
+        with mock.patch.object(
+            EventsVerifier, "verify_indexed_values", autospec=True
+        ) as verify_indexed:
+            events.remove(die, 2)
+        self.assertEqual(verify_indexed.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 
 from dicetables import Die, ModDie, WeightedDie, ModWeightedDie
+from dicetables import dicepool
 from dicetables.dicepool import DicePool
 
 
@@ -18,11 +21,97 @@ def test_dice_pool():
     assert pool.rolls == expected
 
 
+def test_dice_pool_rolls_are_made_on_first_call():
+    with mock.patch.object(dicepool, "ordered_combinations_of_events") as mocked:
+        mocked.return_value = {(1, 1): 1}
+        pool = DicePool(Die(2), 2)
+        mocked.assert_not_called()
+        assert pool.rolls == {(1, 1): 1}
+        assert pool.rolls == {(1, 1): 1}
+    mocked.assert_called_once_with(Die(2), 2, 1)
+
+
+def test_dice_pool_rolls_view_workers():
+    pool = DicePool(Die(4), 3)
+    assert pool.rolls_view(workers=2) == dicepool.ordered_combinations_of_events(Die(4), 3)
+
+
+def test_dice_pool_rolls_view_workers_are_passed_on_and_not_kept():
+    with mock.patch.object(dicepool, "ordered_combinations_of_events") as mocked:
+        mocked.return_value = {(1, 1): 1}
+        DicePool(Die(2), 2).rolls_view(workers=3)
+        DicePool(Die(3), 2).rolls_view()
+    assert mocked.call_args_list == [mock.call(Die(2), 2, 3), mock.call(Die(3), 2, 1)]
+
+
+def test_dice_pool_rolls_view_workers_must_be_gte_one():
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        DicePool(Die(5), 2).rolls_view(workers=0)
+
+
 def test_dice_pool_rolls_is_copy():
     pool = DicePool(Die(3), 4)
     assert pool.rolls is not pool.rolls
 
 
+def test_dice_pool_rolls_view_is_read_only_and_made_once():
+    pool = DicePool(Die(3), 4)
+    with mock.patch.object(
+        dicepool, "ordered_combinations_of_events", wraps=dicepool.ordered_combinations_of_events
+    ) as wrapped:
+        view = pool.rolls_view()
+        assert pool.rolls_view() == view == pool.rolls
+    wrapped.assert_called_once_with(Die(3), 4, 1)
+    with pytest.raises(TypeError):
+        view[(1, 1, 1, 1)] = 2
+
+
+def test_dice_pool_iter_rolls():
+    pool = DicePool(WeightedDie({1: 2, 3: 1, 4: 5}), 3)
+    expected = sorted(DicePool(WeightedDie({1: 2, 3: 1, 4: 5}), 3).rolls.items())
+    assert list(pool.iter_rolls()) == expected
+    pool.rolls_view()
+    assert list(pool.iter_rolls()) == expected
+
+
+def test_dice_pool_iter_rolls_does_not_list_the_rolls():
+    pool = DicePool(Die(6), 30)
+    with mock.patch.object(dicepool, "ordered_combinations_of_events") as mocked:
+        rolls = pool.iter_rolls()
+        assert next(rolls) == ((1,) * 30, 1)
+        assert next(rolls) == ((1,) * 29 + (2,), 30)
+    mocked.assert_not_called()
+
+
+def test_dice_pool_iter_face_counts():
+    pool = DicePool(WeightedDie({1: 2, 3: 1, 4: 5}), 3)
+    expected = [
+        ((1, 1, 1), 8),
+        ((1, 1, 3), 12),
+        ((1, 1, 4), 60),
+        ((1, 3, 3), 6),
+        ((1, 3, 4), 60),
+        ((1, 4, 4), 150),
+        ((3, 3, 3), 1),
+        ((3, 3, 4), 15),
+        ((3, 4, 4), 75),
+        ((4, 4, 4), 125),
+    ]
+    assert list(pool.iter_rolls()) == expected
+    assert list(pool.iter_face_counts()) == [
+        ((roll.count(1), roll.count(3), roll.count(4)), occurrences)
+        for roll, occurrences in expected
+    ]
+
+
+def test_dice_pool_iter_rolls_uses_stored_rolls():
+    pool = DicePool(Die(3), 3)
+    pool.rolls_view()
+    with mock.patch.object(dicepool, "iter_ordered_combinations_of_events") as mocked:
+        assert dict(pool.iter_rolls()) == pool.rolls
+    mocked.assert_not_called()
+
+
 @pytest.mark.parametrize("size", [-1, 0, 1])
 def test_dice_pool_size_must_be_gte_one(size):
     die = Die(2)
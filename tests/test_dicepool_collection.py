@@ -1,15 +1,22 @@
 import unittest
+from operator import setitem
+from unittest import mock
 
-from dicetables import Die, WeightedDie, ModDie
+from dicetables import Die, WeightedDie, ModDie, ModWeightedDie
+from dicetables.dieevents import InternTable, set_intern_table
 from dicetables.dicepool_collection import (
     DicePoolCollection,
     BestOfDicePool,
     WorstOfDicePool,
     UpperMidOfDicePool,
     LowerMidOfDicePool,
+    SelectedOfDicePool,
     generate_events_dict,
+    get_positions,
 )
+from dicetables import dicepool_collection
 from dicetables.dicepool import DicePool
+from dicetables.tools import orderedcombinations
 from dicetables.tools.orderedcombinations import ordered_combinations_of_events
 
 
@@ -33,6 +40,8 @@ class TestBestWorstMid(unittest.TestCase):
         self.assertEqual(test.get_pool(), pool)
         self.assertEqual(test.get_select(), 2)
         self.assertEqual(test.get_dict(), {0: 1})
+        self.assertEqual(test.events_view(), {0: 1})
+        self.assertRaises(TypeError, setitem, test.events_view(), 0, 2)
 
     def test_DicePool_init_raises_value_error_when_select_gt_pool_size(self):
         pool = DicePool(Die(6), 3)
@@ -122,6 +131,12 @@ class TestBestWorstMid(unittest.TestCase):
         self.assertEqual(generate_events_dict(combinations_dict, 1, 2), {1: 3, 2: 4, 3: 3})
         self.assertEqual(generate_events_dict(combinations_dict, 2, 2), {0: 10})
 
+    def test_generate_events_dict_takes_rolls_view_and_iter_rolls(self):
+        pool = DicePool(Die(3), 3)
+        expected = {2: 1, 3: 3, 4: 7, 5: 9, 6: 7}
+        self.assertEqual(generate_events_dict(pool.iter_rolls(), 1, 3), expected)
+        self.assertEqual(generate_events_dict(pool.rolls_view(), 1, 3), expected)
+
     def test_BestOfDicePool_get_dict_edge_case_pool_and_select_equal(self):
         test = BestOfDicePool(DicePool(Die(2), 2), 2)
         self.assertEqual(test.get_dict(), {2: 1, 3: 2, 4: 1})  # same as 2D2
@@ -379,3 +394,152 @@ class TestBestWorstMid(unittest.TestCase):
             LowerMidOfDicePool(DicePool(Die(2), 2), 1).weight_info(),
             "LowerMid 1 of 2D2\ninput_die info:\n    No weights",
         )
+
+    def test_get_dict_matches_enumerating_the_rolls(self):
+        collections = (BestOfDicePool, WorstOfDicePool, UpperMidOfDicePool, LowerMidOfDicePool)
+        for input_die in (Die(4), ModDie(3, -2), ModWeightedDie({1: 2, 4: 1, 7: 3}, -2)):
+            for pool_size in range(1, 6):
+                rolls = DicePool(input_die, pool_size).rolls
+                for select in range(pool_size + 1):
+                    for collection in collections:
+                        test = collection(DicePool(input_die, pool_size), select)
+                        start_at = pool_size - select
+                        if collection is WorstOfDicePool:
+                            start_at = 0
+                        elif collection is UpperMidOfDicePool:
+                            start_at = (pool_size - select + 1) // 2
+                        elif collection is LowerMidOfDicePool:
+                            start_at = (pool_size - select) // 2
+                        expected = generate_events_dict(rolls, start_at, start_at + select)
+                        self.assertEqual(test.get_dict(), expected)
+
+    def test_get_dict_does_not_enumerate_the_rolls(self):
+        with mock.patch.object(orderedcombinations, "combinations_with_replacement") as mocked:
+            test = BestOfDicePool(DicePool(Die(20), 10), 3)
+        mocked.assert_not_called()
+        self.assertEqual(sum(test.get_dict().values()), 20**10)
+        self.assertEqual(min(test.get_dict()), 3)
+        self.assertEqual(max(test.get_dict()), 60)
+
+    def test_large_pools(self):
+        best_five = BestOfDicePool(DicePool(Die(6), 20), 5)
+        self.assertEqual(sum(best_five.get_dict().values()), 6**20)
+        self.assertEqual(best_five.get_dict()[5], 1)
+        fewer_than_five_sixes = 5**20 + 20 * 5**19 + 190 * 5**18 + 1140 * 5**17 + 4845 * 5**16
+        self.assertEqual(best_five.get_dict()[30], 6**20 - fewer_than_five_sixes)
+
+    def test_get_positions(self):
+        self.assertEqual(get_positions(5, [-1, -3, -5]), (0, 2, 4))
+        self.assertEqual(get_positions(5, [3, -2, 1, 1]), (1, 3))
+        self.assertEqual(get_positions(5, []), ())
+
+    def test_get_positions_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            get_positions(5, [5])
+        with self.assertRaises(ValueError):
+            get_positions(5, [-6])
+
+    def test_SelectedOfDicePool_init(self):
+        pool = DicePool(Die(6), 5)
+        test = SelectedOfDicePool(pool, [-1, -3, -5, 0])
+        self.assertEqual(test.get_pool(), pool)
+        self.assertEqual(test.get_selected(), (0, 2, 4))
+        self.assertEqual(test.get_select(), 3)
+        self.assertEqual(test.get_size(), 18)
+        self.assertEqual(test.get_weight(), 0)
+
+    def test_SelectedOfDicePool_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            SelectedOfDicePool(DicePool(Die(6), 5), (1, 5))
+
+    def test_SelectedOfDicePool_get_dict(self):
+        rolls = DicePool(Die(3), 3).rolls
+        test = SelectedOfDicePool(DicePool(Die(3), 3), (0, 2))
+        expected = {}
+        for roll, occurrences in rolls.items():
+            expected[roll[0] + roll[2]] = expected.get(roll[0] + roll[2], 0) + occurrences
+        self.assertEqual(test.get_dict(), expected)
+        self.assertEqual(test.get_dict(), {2: 1, 3: 6, 4: 13, 5: 6, 6: 1})
+
+    def test_SelectedOfDicePool_equals_contiguous_collections(self):
+        pool = DicePool(WeightedDie({1: 2, 2: 1, 5: 3}), 5)
+        self.assertEqual(
+            SelectedOfDicePool(pool, (-1, -2)).get_dict(), BestOfDicePool(pool, 2).get_dict()
+        )
+        self.assertEqual(
+            SelectedOfDicePool(pool, (0, 1, 2)).get_dict(), WorstOfDicePool(pool, 3).get_dict()
+        )
+        self.assertEqual(
+            SelectedOfDicePool(pool, (2, 3)).get_dict(), UpperMidOfDicePool(pool, 2).get_dict()
+        )
+
+    def test_SelectedOfDicePool_nothing_selected(self):
+        self.assertEqual(SelectedOfDicePool(DicePool(Die(2), 3), ()).get_dict(), {0: 8})
+
+    def test_SelectedOfDicePool_str(self):
+        self.assertEqual(
+            str(SelectedOfDicePool(DicePool(Die(6), 5), (-1, 0))), "Selected (0, 4) of 5D6"
+        )
+
+    def test_SelectedOfDicePool_repr(self):
+        self.assertEqual(
+            repr(SelectedOfDicePool(DicePool(Die(6), 5), (-1, 0))),
+            "SelectedOfDicePool(DicePool(Die(6), 5), (0, 4))",
+        )
+
+    def test_SelectedOfDicePool_multiply_str(self):
+        self.assertEqual(
+            SelectedOfDicePool(DicePool(Die(6), 5), (1,)).multiply_str(2),
+            "2(Selected (1,) of 5D6)",
+        )
+
+    def test_SelectedOfDicePool_from_selections(self):
+        pool = DicePool(ModDie(4, -1), 5)
+        selections = [(-1, -3, -5), (0,), (4, 3), (-1, -2), ()]
+        answer = SelectedOfDicePool.from_selections(pool, selections)
+        self.assertEqual(answer, [SelectedOfDicePool(pool, selected) for selected in selections])
+        for test, selected in zip(answer, selections):
+            self.assertEqual(test.get_dict(), SelectedOfDicePool(pool, selected).get_dict())
+            self.assertEqual(repr(test), repr(SelectedOfDicePool(pool, selected)))
+
+    def test_SelectedOfDicePool_from_selections_is_one_pass(self):
+        pool = DicePool(Die(6), 5)
+        with mock.patch(
+            "dicetables.dicepool_collection.get_many_selected_sums",
+            wraps=dicepool_collection.get_many_selected_sums,
+        ) as wrapped:
+            with mock.patch("dicetables.dicepool_collection.get_selected_sums") as single:
+                answer = SelectedOfDicePool.from_selections(pool, [(0,), (4,), (1, 2)])
+        wrapped.assert_called_once_with(pool.die.events_view(), 5, [(0,), (4,), (1, 2)])
+        single.assert_not_called()
+        self.assertEqual(answer[1].get_dict(), BestOfDicePool(pool, 1).get_dict())
+
+    def test_SelectedOfDicePool_from_selections_with_intern_table(self):
+        pool = DicePool(Die(4), 3)
+        set_intern_table(InternTable())
+        try:
+            existing = SelectedOfDicePool(pool, (0, 2))
+            answer = SelectedOfDicePool.from_selections(pool, [(-1, 0), (1,)])
+            self.assertIs(answer[0], existing)
+            self.assertIs(answer[1], SelectedOfDicePool(pool, (1,)))
+            self.assertEqual(answer[1].get_dict(), UpperMidOfDicePool(pool, 1).get_dict())
+        finally:
+            set_intern_table(None)
+
+    def test_SelectedOfDicePool_intern_table_normalizes_selected(self):
+        pool = DicePool(Die(4), 3)
+        set_intern_table(InternTable())
+        try:
+            existing = SelectedOfDicePool(pool, (0, 2))
+            self.assertIs(SelectedOfDicePool(pool, [2, 0]), existing)
+            self.assertIs(SelectedOfDicePool(pool, selected=[-1, 0, 0]), existing)
+            self.assertIs(SelectedOfDicePool.from_selections(pool, [[2, 0]])[0], existing)
+        finally:
+            set_intern_table(None)
+
+    def test_SelectedOfDicePool_from_selections_does_not_leak_events(self):
+        pool = DicePool(Die(3), 3)
+        SelectedOfDicePool.from_selections(pool, [(0,)])
+        self.assertEqual(
+            SelectedOfDicePool(pool, (2,)).get_dict(), BestOfDicePool(pool, 1).get_dict()
+        )
@@ -59,6 +59,14 @@ class TestDiceRecord(unittest.TestCase):
         record = DiceRecord.new()
         self.assertEqual(record.get_dict(), {})
 
+    def test_DiceRecord_record_view(self):
+        record = DiceRecord({Die(6): 2})
+        view = record.record_view()
+        self.assertEqual(view, {Die(6): 2})
+        with self.assertRaises(TypeError):
+            view[Die(4)] = 1
+        self.assertEqual(record, DiceRecord({Die(6): 2}))
+
     def test_DiceRecord_get_dict_empty(self):
         self.assertEqual(DiceRecord({}).get_dict(), {})
 
@@ -194,6 +202,17 @@ class TestDiceRecord(unittest.TestCase):
         record_2 = DiceRecord({Die(2): 2, Die(3): 5})
         self.assertFalse(record_1.__ne__(record_2))
 
+    def test_DiceRecord__hash__equal_records_have_equal_hashes(self):
+        record_1 = DiceRecord.new().add_die(Die(6), 3).add_die(Die(8), 2)
+        record_2 = DiceRecord.new().add_die(Die(8), 2).add_die(Die(6), 3)
+        self.assertEqual(hash(record_1), hash(record_2))
+        self.assertEqual(hash(DiceRecord({Die(6): 3, Die(8): 0})), hash(DiceRecord({Die(6): 3})))
+
+    def test_DiceRecord__hash__as_dict_key(self):
+        records = {DiceRecord({Die(6): 3}): "a", DiceRecord({Die(6): 2}): "b"}
+        self.assertEqual(records[DiceRecord.new().add_die(Die(6), 3)], "a")
+        self.assertNotIn(DiceRecord({Die(6): 1}), records)
+
     def test_DiceRecord__repr__(self):
         record = DiceRecord({Die(2): 2, Die(3): 5})
         possible_reprs = (
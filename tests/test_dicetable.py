@@ -2,11 +2,17 @@
 
 
 import unittest
+from unittest import mock
 
 from dicetables.dicerecord import DiceRecord
 from dicetables.dicetable import DiceTable, DetailedDiceTable
 from dicetables.dieevents import Die, ModWeightedDie, ModDie, StrongDie, Modifier
 from dicetables.eventsbases.eventerrors import InvalidEventsError, DiceRecordError
+from dicetables.eventsbases import integerevents
+from dicetables.eventsbases.integerevents import EventsVerifier
+from dicetables.tools import tablecache
+from dicetables.tools.moments import get_power_sums
+from dicetables.tools.tablecache import TableCache
 
 
 class TestDiceTable(unittest.TestCase):
@@ -189,6 +195,56 @@ class TestDiceTable(unittest.TestCase):
         self.assertEqual(one_d_two.get_dict(), {1: 1, 2: 1})
         self.assertEqual(one_d_two.get_list(), [(Die(2), 1)])
 
+    def test_DiceTable_add_dice_same_as_add_die(self):
+        dice = {
+            Die(6): 3,
+            StrongDie(Die(3), 4): 2,
+            ModWeightedDie({1: 2, 3: 5}, -2): 4,
+            Modifier(3): 1,
+        }
+        start = DiceTable.new().add_die(Die(4), 2)
+        expected = start
+        for die, times in dice.items():
+            expected = expected.add_die(die, times)
+        self.assertEqual(start.add_dice(dice), expected)
+
+    def test_DiceTable_add_dice_empty_and_zero_dice(self):
+        table = DiceTable.new().add_die(Die(4), 2)
+        self.assertEqual(table.add_dice({}), table)
+        self.assertEqual(table.add_dice({Die(6): 0}), table)
+        self.assertEqual(DiceTable.new().add_dice({}), DiceTable.new())
+
+    def test_DiceTable_add_dice_raises_error_for_negative_add(self):
+        self.assertRaises(DiceRecordError, DiceTable.new().add_dice, {Die(6): 2, Die(4): -1})
+
+    def test_DiceTable_add_dice_does_not_change_input(self):
+        dice = {Die(6): 2, Die(4): 1}
+        DiceTable.new().add_dice(dice)
+        self.assertEqual(dice, {Die(6): 2, Die(4): 1})
+
+    def test_DiceTable_add_dice_with_table_cache(self):
+        cache = TableCache()
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            table = DiceTable.new().add_die(Die(6), 2).add_dice({Die(8): 2, Die(6): 1})
+            self.assertEqual(table, DiceTable.new().add_dice({Die(6): 3, Die(8): 2}))
+        self.assertEqual(table, DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2))
+        self.assertEqual(cache.cache_info()[:3], (1, 1, 1))
+
+    def test_DiceTable_from_record(self):
+        record = DiceRecord({Die(6): 3, Modifier(-2): 1, StrongDie(Die(2), 3): 4})
+        table = DiceTable.from_record(record)
+        self.assertEqual(table.dice_data(), record)
+        expected = (
+            DiceTable.new()
+            .add_die(Die(6), 3)
+            .add_die(Modifier(-2))
+            .add_die(StrongDie(Die(2), 3), 4)
+        )
+        self.assertEqual(table, expected)
+
+    def test_DiceTable_from_record_empty(self):
+        self.assertEqual(DiceTable.from_record(DiceRecord.new()), DiceTable.new())
+
     def test_DiceTable_remove_die_raise_error_for_negative_add(self):
         table = DiceTable.new()
         self.assertRaises(DiceRecordError, table.remove_die, Die(5), -2)
@@ -200,6 +256,146 @@ class TestDiceTable(unittest.TestCase):
         events_dict = {2: 1, 3: 2, 4: 3, 5: 4, 6: 3, 7: 2, 8: 1}
         self.assertEqual(two_d_four.get_dict(), events_dict)
 
+    def test_DiceTable_remove_die_removes_correct_dice_from_mixed_table(self):
+        dice = [Die(6), StrongDie(Die(3), 4), ModWeightedDie({1: 2, 3: 5}, -2), Modifier(3)]
+        table = DiceTable.new()
+        for die in dice:
+            table = table.add_die(die, 5)
+        for die in dice:
+            expected = DiceTable.new()
+            for other in dice:
+                expected = expected.add_die(other, 2 if other == die else 5)
+            self.assertEqual(table.remove_die(die, 3), expected)
+
+    def test_DiceTable_remove_die_sparse_table(self):
+        strong = StrongDie(Die(2), 10**6)
+        table = DiceTable.new().add_die(strong, 3).add_die(Die(6), 2)
+        self.assertEqual(
+            table.remove_die(Die(6)), DiceTable.new().add_die(strong, 3).add_die(Die(6))
+        )
+        self.assertEqual(
+            table.remove_die(strong, 2), DiceTable.new().add_die(strong).add_die(Die(6), 2)
+        )
+
+    def test_DiceTable_add_die_with_table_cache_any_order_hits_same_entry(self):
+        cache = TableCache()
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            first = DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2)
+            second = DiceTable.new().add_die(Die(8), 2).add_die(Die(6), 3)
+        self.assertEqual(first, second)
+        self.assertEqual(first, DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2))
+        self.assertEqual(cache.cache_info()[:3], (1, 1, 2))
+
+    def test_DiceTable_remove_die_with_table_cache(self):
+        cache = TableCache()
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            table = DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2)
+            self.assertEqual(table.remove_die(Die(8), 2), DiceTable.new().add_die(Die(6), 3))
+            self.assertEqual(cache.cache_info().hits, 2)
+            self.assertEqual(
+                table.remove_die(Die(6), 1), DiceTable.new().add_die(Die(8), 2).add_die(Die(6), 2)
+            )
+        self.assertEqual(cache.cache_info().entries, 4)
+
+    def test_DiceTable_with_table_cache_uses_own_events_when_they_do_not_match_record(self):
+        with mock.patch.object(tablecache, "_table_cache", TableCache()):
+            DiceTable.new().add_die(Die(2), 1).add_die(Die(2), 1)
+            table = DiceTable({5: 1}, DiceRecord.new())
+            self.assertEqual(table.add_die(Die(2)).get_dict(), {6: 1, 7: 1})
+            self.assertEqual(table.add_dice({Die(2): 2}).get_dict(), {7: 1, 8: 2, 9: 1})
+            self.assertEqual(table.add_die(Die(2)).add_die(Die(2)).get_dict(), {7: 1, 8: 2, 9: 1})
+            hand_built = DiceTable({3: 1, 4: 1}, DiceRecord({Die(2): 2}))
+            self.assertEqual(hand_built.remove_die(Die(2)).get_dict(), {2: 1})
+            new_table = table.add_die(Die(2), 2)
+            self.assertEqual(
+                new_table.get_power_sums(), get_power_sums(new_table.get_dict().items())
+            )
+
+    def test_DiceTable_with_table_cache_new_and_derived_tables_use_cache(self):
+        cache = TableCache()
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            table = DiceTable.new().add_die(Die(6)).add_dice({Die(4): 1}).remove_die(Die(6))
+            DetailedDiceTable.new().switch_boolean().add_die(Die(4))
+        self.assertEqual(cache.cache_info()[:3], (0, 1, 3))
+        self.assertEqual(table, DiceTable.new().add_die(Die(4)))
+
+    def test_DiceTable_hand_built_with_table_cache_does_not_use_cache(self):
+        cache = TableCache()
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            DiceTable({0: 1}, DiceRecord.new()).add_die(Die(6)).add_dice({Die(4): 1})
+            DiceTable({1: 1}, DiceRecord({Die(1): 1})).remove_die(Die(1))
+        self.assertEqual(cache.cache_info().entries, 0)
+
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_DiceTable_add_die_and_add_dice_skip_verification(self):
+        table = DiceTable.new().add_die(Die(6), 2)
+        die_six, die_four = Die(6), Die(4)
+        with mock.patch.object(EventsVerifier, "verify_indexed_values") as verify_indexed:
+            table.add_die(die_six, 3)
+            table.add_dice({die_six: 1, die_four: 2})
+        self.assertEqual(verify_indexed.call_count, 0)
+
+    def test_DiceTable_remove_die_is_verified(self):
+        table = DiceTable.new().add_die(Die(6), 3)
+        die = Die(6)
+        with mock.patch.object(
+            EventsVerifier, "verify_indexed_values", autospec=True
+        ) as verify_indexed:
+            table.remove_die(die, 1)
+        self.assertEqual(verify_indexed.call_count, 1)
+
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_DiceTable_remove_die_from_table_cache_skips_verification(self):
+        cache = TableCache()
+        die = Die(6)
+        with mock.patch.object(tablecache, "_table_cache", cache):
+            table = DiceTable.new().add_die(die, 2).add_die(die, 1)
+            with mock.patch.object(EventsVerifier, "verify_indexed_values") as verify_indexed:
+                table.remove_die(die, 1)
+        self.assertEqual(verify_indexed.call_count, 0)
+
+    def assert_power_sums_are_carried(self, table):
+        with mock.patch("dicetables.additiveevents.get_power_sums") as get_sums:
+            power_sums = table.get_power_sums()
+        self.assertEqual(get_sums.call_count, 0)
+        self.assertEqual(power_sums, get_power_sums(table.get_dict().items()))
+
+    def test_DiceTable_add_die_and_add_dice_carry_power_sums(self):
+        table = DiceTable.new().add_die(Die(6), 3)
+        self.assert_power_sums_are_carried(table)
+        self.assert_power_sums_are_carried(table.add_die(ModDie(4, -2), 2))
+        self.assert_power_sums_are_carried(table.add_dice({Die(6): 1, StrongDie(Die(3), 2): 2}))
+
+    def test_DiceTable_remove_die_carries_power_sums(self):
+        table = DiceTable.new().add_die(Die(6), 3).add_die(ModWeightedDie({1: 2, 3: 1}, 1), 2)
+        self.assert_power_sums_are_carried(table.remove_die(Die(6), 2))
+        self.assert_power_sums_are_carried(table.remove_die(ModWeightedDie({1: 2, 3: 1}, 1), 2))
+
+    def test_DiceTable_carries_power_sums_with_table_cache(self):
+        with mock.patch.object(tablecache, "_table_cache", TableCache()):
+            table = DiceTable.new().add_die(Die(6), 3).add_die(Die(4), 1)
+            self.assert_power_sums_are_carried(table)
+            self.assert_power_sums_are_carried(table.remove_die(Die(4)))
+
+    def test_DiceTable_remove_die_does_not_carry_power_sums_that_do_not_divide(self):
+        table = DiceTable({1: 1, 2: 1, 3: 1}, DiceRecord({Die(2): 1}))
+        table.get_power_sums()
+        new_table = table.remove_die(Die(2))
+        self.assertEqual(new_table.get_power_sums(), get_power_sums(new_table.get_dict().items()))
+
+    def test_DiceTable_add_die_does_not_work_out_power_sums(self):
+        table = DiceTable.new().add_die(Die(6), 3)
+        with mock.patch("dicetables.additiveevents.PendingPowerSums.get") as get_pending:
+            new_table = table.add_die(Die(4)).add_dice({Die(8): 2}).remove_die(Die(6))
+        self.assertEqual(get_pending.call_count, 0)
+        self.assert_power_sums_are_carried(new_table)
+        self.assert_power_sums_are_carried(table)
+
+    def test_DiceTable_hand_built_table_does_not_carry_power_sums(self):
+        table = DiceTable({1: 1, 2: 1}, DiceRecord({Die(2): 1})).add_die(Die(2))
+        self.assertIsNone(table._pending_power_sums)
+        self.assertEqual(table.get_power_sums(), get_power_sums([(2, 1), (3, 2), (4, 1)]))
+
     def test_DiceTable_remove_die_can_remove_all_the_dice(self):
         table = DiceTable.new()
         two_d_four = table.add_die(Die(4), 2)
@@ -322,6 +518,27 @@ class TestDiceTable(unittest.TestCase):
         self.assertEqual(table.get_dict(), is_true.get_dict())
         self.assertEqual(table.get_dict(), is_false.get_dict())
 
+    @mock.patch.object(integerevents, "_always_verify", False)
+    def test_DetailedDiceTable_switch_boolean_skips_verification(self):
+        table = DetailedDiceTable.new().add_die(Die(6), 2)
+        with mock.patch.object(EventsVerifier, "verify_indexed_values") as verify_indexed:
+            table.switch_boolean()
+        self.assertEqual(verify_indexed.call_count, 0)
+
+    def test_DetailedDiceTable_switch_boolean_carries_power_sums(self):
+        table = DetailedDiceTable.new().add_die(Die(6), 2)
+        switched = table.switch_boolean()
+        self.assertIs(switched.get_power_sums(), table.get_power_sums())
+
+    def test_DetailedDiceTable_calc_does_not_read_events_after_add_and_remove_die(self):
+        table = DetailedDiceTable.new().add_die(Die(6), 10)
+        table.calc.mean()
+        with mock.patch("dicetables.additiveevents.get_power_sums") as get_sums:
+            new_table = table.add_die(Die(6)).remove_die(Die(6), 2)
+            self.assertEqual(new_table.calc.mean(), 31.5)
+            self.assertEqual(new_table.calc.stddev(), round((9 * 35 / 12) ** 0.5, 4))
+        self.assertEqual(get_sums.call_count, 0)
+
     def test_DetailedDiceTable_add_die(self):
         table = DetailedDiceTable.new()
         table = table.switch_boolean()
@@ -390,6 +607,19 @@ class TestDiceTable(unittest.TestCase):
         self.assertFalse(table_1.__eq__(table_2))
         self.assertFalse(table_2.__eq__(table_1))
 
+    def test_DetailedDiceTable_add_dice_keeps_calc_includes_zeroes(self):
+        table = DetailedDiceTable.new().switch_boolean().add_dice({Die(6): 2, Modifier(1): 1})
+        self.assertIsInstance(table, DetailedDiceTable)
+        self.assertFalse(table.calc_includes_zeroes)
+        self.assertEqual(
+            table.get_dict(), DiceTable.new().add_die(Die(6), 2).add_die(Modifier(1)).get_dict()
+        )
+
+    def test_DetailedDiceTable_from_record(self):
+        table = DetailedDiceTable.from_record(DiceRecord({Die(6): 2}))
+        self.assertIsInstance(table, DetailedDiceTable)
+        self.assertEqual(table, DetailedDiceTable.new().add_die(Die(6), 2))
+
     def test_DetailedDiceTable__eq__false_by_unrelated_type(self):
         table_1 = DetailedDiceTable({1: 1}, DiceRecord({Die(3): 2, Die(2): 100, Die(1): 2}), True)
         self.assertFalse(table_1.__eq__(2))
@@ -1,7 +1,12 @@
 # pylint: disable=missing-docstring, invalid-name, too-many-public-methods
 
 
+import gc
+import inspect
+import pickle
 import unittest
+import weakref
+from operator import setitem
 
 from dicetables.dieevents import (
     Die,
@@ -17,11 +22,59 @@ from dicetables.dieevents import (
     remove_duplicates,
     calc_roll_and_weight_mods,
     combine_rollweights_with_same_roll_value,
+    InternInfo,
+    InternTable,
+    Interned,
+    get_intern_key,
+    get_intern_table,
+    set_intern_table,
 )
+from dicetables.dicepool import DicePool
+from dicetables.dicepool_collection import BestOfDicePool
 from dicetables.eventsbases.eventerrors import InvalidEventsError
+from dicetables.parser import Parser
 
 
 class TestDieEvents(unittest.TestCase):
+    def get_all_dice(self):
+        return [
+            Modifier(2),
+            Die(2),
+            ModDie(2, 1),
+            WeightedDie({1: 1, 2: 3}),
+            ModWeightedDie({1: 1, 2: 3}, -1),
+            StrongDie(Die(2), 3),
+            Exploding(Die(2)),
+            ExplodingOn(Die(3), (1,)),
+        ]
+
+    def test_all_dice_have_slots(self):
+        for die in self.get_all_dice():
+            self.assertFalse(hasattr(die, "__dict__"), repr(die))
+            self.assertRaises(AttributeError, setattr, die, "other", 1)
+
+    def test_all_dice_can_be_weakly_referenced(self):
+        for die in self.get_all_dice():
+            self.assertIs(weakref.ref(die)(), die)
+
+    def test_all_dice_pickle(self):
+        for die in self.get_all_dice():
+            hash(die)
+            die.get_power_sums()
+            copy = pickle.loads(pickle.dumps(die))
+            self.assertIsNone(copy._hash)
+            self.assertEqual(copy, die)
+            self.assertEqual(hash(copy), hash(die))
+            self.assertEqual(copy.get_dict(), die.get_dict())
+            self.assertEqual(copy.get_power_sums(), die.get_power_sums())
+
+    def test_all_dice_get_dict_is_a_new_copy(self):
+        for die in self.get_all_dice():
+            events = die.get_dict()
+            events[100] = 1
+            self.assertNotIn(100, die.get_dict())
+            self.assertEqual(die.events_view(), die.get_dict())
+
     def test_lt_all_die_types_can_sort_with_each_other(self):
         dice = [
             StrongDie(Die(2), 1),
@@ -360,6 +413,12 @@ class TestDieEvents(unittest.TestCase):
     def test_Exploding_negative_explosions_raises_ValueError(self):
         self.assertRaises(ValueError, Exploding, Die(6), -1)
 
+    def test_Exploding_events_view_is_read_only_and_not_copied(self):
+        die = Exploding(Die(3))
+        self.assertEqual(die.events_view(), die.get_dict())
+        self.assertRaises(TypeError, setitem, die.events_view(), 1, 1)
+        self.assertIsNot(die.get_dict(), die.get_dict())
+
     def test_Exploding_get_dict_on_Die(self):
         die = Exploding(Die(3))
         self.assertEqual(die.get_dict(), {1: 9, 2: 9, 4: 3, 5: 3, 7: 1, 8: 1, 9: 1})
@@ -590,6 +649,11 @@ class TestDieEvents(unittest.TestCase):
         self.assertEqual(answer, {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 7: 1, 8: 1, 9: 1})
         self.assertIsNot(base_dict, answer)
 
+    def test_ExplodingOn_events_view(self):
+        die = ExplodingOn(Die(3), (2, 3))
+        self.assertEqual(die.events_view(), die.get_dict())
+        self.assertRaises(TypeError, setitem, die.events_view(), 1, 1)
+
     def test_ExplodingOn_get_dict_regular_die(self):
         die = ExplodingOn(Die(4), (3, 4), explosions=2)
         level_zero = {1: 16, 2: 16}
@@ -841,5 +905,131 @@ class TestDieEvents(unittest.TestCase):
         self.assertEqual(die, ExplodingOn(Die(2), (1,), 1))
 
 
+class TestInterning(unittest.TestCase):
+    def setUp(self):
+        self.table = InternTable()
+        set_intern_table(self.table)
+
+    def tearDown(self):
+        set_intern_table(None)
+
+    def test_get_intern_key(self):
+        self.assertEqual(get_intern_key(Die, (6,), {}), (Die, ((int, 6),), None))
+        self.assertEqual(
+            get_intern_key(Die, (), {"die_size": 6}),
+            (Die, (), (dict, (((str, "die_size"), (int, 6)),))),
+        )
+        self.assertEqual(
+            get_intern_key(WeightedDie, ({2: 1, 1: 3},), {}),
+            get_intern_key(WeightedDie, ({1: 3, 2: 1},), {}),
+        )
+
+    def test_get_intern_key_keeps_types(self):
+        self.assertNotEqual(get_intern_key(Die, (1,), {}), get_intern_key(Die, (True,), {}))
+        self.assertNotEqual(
+            get_intern_key(ExplodingOn, (Die(3), (1,)), {}),
+            get_intern_key(ExplodingOn, (Die(3), [1]), {}),
+        )
+
+    def test_get_intern_key_unhashable_is_none(self):
+        self.assertIsNone(get_intern_key(Die, ({1},), {}))
+        self.assertIsNone(get_intern_key(WeightedDie, ({1: 1, "a": 2},), {}))
+
+    def test_get_intern_table(self):
+        self.assertIs(get_intern_table(), self.table)
+        set_intern_table(None)
+        self.assertIsNone(get_intern_table())
+        self.assertIsNot(Die(6), Die(6))
+
+    def test_equal_dice_are_the_same_instance(self):
+        self.assertIs(Die(6), Die(6))
+        self.assertIs(ModDie(6, 2), ModDie(6, 2))
+        self.assertIs(WeightedDie({1: 2, 2: 1}), WeightedDie({2: 1, 1: 2}))
+        self.assertIs(Exploding(Die(6), 3), Exploding(Die(6), 3))
+        self.assertIs(ExplodingOn(Die(6), (1, 6)), ExplodingOn(Die(6), (1, 6)))
+        self.assertIs(StrongDie(Modifier(3), 2), StrongDie(Modifier(3), 2))
+        self.assertIs(DicePool(Die(4), 3), DicePool(Die(4), 3))
+        self.assertIs(
+            BestOfDicePool(DicePool(Die(4), 3), 2), BestOfDicePool(DicePool(Die(4), 3), 2)
+        )
+
+    def test_different_dice_are_different_instances(self):
+        self.assertIsNot(Die(6), ModDie(6, 0))
+        self.assertIsNot(Die(6), Die(die_size=6))
+        self.assertEqual(Die(6), Die(die_size=6))
+        self.assertIsNot(Exploding(Die(6)), Exploding(Die(6), 2))
+
+    def test_intern_info(self):
+        first = Die(6)
+        second = Die(6)
+        third = Die(7)
+        self.assertEqual(self.table.intern_info(), InternInfo(hits=1, misses=2, entries=2))
+        self.assertEqual([first, second, third], [Die(6), Die(6), Die(7)])
+
+    def test_unhashable_args_are_not_interned(self):
+        class Thing(object, metaclass=Interned):
+            def __init__(self, values):
+                self.values = values
+
+        self.assertIsNot(Thing([{1}]), Thing([{1}]))
+        thing = Thing([1])
+        self.assertIs(Thing([1]), thing)
+        self.assertEqual(self.table.intern_info(), InternInfo(hits=1, misses=1, entries=1))
+
+    def test_get_intern_args_override_shares_one_key(self):
+        class Thing(object, metaclass=Interned):
+            def __init__(self, values):
+                self.values = values
+
+            @classmethod
+            def _get_intern_args(cls, values):
+                return (tuple(sorted(values)),), {}
+
+        thing = Thing([2, 1])
+        self.assertIs(Thing(values=(1, 2)), thing)
+        self.assertEqual(thing.values, (1, 2))
+
+    def test_get_instance_make(self):
+        made = Die(6)
+        self.assertIs(self.table.get_instance(Die, (7,), {}, lambda: made), made)
+        self.assertIs(Die(7), made)
+        self.assertIs(self.table.get_instance(Die, (7,), {}, lambda: Die(8)), made)
+        unhashable = self.table.get_instance(Die, ({1},), {}, lambda: made)
+        self.assertIs(unhashable, made)
+
+    def test_errors_are_not_interned(self):
+        die = Die(6)
+        self.assertRaises(ValueError, Exploding, die, -1)
+        self.assertRaises(ValueError, Exploding, die, -1)
+        self.assertEqual(self.table.intern_info(), InternInfo(hits=0, misses=3, entries=1))
+
+    def test_instances_are_weakly_held(self):
+        die = Die(6)
+        self.assertEqual(self.table.intern_info().entries, 1)
+        del die
+        gc.collect()
+        self.assertEqual(self.table.intern_info().entries, 0)
+
+    def test_clear(self):
+        die = Die(6)
+        Die(6)
+        self.table.clear()
+        self.assertEqual(self.table.intern_info(), InternInfo(0, 0, 0))
+        self.assertIsNot(Die(6), die)
+
+    def test_signature_is_init_without_self(self):
+        self.assertEqual(str(inspect.signature(ModDie)), "(die_size: int, modifier: int)")
+        self.assertEqual(
+            str(inspect.signature(DicePool)),
+            "(input_die: dicetables.eventsbases.protodie.ProtoDie, pool_size: int)",
+        )
+
+    def test_parser_uses_intern_table(self):
+        parser = Parser()
+        die = parser.parse_die("Exploding(Die(6), 3)")
+        self.assertIs(parser.parse_die("Exploding(Die(6), 3)"), die)
+        self.assertIs(parser.parse_die("Exploding(Die(die_size=6), explosions=3)"), die)
+
+
 if __name__ == "__main__":
     unittest.main()
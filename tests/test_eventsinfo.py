@@ -1,10 +1,15 @@
 # pylint: disable=missing-docstring, invalid-name, too-many-public-methods
 
 
+import types
 import unittest
+from fractions import Fraction
+from math import isnan, log10
+from unittest import mock
 
 import dicetables.eventsinfo as ti
-from dicetables import AdditiveEvents
+from dicetables.tools import numpy_backend
+from dicetables import AdditiveEvents, Die
 
 
 class TestEventsInfo(unittest.TestCase):
@@ -33,10 +38,41 @@ class TestEventsInfo(unittest.TestCase):
         result = ti.safe_true_div(10**1000, 10**1200)
         self.assertAlmostEqual(result, 10**-200, delta=10**-210)
 
+    def test_EventsInformation_get_indexed_values(self):
+        events = AdditiveEvents({1: 2, 3: 4})
+        self.assertIs(
+            ti.EventsInformation(events).get_indexed_values(), events.get_indexed_values()
+        )
+        self.assertIsNone(ti.EventsInformation(AdditiveEvents({1: 2, 300: 4})).get_indexed_values())
+
     def test_EventsInformation_get_items(self):
         test = ti.EventsInformation(AdditiveEvents({1: 2, 3: 4}))
         self.assertEqual(test.get_items(), {1: 2, 3: 4}.items())
 
+    def test_EventsInformation_sparse_and_dense_events_give_same_answers(self):
+        events = [
+            AdditiveEvents({-2: 3, 0: 5, 1: 5}),
+            AdditiveEvents({-2: 3, 0: 5, 1: 5, 100: 2}),
+        ]
+        self.assertIsNotNone(events[0].get_indexed_values())
+        self.assertIsNone(events[1].get_indexed_values())
+        for event in events:
+            info = ti.EventsInformation(event)
+            expected = event.get_dict()
+            self.assertEqual(info.get_items(), expected.items())
+            self.assertEqual(info.events_keys(), sorted(expected))
+            self.assertEqual(info.events_range(), (-2, max(expected)))
+            self.assertEqual(info.total_occurrences(), sum(expected.values()))
+            self.assertEqual(info.all_events(), sorted(expected.items()))
+            self.assertEqual(info.biggest_event(), (0, 5))
+            self.assertEqual(info.biggest_events_all(), [(0, 5), (1, 5)])
+            self.assertEqual(info.get_event(-1), (-1, 0))
+            self.assertEqual(info.get_event(1), (1, 5))
+            self.assertEqual(info.get_range_of_events(-3, 0), [(-3, 0), (-2, 3), (-1, 0)])
+            self.assertEqual(
+                info.all_events_include_zeroes()[:4], [(-2, 3), (-1, 0), (0, 5), (1, 5)]
+            )
+
     def test_EventsInformation_event_keys_removes_zero_occurrences(self):
         test = ti.EventsInformation(AdditiveEvents({0: 1, 1: 0}))
         self.assertEqual(test.events_keys(), [0])
@@ -93,6 +129,88 @@ class TestEventsInfo(unittest.TestCase):
         test = ti.EventsInformation(AdditiveEvents({1: 1, 2: 0, 3: 2}))
         self.assertEqual(test.all_events_include_zeroes(), [(1, 1), (2, 0), (3, 2)])
 
+    def test_EventsInformation_iter_all_events_sparse_and_dense(self):
+        for dictionary in ({-2: 3, 0: 5, 1: 5}, {-2: 3, 0: 5, 1: 5, 100: 2}):
+            info = ti.EventsInformation(AdditiveEvents(dictionary))
+            self.assertNotIsInstance(info.iter_all_events(), list)
+            self.assertNotIsInstance(info.iter_all_events_include_zeroes(), list)
+            self.assertEqual(list(info.iter_all_events()), info.all_events())
+            self.assertEqual(
+                list(info.iter_all_events_include_zeroes()), info.all_events_include_zeroes()
+            )
+
+    def test_EventsInformation_iter_all_events_include_zeroes_mid_zeroes(self):
+        test = ti.EventsInformation(AdditiveEvents({1: 1, 2: 0, 3: 2}))
+        self.assertEqual(list(test.iter_all_events_include_zeroes()), [(1, 1), (2, 0), (3, 2)])
+
+    def test_EventsInformation_get_range_occurrences(self):
+        for dictionary in ({-2: 3, 0: 5, 1: 5}, {-2: 3, 0: 5, 1: 5, 100: 2}):
+            info = ti.EventsInformation(AdditiveEvents(dictionary))
+            for start in range(-4, 103):
+                for stop_before in (start - 1, start, start + 1, start + 3, 200):
+                    expected = sum(
+                        value for key, value in dictionary.items() if start <= key < stop_before
+                    )
+                    self.assertEqual(info.get_range_occurrences(start, stop_before), expected)
+
+    def test_EventsInformation_cdf(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 2, 3: 1}))
+        self.assertEqual([info.cdf(event) for event in range(0, 5)], [0.0, 0.25, 0.75, 1.0, 1.0])
+
+    def test_EventsInformation_survival(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 2, 3: 1}))
+        self.assertEqual(
+            [info.survival(event) for event in range(0, 5)], [1.0, 1.0, 0.75, 0.25, 0.0]
+        )
+
+    def test_EventsInformation_range_probability(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 2, 3: 1}))
+        self.assertEqual(info.range_probability(2, 4), 0.75)
+        self.assertEqual(info.range_probability(-10, 10), 1.0)
+        self.assertEqual(info.range_probability(3, 2), 0.0)
+
+    def test_EventsInformation_cumulative_sparse_events(self):
+        info = ti.EventsInformation(AdditiveEvents({-10: 1, 50: 2, 1000: 1}))
+        self.assertEqual(info.cdf(49), 0.25)
+        self.assertEqual(info.cdf(50), 0.75)
+        self.assertEqual(info.survival(51), 0.25)
+        self.assertEqual(info.range_probability(-10, 1000), 0.75)
+
+    def test_EventsInformation_cumulative_very_large_occurrences(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 10**1000, 2: 3 * 10**1000}))
+        self.assertEqual(info.cdf(1), 0.25)
+        self.assertEqual(info.survival(2), 0.75)
+
+    def test_EventsInformation_quantile(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 2, 3: 0, 4: 1}))
+        self.assertEqual(info.quantile(0), 1)
+        self.assertEqual(info.quantile(0.25), 1)
+        self.assertEqual(info.quantile(0.26), 2)
+        self.assertEqual(info.quantile(0.75), 2)
+        self.assertEqual(info.quantile(0.76), 4)
+        self.assertEqual(info.quantile(1), 4)
+
+    def test_EventsInformation_quantile_sparse_events(self):
+        info = ti.EventsInformation(AdditiveEvents({-10: 1, 50: 2, 1000: 1}))
+        self.assertEqual(info.quantile(0.1), -10)
+        self.assertEqual(info.quantile(0.5), 50)
+        self.assertEqual(info.quantile(0.8), 1000)
+
+    def test_EventsInformation_quantile_is_exact(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 10**100 - 1}))
+        self.assertEqual(info.quantile(Fraction(1, 10**100)), 1)
+        self.assertEqual(info.quantile(Fraction(1, 10**100) + Fraction(1, 10**200)), 2)
+
+    def test_EventsInformation_quantile_raises_error_out_of_bounds(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1}))
+        self.assertRaises(ValueError, info.quantile, -0.1)
+        self.assertRaises(ValueError, info.quantile, 1.1)
+
+    def test_EventsInformation_total_occurrences_after_cumulative(self):
+        info = ti.EventsInformation(AdditiveEvents({1: 1, 2: 2, 3: 1}))
+        info.cdf(1)
+        self.assertEqual(info.total_occurrences(), 4)
+
     def test_EventsInformation_biggest_event_returns_first_biggest_event(self):
         test = ti.EventsInformation(AdditiveEvents({-1: 5, 0: 1, 2: 5}))
         self.assertEqual(test.biggest_event(), (-1, 5))
@@ -174,6 +292,54 @@ class TestEventsInfo(unittest.TestCase):
         )
         self.assertEqual(high_freq.stddev(decimal_place=10), round(2.5**0.5, 10))
 
+    def test_EventsCalculations_stddev_is_exact_at_many_decimal_places(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({0: 1, 1: 2}))
+        self.assertEqual(calculator.stddev(decimal_place=15), round(2**0.5 / 3, 15))
+
+    def test_EventsCalculations_stddev_large_variance(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({-(10**8): 1, 10**8: 1}))
+        self.assertEqual(calculator.stddev(), 10.0**8)
+
+    def test_EventsCalculations_variance(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({2: 1, -2: 1, 1: 1, -1: 1}))
+        self.assertEqual(calculator.variance(), 2.5)
+        calculator = ti.EventsCalculations(AdditiveEvents({0: 1, 1: 2}))
+        self.assertEqual(calculator.variance(), 0.2222)
+        self.assertEqual(calculator.variance(decimal_place=8), 0.22222222)
+
+    def test_EventsCalculations_variance_very_high_occurrences(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({0: 10**500, 1: 2 * 10**500}))
+        self.assertEqual(calculator.variance(decimal_place=10), round(2 / 9, 10))
+
+    def test_EventsCalculations_skewness(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({0: 1, 1: 3}))
+        self.assertEqual(calculator.skewness(), -1.1547)
+        self.assertEqual(calculator.skewness(8), -1.15470054)
+        calculator = ti.EventsCalculations(AdditiveEvents({0: 3 * 10**500, 1: 10**500}))
+        self.assertEqual(calculator.skewness(), 1.1547)
+
+    def test_EventsCalculations_kurtosis(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}))
+        self.assertEqual(calculator.kurtosis(), -1.2686)
+        self.assertEqual(calculator.kurtosis(10), round(-222 / 175, 10))
+
+    def test_EventsCalculations_skewness_and_kurtosis_of_one_event_are_nan(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({3: 10}))
+        self.assertTrue(isnan(calculator.skewness()))
+        self.assertTrue(isnan(calculator.kurtosis()))
+
+    def test_EventsCalculations_moments_use_power_sums_of_events(self):
+        events = AdditiveEvents({1: 2, 2: 5})
+        calculator = ti.EventsCalculations(events)
+        self.assertIs(calculator.get_power_sums(), events.get_power_sums())
+        self.assertIs(ti.EventsCalculations(events).get_power_sums(), events.get_power_sums())
+
+    def test_EventsCalculations_moments_of_a_die(self):
+        calculator = ti.EventsCalculations(Die(6))
+        self.assertEqual(calculator.mean(), 3.5)
+        self.assertEqual(calculator.variance(), round(35 / 12, 4))
+        self.assertEqual(calculator.skewness(), 0.0)
+
     def test_EventsCalculations_full_table_string_include_zeroes_true(self):
         calculator = ti.EventsCalculations(AdditiveEvents({1: 1, 3: 1}), include_zeroes=True)
         self.assertEqual(calculator.full_table_string(), "1: 1\n2: 0\n3: 1\n")
@@ -283,6 +449,30 @@ class TestEventsInfo(unittest.TestCase):
     def test_get_exact_pct_number_big_denominator_big_numerator(self):
         self.assertEqual(ti.get_exact_pct_number(10**499, 10**500), 10.0)
 
+    def test_get_fast_pct_scale_small_total(self):
+        self.assertEqual(ti.get_fast_pct_scale(4), (0, 25.0))
+        self.assertEqual(ti.get_fast_pct_scale(2**64 - 1), (0, 100.0 / (2**64 - 1)))
+
+    def test_get_fast_pct_scale_large_total(self):
+        shift, factor = ti.get_fast_pct_scale(10**500)
+        self.assertEqual((10**500 >> shift).bit_length(), ti.FAST_PCT_BITS)
+        self.assertEqual(factor, 100.0 / (10**500 >> shift))
+
+    def test_get_fast_pct_numbers(self):
+        self.assertEqual(ti.get_fast_pct_numbers([1, 0, 3], 4), [25.0, 0.0, 75.0])
+        self.assertEqual(ti.get_fast_pct_numbers([], 4), [])
+
+    def test_get_fast_pct_numbers_is_good_to_ten_decimal_places(self):
+        for total in (7, 7 * 10**20, 7 * 10**500):
+            numbers = [total // 7, 3 * total // 7, 1, 0, total]
+            answer = ti.get_fast_pct_numbers(numbers, total)
+            for number, pct in zip(numbers, answer):
+                self.assertAlmostEqual(pct, ti.get_exact_pct_number(number, total), places=10)
+
+    def test_get_fast_pct_numbers_accepts_any_sequence(self):
+        self.assertEqual(ti.get_fast_pct_numbers(range(3), 2), [0.0, 50.0, 100.0])
+        self.assertEqual(ti.get_fast_pct_numbers((10**500, 0), 2 * 10**500), [50.0, 0.0])
+
     def test_get_exact_pct_is_exact(self):
         self.assertEqual(ti.get_exact_pct_number(4, 7), 400.0 / 7.0)
         self.assertEqual(ti.get_exact_pct_number(4 * 10**500, 7 * 10**500), 400.0 / 7.0)
@@ -314,6 +504,34 @@ class TestEventsInfo(unittest.TestCase):
         calculator = ti.EventsCalculations(events, False)
         self.assertEqual(calculator.percentage_axes(), [(1, 3), (25.0, 75.0)])
 
+    def test_EventsCalculations_percentage_points_sparse_and_dense_events(self):
+        for dictionary in ({-2: 3, 0: 5, 1: 2}, {-2: 3, 0: 5, 1: 2, 100: 10}):
+            for include_zeroes in (True, False):
+                calculator = ti.EventsCalculations(AdditiveEvents(dictionary), include_zeroes)
+                expected = list(calculator.iter_percentage_points())
+                self.assertEqual(calculator.percentage_points(), expected)
+                self.assertEqual(calculator.percentage_axes(), list(zip(*expected)))
+
+    def test_EventsCalculations_percentage_points_very_high_occurrences(self):
+        events = AdditiveEvents({1: 10**1000, 2: 3 * 10**1000})
+        calculator = ti.EventsCalculations(events)
+        self.assertEqual(calculator.percentage_points(), [(1, 25.0), (2, 75.0)])
+
+    def test_EventsCalculations_percentage_axes_numpy_without_numpy(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({1: 1, 3: 3}))
+        with mock.patch.object(numpy_backend, "numpy", None):
+            self.assertRaises(ImportError, calculator.percentage_axes_numpy)
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_EventsCalculations_percentage_axes_numpy(self):
+        for include_zeroes in (True, False):
+            calculator = ti.EventsCalculations(AdditiveEvents({1: 1, 3: 3}), include_zeroes)
+            events, percentages = calculator.percentage_axes_numpy()
+            expected_events, expected_percentages = calculator.percentage_axes()
+            self.assertEqual(events.tolist(), list(expected_events))
+            self.assertEqual(percentages.tolist(), list(expected_percentages))
+            self.assertEqual(percentages.dtype, numpy_backend.numpy.float64)
+
     def test_EventsCalculations_percentage_axes_is_not_exact(self):
         events = AdditiveEvents({1: 3, 3: 4})
         calculator = ti.EventsCalculations(events, False)
@@ -385,6 +603,78 @@ class TestEventsInfo(unittest.TestCase):
         calculator = ti.EventsCalculations(events)
         self.assertEqual(calculator.log10_axes(-3.0), [(1, 2, 3), (1.0, -3.0, 2.0)])
 
+    def test_EventsCalculations_iter_percentage_points(self):
+        events = AdditiveEvents({1: 1, 3: 3})
+        calculator = ti.EventsCalculations(events)
+        points = calculator.iter_percentage_points()
+        self.assertIsInstance(points, types.GeneratorType)
+        self.assertEqual(list(points), [(1, 25.0), (2, 0.0), (3, 75.0)])
+        self.assertEqual(
+            list(ti.EventsCalculations(events, False).iter_percentage_points()),
+            [(1, 25.0), (3, 75.0)],
+        )
+
+    def test_EventsCalculations_iter_percentage_points_exact(self):
+        events = AdditiveEvents({1: 3, 3: 4})
+        calculator = ti.EventsCalculations(events)
+        self.assertEqual(
+            list(calculator.iter_percentage_points_exact()), calculator.percentage_points_exact()
+        )
+
+    def test_EventsCalculations_iter_log10_points(self):
+        events = AdditiveEvents({1: 10, 3: 100})
+        calculator = ti.EventsCalculations(events)
+        self.assertEqual(list(calculator.iter_log10_points()), [(1, 1.0), (2, -100.0), (3, 2.0)])
+        self.assertEqual(list(calculator.iter_log10_points(-3.0)), [(1, 1.0), (2, -3.0), (3, 2.0)])
+
+    def test_EventsCalculations_iter_points_on_sparse_events(self):
+        events = AdditiveEvents({-5: 1, 1000: 3})
+        calculator = ti.EventsCalculations(events)
+        points = calculator.iter_percentage_points()
+        self.assertEqual([next(points) for _ in range(3)], [(-5, 25.0), (-4, 0.0), (-3, 0.0)])
+        self.assertEqual(len(list(points)), 1003)
+        self.assertEqual(list(calculator.iter_log10_points())[-1], (1000, log10(3)))
+
+    def test_EventsCalculations_percentage_points_chunks(self):
+        events = AdditiveEvents({1: 1, 3: 1, 4: 2})
+        calculator = ti.EventsCalculations(events)
+        self.assertEqual(
+            list(calculator.percentage_points_chunks(3)),
+            [[(1, 25.0), (2, 0.0), (3, 25.0)], [(4, 50.0)]],
+        )
+        self.assertEqual(
+            list(calculator.percentage_points_chunks(4)),
+            [[(1, 25.0), (2, 0.0), (3, 25.0), (4, 50.0)]],
+        )
+        self.assertEqual(
+            list(calculator.percentage_points_chunks(100)), [calculator.percentage_points()]
+        )
+
+    def test_EventsCalculations_percentage_points_exact_chunks(self):
+        events = AdditiveEvents({1: 3, 3: 4})
+        calculator = ti.EventsCalculations(events, False)
+        self.assertEqual(
+            list(calculator.percentage_points_exact_chunks(1)),
+            [[point] for point in calculator.percentage_points_exact()],
+        )
+
+    def test_EventsCalculations_log10_points_chunks(self):
+        events = AdditiveEvents({1: 10, 3: 100})
+        calculator = ti.EventsCalculations(events)
+        self.assertEqual(
+            list(calculator.log10_points_chunks(2, -3.0)), [[(1, 1.0), (2, -3.0)], [(3, 2.0)]]
+        )
+
+    def test_EventsCalculations_chunks_raises_error_for_chunk_size_less_than_one(self):
+        calculator = ti.EventsCalculations(AdditiveEvents({1: 1}))
+        self.assertRaises(ValueError, calculator.percentage_points_chunks, 0)
+        self.assertRaises(ValueError, calculator.log10_points_chunks, -1)
+
+    def test_get_chunks(self):
+        self.assertEqual(list(ti.get_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(ti.get_chunks([], 2)), [])
+        self.assertEqual(list(ti.get_chunks(iter("abc"), 3)), [["a", "b", "c"]])
+
     def test_EventsCalculations_stats_strings_values_not_in_events(self):
         calculator = ti.EventsCalculations(AdditiveEvents({1: 1}))
         expected = ("2", "0", "1", "Infinity", "0")
@@ -550,6 +840,23 @@ class TestEventsInfo(unittest.TestCase):
         events = AdditiveEvents({1: 1, 3: 1})
         self.assertEqual(ti.percentage_points(events, include_zeroes=False), [(1, 50.0), (3, 50.0)])
 
+    def test_iter_percentage_points(self):
+        events = AdditiveEvents({1: 1, 3: 1})
+        self.assertEqual(list(ti.iter_percentage_points(events)), [(1, 50.0), (2, 0), (3, 50.0)])
+        self.assertEqual(
+            list(ti.iter_percentage_points(events, include_zeroes=False)), [(1, 50.0), (3, 50.0)]
+        )
+
+    def test_percentage_points_chunks(self):
+        events = AdditiveEvents({1: 1, 3: 1})
+        self.assertEqual(
+            list(ti.percentage_points_chunks(events, 2)), [[(1, 50.0), (2, 0)], [(3, 50.0)]]
+        )
+        self.assertEqual(
+            list(ti.percentage_points_chunks(events, 2, include_zeroes=False)),
+            [[(1, 50.0), (3, 50.0)]],
+        )
+
     def test_percentage_axes_zeros_true(self):
         events = AdditiveEvents({1: 1, 3: 1})
         self.assertEqual(
@@ -11,6 +11,7 @@ from dicetables.dicepool_collection import (
     WorstOfDicePool,
     UpperMidOfDicePool,
     LowerMidOfDicePool,
+    SelectedOfDicePool,
 )
 from dicetables.dicepool import DicePool
 from dicetables.dieevents import (
@@ -56,6 +57,7 @@ def test_classes_property():
         WorstOfDicePool,
         UpperMidOfDicePool,
         LowerMidOfDicePool,
+        SelectedOfDicePool,
         DicePool,
     }
     assert parser.classes is not parser.classes
@@ -386,6 +388,8 @@ class TestParserWithLimits(object):
         WorstOfDicePool(DicePool(Die(2), 5), 2),
         UpperMidOfDicePool(DicePool(Die(2), 5), 2),
         LowerMidOfDicePool(DicePool(Die(2), 5), 2),
+        SelectedOfDicePool(DicePool(Die(2), 5), (0, 2, 4)),
+        SelectedOfDicePool(DicePool(Die(2), 5), ()),
     ],
     ids=lambda el: repr(el),
 )
@@ -393,6 +397,12 @@ def test_parse_die(die):
     assert Parser().parse_die(repr(die)) == die
 
 
+def test_parse_selected_of_dice_pool_negative_positions():
+    assert Parser().parse_die(
+        "SelectedOfDicePool(DicePool(Die(6), 5), (-1, -3))"
+    ) == SelectedOfDicePool(DicePool(Die(6), 5), (2, 4))
+
+
 def test_die_with_kwargs():
     assert Parser().parse_die("Die(die_size=6)") == Die(6)
 
@@ -0,0 +1,77 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import unittest
+
+from dicetables.tools.bytecache import (
+    DEFAULT_MAX_BYTES,
+    ByteBudgetCache,
+    CacheInfo,
+    get_size_in_bytes,
+)
+
+
+class TestByteBudgetCache(unittest.TestCase):
+    def test_get_size_in_bytes(self):
+        self.assertEqual(
+            get_size_in_bytes({1: 1, 2: 2**100}), (1).__sizeof__() + (2**100).__sizeof__()
+        )
+
+    def test_get_size_in_bytes_sparse_counts_events_not_span(self):
+        self.assertEqual(get_size_in_bytes({0: 1, 10**9: 1}), 2 * (1).__sizeof__())
+
+    def test_init(self):
+        self.assertEqual(
+            ByteBudgetCache().cache_info(), CacheInfo(0, 0, 0, 0, 0, DEFAULT_MAX_BYTES)
+        )
+
+    def test_store_and_get_value(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 4)
+        with cache._lock:
+            self.assertEqual(cache._get_value("a"), 1)
+            self.assertIsNone(cache._get_value("b"))
+        self.assertEqual(cache.cache_info(), CacheInfo(1, 0, 0, 1, 4, 10))
+
+    def test_store_does_not_replace_a_stored_key(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 4)
+        cache._store("a", 2, 5)
+        with cache._lock:
+            self.assertEqual(cache._get_value("a"), 1)
+        self.assertEqual(cache.cache_info().current_bytes, 4)
+
+    def test_store_skips_values_bigger_than_the_budget(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 11)
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 0, 0, 0, 10))
+
+    def test_store_evicts_least_recently_used(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 4)
+        cache._store("b", 2, 4)
+        with cache._lock:
+            cache._get_value("a")
+        cache._store("c", 3, 4)
+        with cache._lock:
+            self.assertIsNone(cache._get_value("b"))
+            self.assertEqual(cache._get_value("a"), 1)
+        self.assertEqual(cache.cache_info(), CacheInfo(2, 0, 1, 2, 8, 10))
+
+    def test_set_max_bytes_evicts(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 4)
+        cache._store("b", 2, 4)
+        cache.set_max_bytes(5)
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 1, 1, 4, 5))
+
+    def test_clear(self):
+        cache = ByteBudgetCache(10)
+        cache._store("a", 1, 4)
+        with cache._lock:
+            cache._get_value("a")
+        cache.clear()
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 0, 0, 0, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from dicetables.tools import calibrate_cost_model as calibrate
+from dicetables.tools.cost_model import DEFAULT_COEFFICIENTS, CostModel
+
+
+class TestCalibrateCostModel(unittest.TestCase):
+    def test_get_sample_problems(self):
+        problems = calibrate.get_sample_problems()
+        self.assertTrue(problems)
+        for main_dict, input_dict, times in problems:
+            self.assertIsInstance(main_dict, dict)
+            self.assertIsInstance(input_dict, dict)
+            self.assertGreater(times, 0)
+
+    def test_time_call(self):
+        seconds = calibrate.time_call(sorted, [3, 2, 1])
+        self.assertGreater(seconds, 0)
+        self.assertLess(seconds, calibrate.MIN_TIMING_SECONDS)
+
+    def test_fit_coefficients_exact_data(self):
+        work_and_seconds = [(work, 2.0 + 0.5 * work) for work in (1, 10, 100, 1000)]
+        overhead, per_unit = calibrate.fit_coefficients(work_and_seconds)
+        self.assertAlmostEqual(overhead, 2.0)
+        self.assertAlmostEqual(per_unit, 0.5)
+
+    def test_fit_coefficients_one_point(self):
+        overhead, per_unit = calibrate.fit_coefficients([(10, 5.0)])
+        self.assertAlmostEqual(overhead + per_unit * 10, 5.0)
+
+    def test_fit_coefficients_never_negative(self):
+        work_and_seconds = [(1, 10.0), (10, 5.0), (100, 1.0)]
+        overhead, per_unit = calibrate.fit_coefficients(work_and_seconds)
+        self.assertGreaterEqual(overhead, 0)
+        self.assertGreaterEqual(per_unit, 0)
+
+    def test_fit_coefficients_zero_work(self):
+        overhead, per_unit = calibrate.fit_coefficients([(0, 2.0), (0, 2.0)])
+        self.assertAlmostEqual(overhead, 2.0)
+        self.assertEqual(per_unit, 0.0)
+
+    def test_calibrate_only_changes_given_methods(self):
+        problems = [({0: 1}, {1: 1, 2: 1}, 2), ({0: 1, 1: 1}, {1: 1, 2: 1, 3: 1}, 3)]
+        model = calibrate.calibrate(methods=["dictionary"], problems=problems)
+        coefficients = model.get_coefficients()
+        self.assertNotEqual(coefficients["dictionary"], DEFAULT_COEFFICIENTS["dictionary"])
+        del coefficients["dictionary"]
+        for method, value in coefficients.items():
+            self.assertEqual(value, DEFAULT_COEFFICIENTS[method])
+
+    def test_calibrate_skips_unusable_problems(self):
+        problems = [({0: 1}, {1: 10**4}, 1)]
+        model = calibrate.calibrate(methods=["flattened_list"], problems=problems)
+        self.assertEqual(model, CostModel.default())
+
+    def test_calibrate_skips_slow_problems(self):
+        problems = [({0: 1}, {1: 1, 2: 1}, 2)]
+        model = calibrate.calibrate(
+            methods=["dictionary"], problems=problems, max_predicted_seconds=0
+        )
+        self.assertEqual(model, CostModel.default())
+
+    def test_main_writes_calibration_file(self):
+        problems = [({0: 1}, {1: 1, 2: 1}, 2), ({0: 1, 1: 1}, {1: 1, 2: 1, 3: 1}, 3)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "new_dir", "cost_model.json")
+            with mock.patch.object(calibrate, "get_sample_problems", return_value=problems):
+                with redirect_stdout(io.StringIO()) as output:
+                    calibrate.main(["--output", path])
+            model = CostModel.load(path)
+        self.assertNotEqual(model, CostModel.default())
+        self.assertIn("saved to {}".format(path), output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+from dicetables.tools import cost_model
+from dicetables.tools.cost_model import (
+    DEFAULT_COEFFICIENTS,
+    WORK_ESTIMATES,
+    CombineFeatures,
+    CostModel,
+    get_combine_features,
+)
+
+
+def get_features(main_size=10, input_size=6, times=3, total_occurrences=6, max_bits=20):
+    return CombineFeatures(
+        main_size=main_size,
+        main_span=main_size,
+        input_size=input_size,
+        input_span=input_size,
+        total_occurrences=total_occurrences,
+        times=times,
+        max_bits=max_bits,
+    )
+
+
+class TestCostModel(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cost_model.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_combine_features(self):
+        features = get_combine_features({0: 1, 1: 2, 5: 1}, {1: 1, 3: 2}, 4)
+        self.assertEqual(
+            features,
+            CombineFeatures(
+                main_size=3,
+                main_span=6,
+                input_size=2,
+                input_span=3,
+                total_occurrences=3,
+                times=4,
+                max_bits=3 + 4 * 2,
+            ),
+        )
+
+    def test_get_combine_features_negative_times_is_zero_times(self):
+        features = get_combine_features({0: 1}, {1: 1}, -2)
+        self.assertEqual(features.times, 0)
+        self.assertEqual(features.max_bits, 1)
+
+    def test_all_methods_have_default_coefficients(self):
+        self.assertEqual(set(WORK_ESTIMATES.keys()), set(DEFAULT_COEFFICIENTS.keys()))
+
+    def test_work_estimates_are_positive(self):
+        features = get_features()
+        for method, estimate in WORK_ESTIMATES.items():
+            self.assertGreater(estimate(features), 0, method)
+
+    def test_work_estimates_increase_with_times(self):
+        for method, estimate in WORK_ESTIMATES.items():
+            self.assertLess(
+                estimate(get_features(times=2)), estimate(get_features(times=20)), method
+            )
+
+    def test_work_estimates_increase_with_max_bits(self):
+        for method in ("dictionary", "indexed_values", "squaring", "packed_int"):
+            estimate = WORK_ESTIMATES[method]
+            self.assertLess(
+                estimate(get_features(max_bits=20)), estimate(get_features(max_bits=2000)), method
+            )
+
+    def test_flattened_list_work_depends_on_total_occurrences(self):
+        self.assertEqual(
+            cost_model.flattened_list_work(get_features(total_occurrences=6)),
+            cost_model.dictionary_work(get_features()),
+        )
+        self.assertLess(
+            cost_model.flattened_list_work(get_features(total_occurrences=6)),
+            cost_model.flattened_list_work(get_features(total_occurrences=60)),
+        )
+
+    def test_dictionary_work_sparse_input_is_less_than_indexed_values_work(self):
+        features = get_combine_features({0: 1}, {0: 1, 100: 1, 1000: 1}, 20)
+        self.assertLess(
+            cost_model.dictionary_work(features), cost_model.indexed_values_work(features) / 10
+        )
+
+    def test_dictionary_work_input_of_size_one(self):
+        features = get_combine_features({0: 1, 1: 1}, {5: 3}, 10)
+        self.assertEqual(cost_model.dictionary_work(features), 10 * 2 * (1 + 22 / 60))
+
+    def test_CostModel_init_uses_defaults_for_missing_methods(self):
+        model = CostModel({"dictionary": (1, 2)})
+        expected = DEFAULT_COEFFICIENTS.copy()
+        expected["dictionary"] = (1.0, 2.0)
+        self.assertEqual(model.get_coefficients(), expected)
+
+    def test_CostModel_init_unknown_method_raises_error(self):
+        self.assertRaises(ValueError, CostModel, {"dictionary": (1, 2), "oops": (1, 2)})
+
+    def test_CostModel_default(self):
+        self.assertEqual(CostModel.default().get_coefficients(), DEFAULT_COEFFICIENTS)
+
+    def test_CostModel_get_coefficients_is_a_copy(self):
+        model = CostModel.default()
+        model.get_coefficients()["dictionary"] = (0, 0)
+        self.assertEqual(model, CostModel.default())
+
+    def test_CostModel_predict(self):
+        model = CostModel({"dictionary": (0.5, 2.0)})
+        features = get_features()
+        self.assertEqual(
+            model.predict("dictionary", features), 0.5 + 2.0 * cost_model.dictionary_work(features)
+        )
+
+    def test_CostModel_get_fastest(self):
+        model = CostModel(
+            {"dictionary": (1.0, 0.0), "squaring": (2.0, 0.0), "packed_int": (0.5, 0.0)}
+        )
+        features = get_features()
+        self.assertEqual(model.get_fastest(features, ["dictionary", "squaring"]), "dictionary")
+        self.assertEqual(model.get_fastest(features, ["dictionary", "packed_int"]), "packed_int")
+
+    def test_CostModel_get_fastest_ties_go_to_first_method(self):
+        model = CostModel({"dictionary": (1.0, 0.0), "squaring": (1.0, 0.0)})
+        features = get_features()
+        self.assertEqual(model.get_fastest(features, ["squaring", "dictionary"]), "squaring")
+        self.assertEqual(model.get_fastest(features, ["dictionary", "squaring"]), "dictionary")
+
+    def test_CostModel_save_and_load(self):
+        model = CostModel({"dictionary": (1e-6, 3e-8), "numpy": (2.5, 0.125)})
+        model.save(self.path)
+        self.assertEqual(CostModel.load(self.path), model)
+
+    def test_CostModel_eq(self):
+        self.assertEqual(CostModel({}), CostModel.default())
+        self.assertNotEqual(CostModel({"packed_int": (1, 1)}), CostModel.default())
+        self.assertNotEqual(CostModel.default(), DEFAULT_COEFFICIENTS)
+
+    def test_CostModel_repr(self):
+        model = CostModel.default()
+        self.assertEqual(repr(model), "CostModel({!r})".format(DEFAULT_COEFFICIENTS))
+
+    def test_get_calibration_path_default(self):
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertEqual(
+                cost_model.get_calibration_path(),
+                os.path.join(os.path.expanduser("~"), ".dicetables", "cost_model.json"),
+            )
+
+    def test_get_calibration_path_environment_variable(self):
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            self.assertEqual(cost_model.get_calibration_path(), self.path)
+
+    def test_load_cost_model_no_file(self):
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            self.assertEqual(cost_model.load_cost_model(), CostModel.default())
+
+    def test_load_cost_model_from_file(self):
+        model = CostModel({"packed_int": (1.0, 2.0)})
+        model.save(self.path)
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            self.assertEqual(cost_model.load_cost_model(), model)
+
+    def test_load_cost_model_bad_file_warns_and_uses_defaults(self):
+        with open(self.path, "w") as file:
+            json.dump({"not a method": [1, 2]}, file)
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(cost_model.load_cost_model(), CostModel.default())
+        self.assertEqual(len(caught), 1)
+
+    def test_load_cost_model_not_json_warns_and_uses_defaults(self):
+        with open(self.path, "w") as file:
+            file.write("oops")
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(cost_model.load_cost_model(), CostModel.default())
+        self.assertEqual(len(caught), 1)
+
+    def test_CostModel_load_raises_value_error_for_bad_coefficients(self):
+        bad_files = [
+            [],
+            [["squaring", [1, 2]]],
+            "squaring",
+            {"squaring": [-5, 0]},
+            {"squaring": [1e-5, -1e-8]},
+            {"squaring": [1, 2, 3]},
+            {"squaring": [1]},
+            {"squaring": {"overhead": 1, "per_unit": 2}},
+            {"squaring": ["1", 2]},
+            {"squaring": [True, 2]},
+            {"squaring": [1, None]},
+        ]
+        for raw in bad_files:
+            with open(self.path, "w") as file:
+                json.dump(raw, file)
+            self.assertRaises(ValueError, CostModel.load, self.path)
+        with open(self.path, "w") as file:
+            file.write('{"squaring": [NaN, 1], "dictionary": [1, Infinity]}')
+        self.assertRaises(ValueError, CostModel.load, self.path)
+
+    def test_CostModel_load_zero_coefficients(self):
+        with open(self.path, "w") as file:
+            json.dump({"squaring": [0, 0.0]}, file)
+        self.assertEqual(CostModel.load(self.path), CostModel({"squaring": (0.0, 0.0)}))
+
+    def test_load_cost_model_not_a_dict_warns_and_uses_defaults(self):
+        with open(self.path, "w") as file:
+            json.dump([], file)
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(cost_model.load_cost_model(), CostModel.default())
+        self.assertEqual(len(caught), 1)
+
+    def test_load_cost_model_negative_coefficients_warns_and_uses_defaults(self):
+        with open(self.path, "w") as file:
+            json.dump({"squaring": [-5, 0]}, file)
+        with mock.patch.dict(os.environ, {cost_model.CALIBRATION_ENV_VARIABLE: self.path}):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(cost_model.load_cost_model(), CostModel.default())
+        self.assertEqual(len(caught), 1)
+
+    def test_get_cost_model_and_set_cost_model(self):
+        original = cost_model.get_cost_model()
+        new_model = CostModel({"packed_int": (0.0, 0.0)})
+        try:
+            cost_model.set_cost_model(new_model)
+            self.assertIs(cost_model.get_cost_model(), new_model)
+        finally:
+            cost_model.set_cost_model(original)
+
+
+if __name__ == "__main__":
+    unittest.main()
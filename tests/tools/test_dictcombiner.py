@@ -3,49 +3,37 @@
 from __future__ import absolute_import
 
 import unittest
+from unittest import mock
 
+from dicetables.tools import cost_model, numpy_backend
+from dicetables.tools.cost_model import WORK_ESTIMATES, CostModel
 from dicetables.tools.dictcombiner import (
     flatten_events_tuples,
-    get_best_key,
-    get_indexed_values_min,
+    is_dense,
     DictCombiner,
 )
 
 
+def model_that_picks(method):
+    coefficients = {key: (1.0, 1.0) for key in WORK_ESTIMATES}
+    coefficients[method] = (0.0, 0.0)
+    return CostModel(coefficients)
+
+
 class TestDictCombiner(unittest.TestCase):
     def setUp(self):
         self.combiner_size_of_one = DictCombiner({1: 1})
+        self.no_numpy = mock.patch.object(numpy_backend, "numpy", None)
+        self.no_numpy.start()
 
     def tearDown(self):
+        self.no_numpy.stop()
         del self.combiner_size_of_one
 
     """
-    the next several tests show how DictCombiner.get_fastest_method works.  The edge cases to choose between
-    methods were determined empirically.  To see how they were derived see time_trials/flattenedlist_timetrials.py
-    and time_trials/indexedvalues_timetrials.py.  Those modules require numpy and matplotlib where the actual
-    project does not.  Before running either one, under "if __name__ == '__main__':" make sure to comment in
-    the UI you wish to use.  The full data set for determining whether to use indexed_values is this:
-        choices = {'flattened_list': {
-        2: {10: 200,  20: 100,  100: 50,  500: 1},
-        4: {2: 100, 5: 50, 10: 10, 20: 1},
-        6: {1: 100, 4: 50, 10: 1},
-        8: {1: 100, 3: 50, 5: 10, 10: 1},
-        20: {1: 50, 3: 10, 4: 1},
-        50: {1: 50, 3: 1},
-        100: {1: 100, 2: 1}
-        },
-        'dictionary': {
-        2: {10: 100, 50: 50, 100: 1},
-        4: {2: 100, 10: 50, 50: 1},
-        6: {2: 50, 10: 10, 20: 1},
-        8: {1: 100, 3: 50, 10: 1},
-        10: {1: 100, 3: 50, 5: 1},
-        20: {1: 50, 3: 10, 4: 1},
-        50: {1: 50, 2: 10, 3: 1},
-        100: {1: 100, 2: 1}
-        }
-    }
-    {'first method': {size of input dict: {combine times: size of Dictcombiner.get_dict(), ...}, ...}, ... }
+    the next several tests show how DictCombiner.get_fastest_method works.  It picks the usable method
+    with the lowest cost in dicetables.tools.cost_model.  The default coefficients of the cost model
+    were measured with dicetables.tools.calibrate_cost_model.
     """
 
     def test_DictCombiner_get_fastest_method_DictCombiner_sized_one_and_one_times_never_picks_indexed_values(
@@ -74,32 +62,31 @@ class TestDictCombiner(unittest.TestCase):
                 accepted_choices,
             )
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_total_occurrences_min(self):
+    def test_DictCombiner_get_usable_combine_methods(self):
         self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method({1: 1}, 1), "flattened_list"
+            sorted(self.combiner_size_of_one.get_usable_combine_methods({1: 1, 2: 1}, 3)),
+            ["dictionary", "flattened_list", "indexed_values", "packed_int", "squaring"],
         )
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_total_occurrences_mid(self):
-        input_dict = dict.fromkeys(range(100), 1)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "flattened_list"
-        )
+    def test_DictCombiner_get_fastest_combine_method_big_dense_input(self):
+        big = DictCombiner({0: 1}).combine_by_packed_int(dict.fromkeys(range(1, 7), 1), 1000)
+        self.assertEqual(DictCombiner(big).get_fastest_combine_method(big, 1), "packed_int")
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_total_occurrences_edge(self):
+    def test_DictCombiner_get_usable_combine_methods_flattened_list_by_total_occurrences_edge(self):
         input_dict = dict.fromkeys(range(9999), 1)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "flattened_list"
+        self.assertIn(
+            "flattened_list", self.combiner_size_of_one.get_usable_combine_methods(input_dict, 1)
         )
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_total_occurrences_over_edge(
+    def test_DictCombiner_get_usable_combine_methods_flattened_list_by_total_occurrences_over_edge(
         self,
     ):
         """
         this cutoff is not for speed but for safety.  as the next test will demonstrate
         """
         input_dict = dict.fromkeys(range(10000), 1)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "dictionary"
+        self.assertNotIn(
+            "flattened_list", self.combiner_size_of_one.get_usable_combine_methods(input_dict, 1)
         )
 
     def test_DictCombiner_demonstrate_why_there_is_cutoff_for_flattened_list(self):
@@ -108,127 +95,57 @@ class TestDictCombiner(unittest.TestCase):
         bad_events = {1: 10**20}
         self.assertRaises((OverflowError, MemoryError), flatten_events_tuples, bad_events)
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_ratio_under(self):
-        input_dict = {1: 1, 2: 1, 3: 2, 4: 1}
-        ratio = sum(input_dict.values()) / float(len(list(input_dict.keys())))
-        self.assertEqual(ratio, 1.25)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "flattened_list"
-        )
+    def test_DictCombiner_get_fastest_method_uses_cost_model(self):
+        for method in ("dictionary", "flattened_list", "indexed_values", "squaring", "packed_int"):
+            with mock.patch.object(cost_model, "_cost_model", model_that_picks(method)):
+                self.assertEqual(
+                    self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 1}, 20), method
+                )
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_ratio_edge(self):
-        input_dict = {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1, 10: 4}
-        ratio = sum(input_dict.values()) / float(len(list(input_dict.keys())))
-        self.assertEqual(ratio, 1.3)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "flattened_list"
-        )
+    def test_DictCombiner_get_fastest_method_only_picks_usable_methods(self):
+        input_dict = dict.fromkeys(range(10000), 1)
+        with mock.patch.object(cost_model, "_cost_model", model_that_picks("flattened_list")):
+            self.assertNotEqual(
+                self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1),
+                "flattened_list",
+            )
+        with mock.patch.object(cost_model, "_cost_model", model_that_picks("numpy")):
+            self.assertNotEqual(
+                self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 1}, 1), "numpy"
+            )
+
+    def test_DictCombiner_get_fastest_method_small_work_skips_cost_model(self):
+        with mock.patch.object(cost_model, "_cost_model", model_that_picks("packed_int")):
+            self.assertEqual(
+                self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 1}, 15),
+                "dictionary",
+            )
+            self.assertEqual(
+                self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 1}, 16),
+                "packed_int",
+            )
 
-    def test_DictCombiner_get_fastest_method_tuple_vs_flattened_by_ratio_over_edge(self):
-        input_dict = dict.fromkeys(range(99), 1)
-        input_dict[100] = 32
-        ratio = sum(input_dict.values()) / float(len(list(input_dict.keys())))
-        self.assertEqual(ratio, 1.31)
+    def test_DictCombiner_get_fastest_method_default_model_small_main_dict_one_time(self):
         self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(input_dict, 1), "dictionary"
+            self.combiner_size_of_one.get_fastest_combine_method({1: 10, 2: 10}, 1), "dictionary"
         )
-
-    def test_DictCombiner_get_fastest_method_part_get_best_key_below_min(self):
-        test_dict = {1: 1, 3: 1, 5: 1}
-        self.assertEqual(get_best_key(-1, test_dict), 1)
-
-    def test_DictCombiner_get_fastest_method_part_get_best_key_above_max(self):
-        test_dict = {1: 1, 3: 1, 5: 1}
-        self.assertEqual(get_best_key(1001, test_dict), 5)
-
-    def test_DictCombiner_get_fastest_method_part_get_best_key_at_value(self):
-        test_dict = {1: 1, 3: 1, 5: 1}
-        self.assertEqual(get_best_key(3, test_dict), 3)
-
-    def test_DictCombiner_get_fastest_method_part_get_best_key_between_values(self):
-        test_dict = {1: 1, 3: 1, 5: 1}
-        self.assertEqual(get_best_key(4, test_dict), 3)
-
-    def test_DictCombiner_get_fastest_method_part_get_indexed_values_min_method_variable(self):
-        """
-        'flattened_list' - 4: {2: 100, 5: 50, 10: 10, 20: 1}
-        'dictionary' - 4: {2: 100, 10: 50, 50: 1}
-        """
-        self.assertEqual(get_indexed_values_min("flattened_list", 4, 10), 10)
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 10), 50)
-
-    def test_DictCombiner_get_fastest_method_part_get_indexed_values_min_uses_get_best_key(self):
-        """
-        'dictionary' - {2: {10: 100, 50: 50, 100: 1},
-                        4: {2: 100, 10: 50, 50: 1}. ...
-        """
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 10), 50)
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 49), 50)
-        self.assertEqual(get_indexed_values_min("dictionary", 5, 10), 50)
-        self.assertEqual(get_indexed_values_min("dictionary", 1, 1), 100)
-        self.assertEqual(get_indexed_values_min("dictionary", 100000, 10000), 1)
-
-    def test_white_box_test_get_indexed_values_min_hardcoded_without_error_because_i_am_a_dumb_ass(
-        self,
-    ):
-        range_of_input_dictionary = [1, 2, 4, 6, 8, 10, 20, 50, 100, 200]
-        range_of_combine_times = [1, 2, 3, 4, 5, 10, 20, 50, 100, 200, 500, 600]
-        for size in range_of_input_dictionary:
-            for times in range_of_combine_times:
-                self.assertIsInstance(get_indexed_values_min("dictionary", size, times), int)
-                self.assertIsInstance(get_indexed_values_min("flattened_list", size, times), int)
-
-    def test_DictCombiner_get_fastest_method_uses_size_cutoff_to_choose_indexed_values__combiner_size_one(
-        self,
-    ):
-        """'flattened_list' - 4: {2: 100, 5: 50, 10: 10, 20: 1}"""
-        sized_twenty = dict.fromkeys(range(20), 1)
-        sized_one_combiner = DictCombiner({1: 1})
-        self.assertEqual(get_indexed_values_min("flattened_list", 4, 20), 1)
         self.assertEqual(
-            sized_one_combiner.get_fastest_combine_method(sized_twenty, 4), "indexed_values"
+            self.combiner_size_of_one.get_fastest_combine_method(dict.fromkeys(range(100), 1), 1),
+            "dictionary",
         )
 
-    def test_DictCombiner_get_fastest_method_uses_size_cutoff_to_choose_other_method__combiner_size_one(
-        self,
-    ):
-        """'dictionary' - 4: {2: 100, 10: 50, 50: 1}"""
-        sized_four = dict.fromkeys(range(4), 2)
-        sized_one_combiner = DictCombiner({1: 1})
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 20), 50)
-        self.assertEqual(sized_one_combiner.get_fastest_combine_method(sized_four, 4), "dictionary")
-
-    def test_DictCombiner_get_fastest_method_uses_size_cutoff_to_choose__dict_combiner_is_below_cutoff(
-        self,
-    ):
-        """'dictionary' - 4: {2: 100, 10: 50, 50: 1}"""
-        sized_four = dict.fromkeys(range(4), 2)
-        sized_five_combiner = DictCombiner(dict.fromkeys(range(5), 1))
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 10), 50)
+    def test_DictCombiner_get_fastest_method_default_model_many_times(self):
         self.assertEqual(
-            sized_five_combiner.get_fastest_combine_method(sized_four, 20), "dictionary"
+            self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 1}, 60), "packed_int"
         )
-
-    def test_DictCombiner_get_fastest_method_uses_size_cutoff_to_choose__dict_combiner_is_at_cutoff(
-        self,
-    ):
-        """'dictionary' - 4: {2: 100, 10: 50, 50: 1}"""
-        sized_four = dict.fromkeys(range(4), 2)
-        sized_fifty_combiner = DictCombiner(dict.fromkeys(range(50), 1))
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 10), 50)
         self.assertEqual(
-            sized_fifty_combiner.get_fastest_combine_method(sized_four, 20), "indexed_values"
+            self.combiner_size_of_one.get_fastest_combine_method(dict.fromkeys(range(100), 1), 2),
+            "packed_int",
         )
 
-    def test_DictCombiner_get_fastest_method_uses_size_cutoff_to_choose__dict_combiner_is_above_cutoff(
-        self,
-    ):
-        """'dictionary' - 4: {2: 100, 10: 50, 50: 1}"""
-        sized_four = dict.fromkeys(range(4), 2)
-        sized_fifty_one_combiner = DictCombiner(dict.fromkeys(range(51), 1))
-        self.assertEqual(get_indexed_values_min("dictionary", 4, 10), 50)
+    def test_DictCombiner_get_fastest_method_default_model_huge_occurrences(self):
         self.assertEqual(
-            sized_fifty_one_combiner.get_fastest_combine_method(sized_four, 20), "indexed_values"
+            self.combiner_size_of_one.get_fastest_combine_method({1: 1, 2: 2**100}, 50), "squaring"
         )
 
     def test_DictCombiner_combine_by_dictionary_identity(self):
@@ -351,25 +268,69 @@ class TestDictCombiner(unittest.TestCase):
         """
         self.assertEqual(new_dict, {3: 1, 4: 6, 5: 12, 6: 8})
 
-    def test_DictCombiner_combine_by_fastest_works_with_flattened_list(self):
-        to_add = {1: 1, 2: 1}
-        identity = DictCombiner({0: 1})
-        self.assertEqual(identity.get_fastest_combine_method(to_add, 1), "flattened_list")
-        self.assertEqual(identity.combine_by_fastest(to_add, 1), to_add)
-
-    def test_DictCombiner_combine_by_fastest_works_with_dictionary(self):
-        to_add = {1: 10, 2: 10}
-        identity = DictCombiner({0: 1})
-        self.assertEqual(identity.get_fastest_combine_method(to_add, 1), "dictionary")
-        self.assertEqual(identity.combine_by_fastest(to_add, 1), to_add)
-
-    def test_DictCombiner_combine_by_fastest_works_with_indexed_values(self):
-        to_add = dict.fromkeys(range(100), 1)
-        answer = self.combiner_size_of_one.combine_by_flattened_list(to_add, 2)
-        self.assertEqual(
-            self.combiner_size_of_one.get_fastest_combine_method(to_add, 2), "indexed_values"
-        )
-        self.assertEqual(self.combiner_size_of_one.combine_by_fastest(to_add, 2), answer)
+    def test_DictCombiner_combine_by_squaring_identity(self):
+        to_combine = {1: 1, 2: 2}
+        new_dict = DictCombiner({0: 1}).combine_by_squaring(to_combine, 1)
+        self.assertEqual(new_dict, to_combine)
+
+    def test_DictCombiner_combine_by_squaring_many_combines(self):
+        to_combine = {1: 1, 2: 2}
+        new_dict = DictCombiner({0: 1}).combine_by_squaring(to_combine, 3)
+        self.assertEqual(new_dict, {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_DictCombiner_combine_by_squaring_input_dict_has_spaces(self):
+        to_combine = {10: 1, 20: 2}
+        new_dict = DictCombiner({0: 1}).combine_by_squaring(to_combine, 3)
+        self.assertEqual(new_dict, {30: 1, 40: 6, 50: 12, 60: 8})
+
+    def test_DictCombiner_combine_by_squaring_complex_DictCombiner(self):
+        to_combine = {1: 1, 2: 2}
+        complex_events = DictCombiner({2: 1, 3: 4, 4: 4})
+        new_dict = complex_events.combine_by_squaring(to_combine, 1)
+        self.assertEqual(new_dict, {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_DictCombiner_combine_by_squaring_zero_times(self):
+        new_dict = DictCombiner({2: 1, 3: 4}).combine_by_squaring({1: 1, 2: 2}, 0)
+        self.assertEqual(new_dict, {2: 1, 3: 4})
+
+    def test_DictCombiner_combine_by_squaring_matches_combine_by_dictionary(self):
+        to_combine = {-1: 2, 1: 1, 4: 3}
+        combiner = DictCombiner({0: 1, 2: 5, 3: 1})
+        for times in range(1, 12):
+            self.assertEqual(
+                combiner.combine_by_squaring(to_combine, times),
+                combiner.combine_by_dictionary(to_combine, times),
+            )
+
+    def test_DictCombiner_combine_by_packed_int_identity(self):
+        to_combine = {1: 1, 2: 2}
+        new_dict = DictCombiner({0: 1}).combine_by_packed_int(to_combine, 1)
+        self.assertEqual(new_dict, to_combine)
+
+    def test_DictCombiner_combine_by_packed_int_zero_times(self):
+        new_dict = DictCombiner({2: 1, 3: 4}).combine_by_packed_int({1: 1, 2: 2}, 0)
+        self.assertEqual(new_dict, {2: 1, 3: 4})
+
+    def test_DictCombiner_combine_by_packed_int_input_dict_has_spaces(self):
+        to_combine = {10: 1, 20: 2}
+        new_dict = DictCombiner({0: 1}).combine_by_packed_int(to_combine, 3)
+        self.assertEqual(new_dict, {30: 1, 40: 6, 50: 12, 60: 8})
+
+    def test_DictCombiner_combine_by_packed_int_matches_combine_by_dictionary(self):
+        to_combine = {-1: 2, 1: 1, 4: 3**100}
+        combiner = DictCombiner({0: 1, 2: 5**50, 3: 1})
+        for times in range(1, 8):
+            self.assertEqual(
+                combiner.combine_by_packed_int(to_combine, times),
+                combiner.combine_by_dictionary(to_combine, times),
+            )
+
+    def test_DictCombiner_combine_by_fastest_works_with_every_method(self):
+        to_add = {1: 1, 2: 2**100, 4: 3}
+        answer = self.combiner_size_of_one.combine_by_dictionary(to_add, 5)
+        for method in WORK_ESTIMATES:
+            with mock.patch.object(cost_model, "_cost_model", model_that_picks(method)):
+                self.assertEqual(self.combiner_size_of_one.combine_by_fastest(to_add, 5), answer)
 
     def test_DictCombiner_remove_by_tuple_list(self):
         """
@@ -407,6 +368,145 @@ class TestDictCombiner(unittest.TestCase):
         new = start.remove_by_tuple_list({10: 1, 20: 2}, 2)
         self.assertEqual(new, {10: 1, 20: 2})
 
+    def test_DictCombiner_remove_by_indexed_values(self):
+        start = DictCombiner({3: 1, 4: 6, 5: 12, 6: 8})
+        self.assertEqual(start.remove_by_indexed_values({1: 1, 2: 2}, 1), {2: 1, 3: 4, 4: 4})
+
+    def test_DictCombiner_remove_by_indexed_values_many_removes(self):
+        start = DictCombiner({3: 1, 4: 6, 5: 12, 6: 8})
+        self.assertEqual(start.remove_by_indexed_values({1: 1, 2: 2}, 3), {0: 1})
+
+    def test_DictCombiner_remove_by_indexed_values_zero_times(self):
+        start = DictCombiner({3: 1, 4: 6, 5: 12, 6: 8})
+        self.assertEqual(start.remove_by_indexed_values({1: 1, 2: 2}, 0), start.get_dict())
+
+    def test_DictCombiner_remove_by_indexed_values_dict_has_spaces_zeroes_not_included(self):
+        start = DictCombiner({30: 1, 40: 6, 50: 12, 60: 8})
+        self.assertEqual(start.remove_by_indexed_values({10: 1, 20: 2}, 2), {10: 1, 20: 2})
+
+    def test_DictCombiner_remove_by_indexed_values_matches_remove_by_tuple_list(self):
+        to_remove_list = [{-1: 2, 1: 1, 4: 3**50}, dict.fromkeys(range(1, 7), 1), {2: 5, 3: 5}]
+        for to_remove in to_remove_list:
+            combined = DictCombiner({0: 1, 2: 5, 3: 1}).combine_by_dictionary(to_remove, 6)
+            for times in range(7):
+                self.assertEqual(
+                    DictCombiner(combined).remove_by_indexed_values(to_remove, times),
+                    DictCombiner(combined).remove_by_tuple_list(to_remove, times),
+                )
+
+    def test_DictCombiner_remove_by_dictionary_matches_remove_by_tuple_list(self):
+        to_remove_list = [
+            {-1: 2, 1: 1, 4: 3**50},
+            dict.fromkeys(range(1, 7), 1),
+            {2: 5, 3: 5},
+            {0: 1},
+            {5: 3},
+            {10**6: 1, 2 * 10**6: 1},
+        ]
+        for to_remove in to_remove_list:
+            combined = DictCombiner({0: 1, 2: 5, 3: 1}).combine_by_dictionary(to_remove, 6)
+            for times in range(7):
+                self.assertEqual(
+                    DictCombiner(combined).remove_by_dictionary(to_remove, times),
+                    DictCombiner({0: 1, 2: 5, 3: 1}).combine_by_dictionary(to_remove, 6 - times),
+                )
+
+    def test_DictCombiner_remove_by_dictionary_sparse(self):
+        three_strong = {3 * 10**6: 1, 4 * 10**6: 3, 5 * 10**6: 3, 6 * 10**6: 1}
+        six = dict.fromkeys(range(1, 7), 1)
+        with_one_six = DictCombiner(three_strong).combine_by_dictionary(six, 1)
+        with_two_sixes = DictCombiner(three_strong).combine_by_dictionary(six, 2)
+        self.assertEqual(DictCombiner(with_two_sixes).remove_by_dictionary(six, 1), with_one_six)
+        self.assertEqual(DictCombiner(with_two_sixes).remove_by_dictionary(six, 2), three_strong)
+
+    def test_DictCombiner_remove_by_fastest(self):
+        dense = DictCombiner({3: 1, 4: 6, 5: 12, 6: 8})
+        sparse = DictCombiner({0: 1, 10: 2, 20: 1})
+        with mock.patch.object(
+            DictCombiner, "remove_by_indexed_values", return_value={}
+        ) as dense_remove:
+            self.assertEqual(dense.remove_by_fastest({1: 1, 2: 2}, 1), {})
+        dense_remove.assert_called_once_with({1: 1, 2: 2}, 1)
+        with mock.patch.object(DictCombiner, "remove_by_indexed_values") as dense_remove:
+            self.assertEqual(sparse.remove_by_fastest({0: 1, 10: 1}, 2), {0: 1})
+        dense_remove.assert_not_called()
+
+
+class TestDictCombinerNumpy(unittest.TestCase):
+    def test_is_dense(self):
+        self.assertTrue(is_dense({1: 1}))
+        self.assertTrue(is_dense({1: 1, 8: 1}))
+        self.assertFalse(is_dense({1: 1, 9: 1}))
+
+    def test_get_max_bits(self):
+        combiner = DictCombiner({1: 1, 2: 2})
+        self.assertEqual(combiner._get_max_bits({1: 1, 2: 1}, 3), 2 + 3 * 2)
+        self.assertLess(sum(combiner.combine_by_dictionary({1: 1, 2: 1}, 3).values()), 2**8)
+
+    def test_combine_by_numpy_without_numpy_falls_back_to_packed_int(self):
+        with mock.patch.object(numpy_backend, "numpy", None):
+            combiner = DictCombiner({0: 1})
+            self.assertNotIn("numpy", combiner.get_usable_combine_methods({1: 1, 2: 1}, 10))
+            with mock.patch.object(combiner, "combine_by_packed_int") as packed_int:
+                combiner.combine_by_numpy({1: 1, 2: 2}, 3)
+            packed_int.assert_called_once_with({1: 1, 2: 2}, 3)
+            self.assertEqual(combiner.combine_by_numpy({1: 1, 2: 2}, 3), {3: 1, 4: 6, 5: 12, 6: 8})
+
+    def test_combine_by_numpy_too_large_for_numpy_falls_back_to_packed_int(self):
+        combiner = DictCombiner({0: 1})
+        with mock.patch.object(combiner, "combine_by_packed_int") as packed_int:
+            combiner.combine_by_numpy({1: 1, 2: 2**40}, 2)
+        packed_int.assert_called_once_with({1: 1, 2: 2**40}, 2)
+        self.assertEqual(combiner.combine_by_numpy({1: 1, 2: 2**40}, 2), {2: 1, 3: 2**41, 4: 2**80})
+
+    def test_combine_by_numpy_zero_times(self):
+        self.assertEqual(DictCombiner({2: 1, 3: 4}).combine_by_numpy({1: 1, 2: 2}, 0), {2: 1, 3: 4})
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_numpy_is_usable_when_answer_fits(self):
+        combiner = DictCombiner({0: 1, 1: 2})
+        self.assertIn("numpy", combiner.get_usable_combine_methods({1: 1, 2: 1}, 1))
+        """max_bits = 2 + times * 2"""
+        self.assertIn("numpy", combiner.get_usable_combine_methods({1: 1, 2: 1}, 31))
+        self.assertNotIn("numpy", combiner.get_usable_combine_methods({1: 1, 2: 1}, 32))
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_get_fastest_method_does_not_pick_numpy_for_sparse_dictionaries(self):
+        with mock.patch.object(cost_model, "_cost_model", model_that_picks("numpy")):
+            combiner = DictCombiner({0: 1, 1: 2})
+            self.assertEqual(combiner.get_fastest_combine_method({1: 1, 2: 1}, 10), "numpy")
+            self.assertNotEqual(combiner.get_fastest_combine_method({1: 1, 100: 1}, 10), "numpy")
+            sparse_combiner = DictCombiner({0: 1, 100: 2})
+            self.assertNotEqual(
+                sparse_combiner.get_fastest_combine_method({1: 1, 2: 1}, 10), "numpy"
+            )
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_combine_by_numpy_uses_numpy(self):
+        combiner = DictCombiner({0: 1})
+        with mock.patch.object(combiner, "combine_by_packed_int") as packed_int:
+            combiner.combine_by_numpy({1: 1, 2: 2}, 3)
+        packed_int.assert_not_called()
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_combine_by_numpy_matches_combine_by_dictionary_up_to_uint64(self):
+        combiner = DictCombiner({-1: 3, 0: 1, 2: 5})
+        to_combine = {1: 1, 2: 2, 4: 1}
+        for times in range(0, 28):
+            self.assertEqual(
+                combiner.combine_by_numpy(to_combine, times),
+                combiner.combine_by_dictionary(to_combine, times),
+            )
+
+    def test_combine_by_fastest_is_exact_for_all_occurrence_sizes(self):
+        combiner = DictCombiner({0: 1, 1: 3})
+        to_combine = {1: 1, 2: 2, 3: 1}
+        for times in (1, 10, 20, 40, 80):
+            self.assertEqual(
+                combiner.combine_by_fastest(to_combine, times),
+                combiner.combine_by_dictionary(to_combine, times),
+            )
+
 
 def input_dict_generator():
     step_by_power_of_two = 1
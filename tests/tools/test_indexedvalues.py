@@ -5,6 +5,7 @@
 from __future__ import absolute_import
 
 import unittest
+from unittest import mock
 
 from dicetables.tools import indexedvalues as iv
 
@@ -75,6 +76,70 @@ class TestIndexedValues(unittest.TestCase):
         test = iv.IndexedValues(1, [2, 0, 3])
         self.assertEqual(test.get_dict(), {1: 2, 3: 3})
 
+    def test_IndexedValues_items(self):
+        test = iv.IndexedValues(-1, [2, 0, 3])
+        self.assertEqual(test.items(), [(-1, 2), (1, 3)])
+
+    def test_IndexedValues_items_include_zeroes(self):
+        test = iv.IndexedValues(-1, [2, 0, 3])
+        self.assertEqual(test.items_include_zeroes(), [(-1, 2), (0, 0), (1, 3)])
+
+    def test_IndexedValues_get_total(self):
+        self.assertEqual(iv.IndexedValues(-1, [2, 0, 3]).get_total(), 5)
+
+    def test_IndexedValues_eq(self):
+        self.assertEqual(iv.IndexedValues(1, [1, 2]), iv.IndexedValues(1, [1, 2]))
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]), iv.IndexedValues(0, [1, 2]))
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]), iv.IndexedValues(1, [1, 3]))
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]), {1: 1, 2: 2})
+
+    def test_IndexedValues_has_slots(self):
+        test = iv.IndexedValues(1, [1, 2])
+        self.assertFalse(hasattr(test, "__dict__"))
+        self.assertRaises(AttributeError, setattr, test, "other", 1)
+
+    def test_IndexedValuesView_is_a_read_only_mapping_of_nonzero_values(self):
+        test = iv.IndexedValues(-1, [2, 0, 3, 1]).view()
+        self.assertEqual(test, {-1: 2, 1: 3, 2: 1})
+        self.assertEqual(len(test), 3)
+        self.assertEqual(list(test), [-1, 1, 2])
+        self.assertEqual(list(test.keys()), [-1, 1, 2])
+        self.assertEqual(list(test.values()), [2, 3, 1])
+        self.assertEqual(list(test.items()), [(-1, 2), (1, 3), (2, 1)])
+        self.assertEqual(test.items(), {-1: 2, 1: 3, 2: 1}.items())
+        self.assertEqual((test[1], test.get(0), test.get(5, "x")), (3, None, "x"))
+        self.assertRaises(KeyError, test.__getitem__, 0)
+        self.assertRaises(KeyError, test.__getitem__, -2)
+        self.assertRaises(KeyError, test.__getitem__, "a")
+        self.assertTrue(1 in test)
+        self.assertFalse(0 in test)
+        with self.assertRaises(TypeError):
+            test[0] = 1
+
+    def test_IndexedValuesView_shares_values(self):
+        indexed_values = iv.IndexedValues(1, [1, 2])
+        test = indexed_values.view()
+        self.assertIs(test.indexed_values, indexed_values)
+        self.assertIs(iv.generate_indexed_values_from_dict(test), indexed_values)
+
+    def test_IndexedValuesView_copy_is_a_new_dict(self):
+        test = iv.IndexedValues(1, [1, 0, 2]).view()
+        copy = test.copy()
+        copy[5] = 5
+        self.assertEqual(copy, {1: 1, 3: 2, 5: 5})
+        self.assertEqual(test, {1: 1, 3: 2})
+
+    def test_IndexedValuesView_eq(self):
+        self.assertEqual(iv.IndexedValues(1, [1, 2]).view(), iv.IndexedValues(1, [1, 2]).view())
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]).view(), iv.IndexedValues(0, [1, 2]).view())
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]).view(), {1: 1})
+        self.assertNotEqual(iv.IndexedValues(1, [1, 2]).view(), [(1, 1), (2, 2)])
+
+    def test_IndexedValuesView_repr(self):
+        self.assertEqual(
+            repr(iv.IndexedValues(1, [1, 0, 2]).view()), "IndexedValuesView({1: 1, 3: 2})"
+        )
+
     def test_indexedValues_get_value_at_key_within_range(self):
         test = iv.IndexedValues(3, [1, 2, 3])
         self.assertEqual(test.get_value_at_key(4), 2)
@@ -166,6 +231,177 @@ class TestIndexedValues(unittest.TestCase):
         """
         self.assert_indexed_values(test.combine_with_dictionary(input_dict), 4, [2, 5, 4, 1])
 
+    def test_convolve(self):
+        self.assertEqual(iv.convolve([1, 2, 1], [2, 1]), [2, 5, 4, 1])
+
+    def test_convolve_zeroes_in_list(self):
+        self.assertEqual(iv.convolve([2, 0, 1], [1, 2, 1]), [2, 4, 3, 2, 1])
+
+    def test_convolve_order_does_not_matter(self):
+        self.assertEqual(iv.convolve([1, 2], [1, 0, 0, 3]), iv.convolve([1, 0, 0, 3], [1, 2]))
+
+    def test_pack_list_and_unpack_int(self):
+        packed = iv.pack_list([1, 0, 255, 3], 1)
+        self.assertEqual(packed, 1 + 255 * 256**2 + 3 * 256**3)
+        self.assertEqual(iv.unpack_int(packed, 1, 4), [1, 0, 255, 3])
+
+    def test_unpack_int_includes_high_zeroes(self):
+        self.assertEqual(iv.unpack_int(iv.pack_list([1, 2, 0, 0], 2), 2, 4), [1, 2, 0, 0])
+
+    def test_convolve_by_packed_int(self):
+        self.assertEqual(iv.convolve_by_packed_int([1, 2, 1], [2, 1]), [2, 5, 4, 1])
+
+    def test_convolve_by_packed_int_zeroes_in_list(self):
+        self.assertEqual(iv.convolve_by_packed_int([2, 0, 1], [1, 2, 1]), [2, 4, 3, 2, 1])
+
+    def test_convolve_by_packed_int_values_that_fill_a_slot(self):
+        first = [255, 255, 255]
+        second = [255, 255]
+        self.assertEqual(iv.convolve_by_packed_int(first, second), iv.convolve(first, second))
+
+    def test_convolve_by_packed_int_huge_values(self):
+        first = [3**200, 0, 7**150, 1, 2**500]
+        second = [5**300, 11**100, 1]
+        self.assertEqual(iv.convolve_by_packed_int(first, second), iv.convolve(first, second))
+
+    def test_IndexedValues_combine_with_indexed_values_other_convolution(self):
+        test = iv.IndexedValues(5, [1, 2, 1])
+        other = iv.IndexedValues(-1, [2, 1])
+        combined = test.combine_with_indexed_values(other, iv.convolve_by_packed_int)
+        self.assert_indexed_values(combined, 4, [2, 5, 4, 1])
+
+    def test_IndexedValues_combine_with_indexed_values(self):
+        test = iv.IndexedValues(5, [1, 2, 1])
+        other = iv.IndexedValues(-1, [2, 1])
+        self.assert_indexed_values(test.combine_with_indexed_values(other), 4, [2, 5, 4, 1])
+
+    def test_IndexedValues_power_zero_is_identity(self):
+        self.assert_indexed_values(iv.IndexedValues(5, [1, 2, 1]).power(0), 0, [1])
+
+    def test_IndexedValues_power_one(self):
+        self.assert_indexed_values(iv.IndexedValues(5, [1, 2, 1]).power(1), 5, [1, 2, 1])
+
+    def test_IndexedValues_power_matches_combine_with_dictionary(self):
+        test = iv.IndexedValues(1, [1, 2, 0, 3])
+        expected = iv.IndexedValues(0, [1])
+        for times in range(1, 10):
+            expected = expected.combine_with_dictionary(test.get_dict())
+            power = test.power(times)
+            self.assert_indexed_values(power, expected.start_index, expected.raw_values)
+
+    def test_get_uniform_step(self):
+        self.assertEqual(iv.get_uniform_step([1]), 1)
+        self.assertEqual(iv.get_uniform_step([3, 3, 3]), 1)
+        self.assertEqual(iv.get_uniform_step([2, 0, 0, 2, 0, 0, 2]), 3)
+        self.assertEqual(iv.get_uniform_step([2, 0, 2]), 2)
+
+    def test_get_uniform_step_not_uniform(self):
+        self.assertEqual(iv.get_uniform_step([1, 2]), 0)
+        self.assertEqual(iv.get_uniform_step([3, 3, 0, 3]), 0)
+        self.assertEqual(iv.get_uniform_step([3, 0, 3, 3]), 0)
+        self.assertEqual(iv.get_uniform_step([3, 0, 3, 0, 0, 3]), 0)
+        self.assertEqual(iv.get_uniform_step([3, 0, 3, 0, 4]), 0)
+
+    def test_deconvolve(self):
+        self.assertEqual(iv.deconvolve([2, 5, 4, 1], [2, 1]), [1, 2, 1])
+        self.assertEqual(iv.deconvolve([2, 5, 4, 1], [1, 2, 1]), [2, 1])
+
+    def test_deconvolve_single_values(self):
+        self.assertEqual(iv.deconvolve([12], [4]), [3])
+        self.assertEqual(iv.deconvolve([4, 8, 12], [4]), [1, 2, 3])
+        self.assertEqual(iv.deconvolve([4, 8, 12], [1, 2, 3]), [4])
+
+    def test_deconvolve_zeroes_in_list(self):
+        self.assertEqual(iv.deconvolve([2, 4, 3, 2, 1], [1, 2, 1]), [2, 0, 1])
+        self.assertEqual(iv.deconvolve([2, 4, 3, 2, 1], [2, 0, 1]), [1, 2, 1])
+
+    def test_deconvolve_is_inverse_of_convolve_for_huge_values(self):
+        first = [3**200, 0, 7**150, 1, 2**500]
+        second = [5**300, 11**100, 1]
+        product = iv.convolve(first, second)
+        self.assertEqual(iv.deconvolve(product, second), first)
+        self.assertEqual(iv.deconvolve(product, first), second)
+
+    def test_deconvolve_by_ones(self):
+        product = iv.convolve([1, 2, 0, 3, 1], [1, 1, 1])
+        self.assertEqual(iv.deconvolve_by_ones(product, 3), [1, 2, 0, 3, 1])
+
+    def test_deconvolve_by_ones_width_one(self):
+        self.assertEqual(iv.deconvolve_by_ones([1, 2, 3], 1), [1, 2, 3])
+
+    def test_deconvolve_by_ones_width_larger_than_answer(self):
+        product = iv.convolve([3, 1], [1] * 10)
+        self.assertEqual(iv.deconvolve_by_ones(product, 10), [3, 1])
+        self.assertEqual(iv.deconvolve_by_ones([1] * 10, 10), [1])
+
+    def test_deconvolve_by_ones_with_step(self):
+        product = iv.convolve([1, 2, 0, 3, 1], [1, 0, 0, 1, 0, 0, 1])
+        self.assertEqual(iv.deconvolve_by_ones(product, 3, 3), [1, 2, 0, 3, 1])
+
+    def test_deconvolve_by_ones_with_step_many_times(self):
+        divisor = [1, 0, 1, 0, 1, 0, 1]
+        product = iv.IndexedValues(0, divisor).power(10).raw_values
+        expected = iv.IndexedValues(0, divisor).power(9).raw_values
+        self.assertEqual(iv.deconvolve_by_ones(product, 4, 2), expected)
+
+    def test_deconvolve_long_divisor(self):
+        divisor = list(range(1, 31))
+        product = iv.convolve([5, 0, 3**40, 1], divisor)
+        self.assertEqual(iv.deconvolve(product, divisor), [5, 0, 3**40, 1])
+
+    def test_deconvolve_by_ones_matches_deconvolve(self):
+        ones = [1] * 6
+        product = iv.IndexedValues(0, ones).power(20).raw_values
+        self.assertEqual(iv.deconvolve_by_ones(product, 6), iv.deconvolve(product, ones))
+
+    def test_IndexedValues_remove_indexed_values_zero_times(self):
+        test = iv.IndexedValues(5, [1, 2, 1])
+        self.assert_indexed_values(
+            test.remove_indexed_values(iv.IndexedValues(1, [1, 1]), 0), 5, [1, 2, 1]
+        )
+
+    def test_IndexedValues_remove_indexed_values_is_inverse_of_combine(self):
+        test = iv.IndexedValues(5, [1, 2, 1])
+        other = iv.IndexedValues(-1, [2, 1])
+        combined = test.combine_with_indexed_values(other)
+        self.assert_indexed_values(combined.remove_indexed_values(other), 5, [1, 2, 1])
+        self.assert_indexed_values(combined.remove_indexed_values(test), -1, [2, 1])
+
+    def test_IndexedValues_remove_indexed_values_many_times(self):
+        start = iv.IndexedValues(-2, [1, 0, 3])
+        other = iv.IndexedValues(2, [4, 0, 1, 7])
+        combined = start.combine_with_indexed_values(other.power(7))
+        for times in range(8):
+            expected = start.combine_with_indexed_values(other.power(7 - times))
+            removed = combined.remove_indexed_values(other, times)
+            self.assert_indexed_values(removed, expected.start_index, expected.raw_values)
+
+    def test_IndexedValues_remove_indexed_values_uniform_many_times(self):
+        start = iv.IndexedValues(-2, [1, 0, 3])
+        other = iv.IndexedValues(1, [3, 3, 3, 3])
+        combined = start.combine_with_indexed_values(other.power(7))
+        for times in range(8):
+            expected = start.combine_with_indexed_values(other.power(7 - times))
+            removed = combined.remove_indexed_values(other, times)
+            self.assert_indexed_values(removed, expected.start_index, expected.raw_values)
+
+    def test_IndexedValues_remove_indexed_values_uniform_with_step_many_times(self):
+        start = iv.IndexedValues(-2, [1, 0, 3])
+        other = iv.IndexedValues(3, [2, 0, 0, 2, 0, 0, 2])
+        combined = start.combine_with_indexed_values(other.power(7))
+        for times in range(8):
+            expected = start.combine_with_indexed_values(other.power(7 - times))
+            removed = combined.remove_indexed_values(other, times)
+            self.assert_indexed_values(removed, expected.start_index, expected.raw_values)
+
+    def test_IndexedValues_remove_indexed_values_uniform_uses_deconvolve_by_ones(self):
+        other = iv.IndexedValues(1, [1, 1, 1, 1, 1, 1])
+        combined = other.power(10)
+        with mock.patch.object(iv, "deconvolve", side_effect=AssertionError):
+            removed = combined.remove_indexed_values(other, 4)
+        expected = other.power(6)
+        self.assert_indexed_values(removed, expected.start_index, expected.raw_values)
+
 
 if __name__ == "__main__":
     unittest.main()
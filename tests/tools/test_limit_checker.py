@@ -12,7 +12,7 @@ from dicetables import (
 )
 from dicetables.dicepool import DicePool
 from dicetables.tools.limit_checker import NoOpLimitChecker, LimitChecker, LimitsError
-from dicetables.tools.orderedcombinations import count_unique_combination_keys
+from dicetables.tools.orderstatistics import count_selected_sums_steps
 
 
 class TestNoOpLimitChecker(object):
@@ -44,16 +44,8 @@ class TestLimitChecker(object):
         assert checker.max_dice_pool_calls == 2
         assert checker.max_size == 500
         assert checker.max_explosions == 10
-        assert checker.max_dice_pool_combinations_per_dict_size == {
-            2: 600,
-            3: 8700,
-            4: 30000,
-            5: 55000,
-            6: 70000,
-            7: 100000,
-            12: 200000,
-            30: 250000,
-        }
+        assert checker.max_dice_pool_size == 500
+        assert checker.max_dice_pool_steps == 750000
 
     @pytest.mark.parametrize("dice, raises_error", [(2, False), (3, False), (4, True)])
     def test_assert_number_of_calls_within_limits_dice_limit_three(self, dice, raises_error):
@@ -150,40 +142,30 @@ class TestLimitChecker(object):
         checker.assert_dice_pool_within_limits(bound_args)
 
     @pytest.mark.parametrize(
-        "die_size,die_pool,max_combinations",
-        [
-            (2, 599, 600),
-            (3, 130, 8700),
-            (4, 54, 30000),
-            (5, 31, 55000),
-            (6, 21, 70000),
-            (7, 16, 100000),
-            (12, 9, 200000),
-            (30, 4, 250000),
-            (100, 3, 250000),
-        ],
+        "die_size,max_pool_size",
+        [(1, 500), (2, 500), (3, 500), (4, 160), (6, 88), (12, 44), (20, 29), (100, 8), (500, 2)],
     )
-    def test_assert_dice_pool_within_limits_on_dice_pool(
-        self, die_size, die_pool, max_combinations
-    ):
-        """
-        self.max_dice_pool_combinations_per_dict_size = {
-            2: 600, 3: 8700, 4: 30000, 5: 55000, 6: 70000,
-            7: 100000, 12: 200000, 30: 250000
-        }
-        """
+    def test_assert_dice_pool_within_limits_on_dice_pool(self, die_size, max_pool_size):
         checker = LimitChecker()
-        bound_args_passing = signature(DicePool).bind(Die(die_size), die_pool)
-        bound_args_failing = signature(DicePool).bind(Die(die_size), die_pool + 1)
-        assert count_unique_combination_keys(Die(die_size), die_pool) <= max_combinations
+        bound_args_passing = signature(DicePool).bind(Die(die_size), max_pool_size)
+        bound_args_failing = signature(DicePool).bind(Die(die_size), max_pool_size + 1)
         checker.assert_dice_pool_within_limits(bound_args_passing)
 
-        assert count_unique_combination_keys(Die(die_size), die_pool + 1) > max_combinations
-        with pytest.raises(LimitsError):
+        with pytest.raises(
+            LimitsError, match="largest permitted pool_size is {}".format(max_pool_size)
+        ):
             checker.assert_dice_pool_within_limits(bound_args_failing)
 
-    def test_assert_dice_pool_within_limits_pool_of_one_fails(self):
+    def test_assert_dice_pool_within_limits_max_dice_pool_steps(self):
+        checker = LimitChecker()
+        checker.max_dice_pool_steps = count_selected_sums_steps(Die(6).get_dict(), 10)
+        checker.assert_dice_pool_within_limits(signature(DicePool).bind(Die(6), 10))
+        with pytest.raises(LimitsError, match="largest permitted pool_size is 10"):
+            checker.assert_dice_pool_within_limits(signature(DicePool).bind(Die(6), 11))
+
+    def test_assert_dice_pool_within_limits_max_dice_pool_size(self):
         checker = LimitChecker()
-        bound_args = signature(DicePool).bind(Die(1), 1)
-        with pytest.raises(LimitsError):
-            checker.assert_dice_pool_within_limits(bound_args)
+        checker.max_dice_pool_size = 3
+        checker.assert_dice_pool_within_limits(signature(DicePool).bind(Die(2), 3))
+        with pytest.raises(LimitsError, match="largest permitted pool_size is 3"):
+            checker.assert_dice_pool_within_limits(signature(DicePool).bind(Die(2), 4))
@@ -0,0 +1,58 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import unittest
+from types import MappingProxyType
+
+from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.indexedvalues import IndexedValues
+from dicetables.tools.mergeplanner import get_merge_plan, get_span, merge_dictionaries
+
+
+class TestMergePlanner(unittest.TestCase):
+    def test_get_span_of_view(self):
+        self.assertEqual(get_span(IndexedValues(-2, [1, 0, 3]).view()), 3)
+
+    def test_merge_dictionaries_with_views(self):
+        views = [IndexedValues(1, [1, 1]).view(), MappingProxyType({0: 1, 2: 1})]
+        answer = merge_dictionaries(views)
+        self.assertEqual(answer, {1: 1, 2: 1, 3: 1, 4: 1})
+        self.assertIsInstance(answer, dict)
+        self.assertIsInstance(merge_dictionaries(views[:1]), dict)
+
+    def test_get_span(self):
+        self.assertEqual(get_span({3: 1}), 1)
+        self.assertEqual(get_span({-2: 1, 5: 3}), 8)
+
+    def test_get_merge_plan_one_dictionary(self):
+        self.assertEqual(get_merge_plan([5]), [])
+
+    def test_get_merge_plan_equal_spans_is_balanced(self):
+        self.assertEqual(get_merge_plan([4, 4, 4, 4]), [(0, 1), (2, 3), (4, 5)])
+
+    def test_get_merge_plan_merges_smallest_first(self):
+        self.assertEqual(get_merge_plan([100, 2, 3, 50]), [(1, 2), (4, 3), (5, 0)])
+
+    def test_get_merge_plan_ties_go_to_earliest(self):
+        self.assertEqual(get_merge_plan([3, 1, 3]), [(1, 0), (2, 3)])
+
+    def test_merge_dictionaries_one_dictionary_is_a_copy(self):
+        dictionary = {1: 2, 3: 4}
+        answer = merge_dictionaries([dictionary])
+        self.assertEqual(answer, dictionary)
+        self.assertIsNot(answer, dictionary)
+
+    def test_merge_dictionaries(self):
+        dictionaries = [{1: 1, 2: 1}, {0: 3}, {-5: 1, 5: 2**100}, {1: 1, 2: 1, 3: 1, 4: 1}, {0: 1}]
+        expected = {0: 1}
+        for dictionary in dictionaries:
+            expected = DictCombiner(expected).combine_by_dictionary(dictionary, 1)
+        self.assertEqual(merge_dictionaries(dictionaries), expected)
+
+    def test_merge_dictionaries_does_not_change_input(self):
+        dictionaries = [{1: 1, 2: 1}, {1: 1}]
+        merge_dictionaries(dictionaries)
+        self.assertEqual(dictionaries, [{1: 1, 2: 1}, {1: 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods
+
+import unittest
+from decimal import Context, Decimal
+from fractions import Fraction
+from unittest import mock
+
+from dicetables.tools import moments
+from dicetables.tools.moments import PowerSums
+
+
+def get_brute_force_central_moment(dictionary, power):
+    total = sum(dictionary.values())
+    mean = Fraction(sum(event * occurrences for event, occurrences in dictionary.items()), total)
+    return (
+        sum((event - mean) ** power * occurrences for event, occurrences in dictionary.items())
+        / total
+    )
+
+
+class TestMoments(unittest.TestCase):
+    def test_get_power_sums(self):
+        answer = moments.get_power_sums([(-2, 3), (0, 5), (1, 1), (3, 2)])
+        self.assertEqual(answer, PowerSums(11, -6 + 1 + 6, 12 + 1 + 18, -24 + 1 + 54, 48 + 1 + 162))
+
+    def test_get_power_sums_empty(self):
+        self.assertEqual(moments.get_power_sums([]), PowerSums(0, 0, 0, 0, 0))
+
+    def test_get_power_sums_is_exact(self):
+        answer = moments.get_power_sums([(10, 10**500), (-1, 1)])
+        self.assertEqual(
+            answer, PowerSums(10**500 + 1, 10**501 - 1, 10**502 + 1, 10**503 - 1, 10**504 + 1)
+        )
+
+    def test_combine_power_sums(self):
+        first = {-1: 2, 0: 1, 3: 4}
+        second = {1: 1, 2: 5}
+        combined = {}
+        for event, occurrences in first.items():
+            for other_event, other_occurrences in second.items():
+                key = event + other_event
+                combined[key] = combined.get(key, 0) + occurrences * other_occurrences
+        self.assertEqual(
+            moments.combine_power_sums(
+                moments.get_power_sums(first.items()), moments.get_power_sums(second.items())
+            ),
+            moments.get_power_sums(combined.items()),
+        )
+
+    def test_combine_power_sums_identity(self):
+        power_sums = moments.get_power_sums([(2, 3), (5, 1)])
+        self.assertEqual(moments.combine_power_sums(power_sums, moments.IDENTITY), power_sums)
+        self.assertEqual(moments.IDENTITY, moments.get_power_sums([(0, 1)]))
+
+    def test_get_power_sums_power(self):
+        power_sums = moments.get_power_sums([(1, 1), (2, 1), (3, 2)])
+        expected = moments.IDENTITY
+        for times in range(10):
+            self.assertEqual(moments.get_power_sums_power(power_sums, times), expected)
+            expected = moments.combine_power_sums(expected, power_sums)
+
+    def test_get_power_sums_power_zero_or_negative_times(self):
+        power_sums = moments.get_power_sums([(1, 1), (2, 1)])
+        self.assertEqual(moments.get_power_sums_power(power_sums, 0), moments.IDENTITY)
+        self.assertEqual(moments.get_power_sums_power(power_sums, -3), moments.IDENTITY)
+
+    def test_get_power_sums_power_large_times(self):
+        power_sums = moments.get_power_sums([(1, 1), (2, 1)])
+        answer = moments.get_power_sums_power(power_sums, 1000)
+        self.assertEqual(answer.total, 2**1000)
+        self.assertEqual(moments.get_mean(answer), 1500)
+        self.assertEqual(moments.get_variance(answer), 250)
+
+    def test_remove_power_sums(self):
+        first = moments.get_power_sums([(-1, 2), (0, 1), (3, 4)])
+        second = moments.get_power_sums([(1, 1), (2, 5)])
+        combined = moments.combine_power_sums(first, second)
+        self.assertEqual(moments.remove_power_sums(combined, second), first)
+        self.assertEqual(moments.remove_power_sums(combined, first), second)
+        self.assertEqual(moments.remove_power_sums(first, moments.IDENTITY), first)
+
+    def test_remove_power_sums_not_contained_is_none(self):
+        first = moments.get_power_sums([(1, 1), (2, 1), (3, 1)])
+        self.assertIsNone(
+            moments.remove_power_sums(first, moments.get_power_sums([(1, 1), (2, 1)]))
+        )
+        self.assertIsNone(moments.remove_power_sums(first, moments.get_power_sums([(1, 3)])))
+
+    def test_PendingPowerSums_get(self):
+        die = moments.get_power_sums([(1, 1), (2, 1)])
+        base = moments.get_power_sums([(0, 1), (5, 2)])
+        pending = moments.PendingPowerSums(base, [(die, 3), (die, 0)])
+        expected = moments.combine_power_sums(base, moments.get_power_sums_power(die, 3))
+        self.assertEqual(pending.get(), expected)
+        self.assertIs(pending.get(), pending.get())
+
+    def test_PendingPowerSums_chain_is_worked_out_once(self):
+        die = moments.get_power_sums([(1, 1), (2, 1)])
+        first = moments.PendingPowerSums(moments.IDENTITY, [(die, 1)])
+        second = moments.PendingPowerSums(first, [(die, 2)])
+        third = moments.PendingPowerSums(second, [(die, 1)], remove=True)
+        expected = moments.get_power_sums_power(die, 2)
+        with mock.patch.object(
+            moments, "get_power_sums_power", wraps=moments.get_power_sums_power
+        ) as get_power:
+            self.assertEqual(third.get(), expected)
+            self.assertEqual(get_power.call_count, 3)
+            self.assertEqual(first.get(), die)
+            self.assertEqual(get_power.call_count, 3)
+
+    def test_PendingPowerSums_pending_operand(self):
+        die = moments.get_power_sums([(1, 1), (2, 1)])
+        operand = moments.PendingPowerSums(moments.IDENTITY, [(die, 2)])
+        pending = moments.PendingPowerSums(die, [(operand, 2)])
+        self.assertEqual(pending.get(), moments.get_power_sums_power(die, 5))
+        self.assertEqual(operand.get(), moments.get_power_sums_power(die, 2))
+
+    def test_PendingPowerSums_removal_that_does_not_divide_is_none(self):
+        base = moments.get_power_sums([(1, 1), (2, 1), (3, 1)])
+        removed = moments.PendingPowerSums(
+            base, [(moments.get_power_sums([(1, 1), (2, 1)]), 1)], True
+        )
+        self.assertIsNone(removed.get())
+        after = moments.PendingPowerSums(removed, [(moments.get_power_sums([(1, 1)]), 1)])
+        self.assertIsNone(after.get())
+        self.assertIsNone(moments.PendingPowerSums(base, [(removed, 1)]).get())
+
+    def test_get_mean(self):
+        self.assertEqual(moments.get_mean(moments.get_power_sums([(1, 1), (2, 2)])), Fraction(5, 3))
+
+    def test_get_central_moments(self):
+        dictionary = {-3: 2, 0: 1, 1: 7, 4: 3, 10: 1}
+        power_sums = moments.get_power_sums(dictionary.items())
+        expected = tuple(get_brute_force_central_moment(dictionary, power) for power in (2, 3, 4))
+        self.assertEqual(moments.get_central_moments(power_sums), expected)
+        self.assertEqual(moments.get_variance(power_sums), expected[0])
+
+    def test_get_variance_single_event(self):
+        self.assertEqual(moments.get_variance(moments.get_power_sums([(5, 3)])), 0)
+
+    def test_get_stddev(self):
+        power_sums = moments.get_power_sums([(2, 1), (-2, 1), (1, 1), (-1, 1)])
+        self.assertEqual(moments.get_stddev(power_sums, 10), Decimal("1.581138830"))
+        self.assertEqual(moments.get_stddev(power_sums, 50), Decimal("2.5").sqrt(Context(prec=50)))
+
+    def test_get_skewness(self):
+        power_sums = moments.get_power_sums([(0, 1), (1, 3)])
+        # third central / variance ** 1.5 = (-3/32) / (3/16) ** 1.5
+        self.assertEqual(moments.get_skewness(power_sums, 12), Decimal("-1.15470053838"))
+
+    def test_get_skewness_symmetric(self):
+        power_sums = moments.get_power_sums([(1, 1), (2, 5), (3, 1)])
+        self.assertEqual(moments.get_skewness(power_sums), 0)
+
+    def test_get_kurtosis(self):
+        power_sums = moments.get_power_sums([(1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1)])
+        self.assertEqual(moments.get_kurtosis(power_sums), Fraction(-222, 175))
+
+    def test_skewness_and_kurtosis_zero_variance_raise_error(self):
+        power_sums = moments.get_power_sums([(5, 3)])
+        self.assertRaises(ZeroDivisionError, moments.get_skewness, power_sums)
+        self.assertRaises(ZeroDivisionError, moments.get_kurtosis, power_sums)
+
+    def test_sqrt_fraction(self):
+        self.assertEqual(moments.sqrt_fraction(Fraction(9, 4), 5), Decimal("1.5"))
+        self.assertEqual(moments.sqrt_fraction(Fraction(1, 3), 5), Decimal("0.57735"))
+
+
+if __name__ == "__main__":
+    unittest.main()
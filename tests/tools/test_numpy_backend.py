@@ -0,0 +1,51 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import unittest
+from unittest import mock
+
+from dicetables.tools import numpy_backend
+
+
+class TestNumpyBackend(unittest.TestCase):
+    def test_get_safe_dtype_without_numpy_is_none(self):
+        with mock.patch.object(numpy_backend, "numpy", None):
+            self.assertFalse(numpy_backend.is_numpy_available())
+            self.assertIsNone(numpy_backend.get_safe_dtype(1))
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_get_safe_dtype(self):
+        numpy = numpy_backend.numpy
+        self.assertEqual(numpy_backend.get_safe_dtype(1), numpy.int64)
+        self.assertEqual(numpy_backend.get_safe_dtype(63), numpy.int64)
+        self.assertEqual(numpy_backend.get_safe_dtype(64), numpy.uint64)
+        self.assertIsNone(numpy_backend.get_safe_dtype(65))
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_convolve_many_times(self):
+        dtype = numpy_backend.get_safe_dtype(10)
+        self.assertEqual(numpy_backend.convolve_many_times([1], [1, 2], 3, dtype), [1, 6, 12, 8])
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_convolve_many_times_zero_times(self):
+        dtype = numpy_backend.get_safe_dtype(10)
+        self.assertEqual(numpy_backend.convolve_many_times([1, 0, 2], [1, 2], 0, dtype), [1, 0, 2])
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_convolve_many_times_returns_python_ints(self):
+        dtype = numpy_backend.get_safe_dtype(64)
+        answer = numpy_backend.convolve_many_times([2**63], [1, 1], 1, dtype)
+        self.assertEqual(answer, [2**63, 2**63])
+        self.assertTrue(all(type(value) is int for value in answer))
+
+    def test_get_scaled_float_array_without_numpy_raises_error(self):
+        with mock.patch.object(numpy_backend, "numpy", None):
+            self.assertRaises(ImportError, numpy_backend.get_scaled_float_array, [1], 0, 1.0)
+
+    @unittest.skipIf(not numpy_backend.is_numpy_available(), "numpy is not installed")
+    def test_get_scaled_float_array(self):
+        answer = numpy_backend.get_scaled_float_array([4, 8, 2**100], 2, 0.5)
+        self.assertEqual(answer.tolist(), [0.5, 1.0, 2.0**97])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,30 @@
 import unittest
+from itertools import combinations_with_replacement
+from math import factorial
 
 from dicetables import AdditiveEvents
 from dicetables.tools.orderedcombinations import (
+    _get_combinations_with_leading_face,
+    _iter_counts,
     get_combination_occurrences,
+    get_factorial,
+    get_powers,
+    iter_face_counts_of_events,
+    iter_occurrences,
+    iter_ordered_combinations_of_events,
     ordered_combinations_of_events,
     count_unique_combination_keys,
     largest_permitted_pool_size,
 )
 
 
+def get_multinomial_occurrences(counts, weights):
+    answer = factorial(sum(counts))
+    for count, weight in zip(counts, weights):
+        answer = answer // factorial(count) * weight**count
+    return answer
+
+
 class TestOrderedCombinations(unittest.TestCase):
     def test_count_number_of_combinations_single_key(self):
         to_use = {1: 1, 2: 2, 3: 3, 4: 4}
@@ -138,3 +154,96 @@ class TestOrderedCombinations(unittest.TestCase):
         for max_keys in range(22, 28):
             self.assertEqual(largest_permitted_pool_size(events, max_keys), pool_size)
         self.assertEqual(largest_permitted_pool_size(events, 28), next_pool_size)
+
+    def test_iter_ordered_combinations_of_events(self):
+        events = AdditiveEvents({1: 2, 2: 1, 4: 3})
+        answer = iter_ordered_combinations_of_events(events, 3)
+        self.assertEqual(next(answer), ((1, 1, 1), 8))
+        self.assertEqual(next(answer), ((1, 1, 2), 12))
+        self.assertEqual(
+            [((1, 1, 1), 8), ((1, 1, 2), 12)] + list(answer),
+            sorted(ordered_combinations_of_events(events, 3).items()),
+        )
+
+    def test_ordered_combinations_of_events_workers(self):
+        events = AdditiveEvents({1: 2, 2: 1, 4: 3, 7: 1})
+        expected = ordered_combinations_of_events(events, 4)
+        answer = ordered_combinations_of_events(events, 4, workers=2)
+        self.assertEqual(answer, expected)
+        self.assertEqual(list(answer), sorted(expected))
+
+    def test_ordered_combinations_of_events_workers_edge_cases(self):
+        events = AdditiveEvents({1: 2, 2: 1})
+        self.assertEqual(ordered_combinations_of_events(events, 1, workers=2), {(1,): 2, (2,): 1})
+        self.assertEqual(
+            ordered_combinations_of_events(AdditiveEvents({3: 2}), 3, workers=2), {(3, 3, 3): 8}
+        )
+        with self.assertRaises(ValueError):
+            ordered_combinations_of_events(events, 2, workers=0)
+
+    def test_get_combinations_with_leading_face(self):
+        base_dict = {1: 1, 2: 1, 3: 1}
+        self.assertEqual(
+            _get_combinations_with_leading_face((base_dict, [2, 3], 1, 3)), {(2, 3, 3): 3}
+        )
+        self.assertEqual(
+            _get_combinations_with_leading_face((base_dict, [1, 2, 3], 2, 3)),
+            {(1, 1, 2): 3, (1, 1, 3): 3},
+        )
+        self.assertEqual(
+            _get_combinations_with_leading_face((base_dict, [3], 3, 3)), {(3, 3, 3): 1}
+        )
+
+    def test_iter_ordered_combinations_of_events_matches_get_combination_occurrences(self):
+        events = AdditiveEvents({-2: 3, 1: 2, 2: 1, 4: 7, 5: 1})
+        base_dict = events.get_dict()
+        for times in range(1, 6):
+            expected = [
+                (key, get_combination_occurrences(key, base_dict))
+                for key in combinations_with_replacement(sorted(base_dict), times)
+            ]
+            self.assertEqual(list(iter_ordered_combinations_of_events(events, times)), expected)
+
+    def test_iter_face_counts_of_events(self):
+        events = AdditiveEvents({1: 2, 2: 1, 4: 3})
+        self.assertEqual(
+            list(iter_face_counts_of_events(events, 2)),
+            [
+                ((2, 0, 0), 4),
+                ((1, 1, 0), 4),
+                ((1, 0, 1), 12),
+                ((0, 2, 0), 1),
+                ((0, 1, 1), 6),
+                ((0, 0, 2), 9),
+            ],
+        )
+
+    def test_iter_face_counts_of_events_one_face_and_zero_times(self):
+        self.assertEqual(list(iter_face_counts_of_events(AdditiveEvents({3: 2}), 3)), [((3,), 8)])
+        self.assertEqual(
+            list(iter_face_counts_of_events(AdditiveEvents({3: 2, 4: 1}), 0)), [((0, 0), 1)]
+        )
+
+    def test_iter_occurrences(self):
+        self.assertEqual(list(iter_occurrences([2, 1, 3], 2)), [4, 4, 12, 1, 6, 9])
+        self.assertEqual(list(iter_occurrences([], 0)), [1])
+        self.assertEqual(list(iter_occurrences([], 2)), [])
+
+    def test_iter_occurrences_is_exact(self):
+        weights = [10**20, 1, 3]
+        self.assertEqual(
+            list(iter_occurrences(weights, 3)),
+            [
+                get_multinomial_occurrences(counts, weights)
+                for counts, _ in _iter_counts(weights, 3)
+            ],
+        )
+
+    def test_get_factorial(self):
+        self.assertEqual([get_factorial(number) for number in range(6)], [1, 1, 2, 6, 24, 120])
+        self.assertEqual(get_factorial(30), factorial(30))
+
+    def test_get_powers(self):
+        self.assertEqual(get_powers(3, 3), [1, 3, 9, 27])
+        self.assertEqual(get_powers(1, 2), [1, 1, 1])
+        self.assertEqual(get_powers(5, 0), [1])
@@ -0,0 +1,108 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods
+
+import unittest
+from itertools import product
+
+from dicetables.tools.orderstatistics import (
+    count_selected_sums_steps,
+    get_counts_and_ways,
+    get_many_selected_sums,
+    get_selected_count,
+    get_selected_sums,
+)
+
+
+def get_brute_force_selected_sums(events, pool_size, selected_indices):
+    answer = {}
+    for roll in product(sorted(events), repeat=pool_size):
+        occurrences = 1
+        for face in roll:
+            occurrences *= events[face]
+        ordered = sorted(roll)
+        key = sum(ordered[index] for index in set(selected_indices))
+        answer[key] = answer.get(key, 0) + occurrences
+    return answer
+
+
+class TestOrderStatistics(unittest.TestCase):
+    def test_get_selected_count(self):
+        self.assertEqual(get_selected_count(5, [1, 3, 4]), [0, 0, 1, 1, 2, 3])
+        self.assertEqual(get_selected_count(3, []), [0, 0, 0, 0])
+        self.assertEqual(get_selected_count(3, [2, 2, 2]), [0, 0, 0, 1])
+
+    def test_get_selected_count_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            get_selected_count(3, [0, 3])
+        with self.assertRaises(ValueError):
+            get_selected_count(3, [-1])
+
+    def test_get_counts_and_ways(self):
+        self.assertEqual(get_counts_and_ways(0, 5), [(0, 1)])
+        self.assertEqual(get_counts_and_ways(3, 2), [(0, 1), (1, 6), (2, 12), (3, 8)])
+
+    def test_get_selected_sums_best_of(self):
+        self.assertEqual(
+            get_selected_sums({1: 1, 2: 1, 3: 1}, 3, [1, 2]), {2: 1, 3: 3, 4: 7, 5: 9, 6: 7}
+        )
+
+    def test_get_selected_sums_nothing_selected(self):
+        self.assertEqual(get_selected_sums({1: 2, 2: 3}, 4, []), {0: 5**4})
+
+    def test_get_selected_sums_everything_selected_is_combining(self):
+        self.assertEqual(
+            get_selected_sums({1: 1, 2: 1}, 4, range(4)), {4: 1, 5: 4, 6: 6, 7: 4, 8: 1}
+        )
+
+    def test_get_selected_sums_one_face(self):
+        self.assertEqual(get_selected_sums({3: 2}, 4, [0, 3]), {6: 16})
+
+    def test_get_selected_sums_matches_brute_force(self):
+        events = {-2: 3, 0: 1, 5: 7, 6: 2}
+        index_sets = [[0], [4], [0, 4], [1, 3], [2], [0, 1, 2, 3, 4], [1, 2, 4], [3, 0]]
+        for selected_indices in index_sets:
+            self.assertEqual(
+                get_selected_sums(events, 5, selected_indices),
+                get_brute_force_selected_sums(events, 5, selected_indices),
+            )
+
+    def test_get_selected_sums_is_exact(self):
+        answer = get_selected_sums({1: 10**50, 2: 1}, 3, [2])
+        self.assertEqual(answer, {1: 10**150, 2: 3 * 10**100 + 3 * 10**50 + 1})
+
+    def test_get_selected_sums_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            get_selected_sums({1: 1, 2: 1}, 3, [3])
+
+    def test_get_many_selected_sums(self):
+        events = {-2: 3, 0: 1, 5: 7, 6: 2}
+        index_sets = [[0], [4], [0, 4], [1, 3], [], [0, 1, 2, 3, 4], [3, 0]]
+        answer = get_many_selected_sums(events, 5, index_sets)
+        self.assertEqual(
+            answer,
+            [get_brute_force_selected_sums(events, 5, selected) for selected in index_sets],
+        )
+
+    def test_get_many_selected_sums_equal_sets_share_one_dict(self):
+        answer = get_many_selected_sums({1: 1, 2: 1}, 3, [[0, 2], [2, 0, 0], [1]])
+        self.assertIs(answer[0], answer[1])
+        self.assertEqual(answer[2], {1: 4, 2: 4})
+
+    def test_get_many_selected_sums_no_sets(self):
+        self.assertEqual(get_many_selected_sums({1: 1, 2: 1}, 3, []), [])
+
+    def test_get_many_selected_sums_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            get_many_selected_sums({1: 1, 2: 1}, 3, [[0], [3]])
+
+    def test_count_selected_sums_steps_two_faces(self):
+        self.assertEqual(count_selected_sums_steps({1: 1, 2: 1}, 10), 11 + 11)
+
+    def test_count_selected_sums_steps_grows_with_pool_size(self):
+        events = {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}
+        steps = [count_selected_sums_steps(events, pool_size) for pool_size in range(1, 20)]
+        self.assertEqual(steps, sorted(steps))
+        self.assertEqual(len(set(steps)), len(steps))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import threading
+import unittest
+from operator import setitem
+from unittest import mock
+
+from dicetables.additiveevents import AdditiveEvents
+from dicetables.dicetable import DiceTable
+from dicetables.dieevents import Die, ModDie, StrongDie, WeightedDie
+from dicetables.tools import bytecache, powercache
+from dicetables.tools.bytecache import CacheInfo, get_size_in_bytes
+from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.indexedvalues import generate_indexed_values_from_dict
+from dicetables.tools.powercache import (
+    PowerCache,
+    combine_all_events,
+    combine_events,
+    is_identity,
+)
+
+
+def get_power_dict(die, times):
+    return DictCombiner({0: 1}).combine_by_dictionary(die.get_dict(), times)
+
+
+class TestPowerCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PowerCache()
+
+    def test_get_power(self):
+        power = self.cache.get_power(Die(6), 3)
+        self.assertEqual(power, get_power_dict(Die(6), 3))
+        self.assertRaises(TypeError, setitem, power, 3, 2)
+
+    def test_get_power_zero_times(self):
+        self.assertEqual(self.cache.get_power(Die(6), 0), {0: 1})
+
+    def test_get_power_sparse_die_stores_only_its_events(self):
+        die = StrongDie(Die(2), 10**6)
+        power = self.cache.get_power(die, 3)
+        self.assertEqual(power, {3 * 10**6: 1, 4 * 10**6: 3, 5 * 10**6: 3, 6 * 10**6: 1})
+        self.assertEqual(self.cache.cache_info().current_bytes, 4 * (1).__sizeof__())
+
+    def test_sparse_strong_die_table_does_not_pay_for_its_span(self):
+        with mock.patch.object(powercache, "_power_cache", self.cache):
+            table = DiceTable.new().add_die(StrongDie(Die(2), 10**6), 3).add_die(Die(6), 2)
+        self.assertEqual(len(table.get_dict()), 4 * 11)
+        info = self.cache.cache_info()
+        self.assertEqual(info.entries, 2)
+        self.assertEqual(info.current_bytes, (4 + 11) * (1).__sizeof__())
+
+    def test_get_power_counts_hits_and_misses(self):
+        self.cache.get_power(Die(6), 3)
+        self.cache.get_power(Die(6), 3)
+        self.cache.get_power(Die(6), 4)
+        self.cache.get_power(WeightedDie({1: 1, 2: 3}), 3)
+        info = self.cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.entries), (1, 3, 3))
+
+    def test_get_power_hit_returns_same_object(self):
+        first = self.cache.get_power(ModDie(6, 2), 5)
+        self.assertIs(self.cache.get_power(ModDie(6, 2), 5), first)
+
+    def test_get_power_keys_on_equal_dice(self):
+        self.cache.get_power(Die(6), 2)
+        self.cache.get_power(Die(6), 2)
+        self.cache.get_power(ModDie(6, 0), 2)
+        self.assertEqual(self.cache.cache_info().hits, 1)
+
+    def test_cache_info_bytes(self):
+        power = self.cache.get_power(Die(6), 3)
+        info = self.cache.cache_info()
+        self.assertEqual(info.current_bytes, get_size_in_bytes(power))
+        self.assertEqual(info.max_bytes, bytecache.DEFAULT_MAX_BYTES)
+
+    def test_evicts_least_recently_used(self):
+        size = get_size_in_bytes(self.cache.get_power(Die(6), 2))
+        cache = PowerCache(max_bytes=size * 2)
+        cache.get_power(Die(6), 2)
+        cache.get_power(Die(7), 1)  # Die(7) and Die(6)*2 are both 7 small ints.
+        cache.get_power(Die(6), 2)
+        cache.get_power(Die(8), 1)
+        info = cache.cache_info()
+        self.assertEqual((info.entries, info.evictions), (2, 1))
+        self.assertLessEqual(info.current_bytes, size * 2)
+
+        cache.get_power(Die(6), 2)
+        self.assertEqual(cache.cache_info().hits, 2)
+        cache.get_power(Die(7), 1)
+        self.assertEqual(cache.cache_info().misses, 4)
+
+    def test_entry_bigger_than_budget_is_not_stored(self):
+        cache = PowerCache(max_bytes=10)
+        power = cache.get_power(Die(6), 10)
+        self.assertEqual(power, get_power_dict(Die(6), 10))
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 1, 0, 0, 0, 10))
+
+    def test_max_bytes_zero_stores_nothing(self):
+        cache = PowerCache(max_bytes=0)
+        cache.get_power(Die(6), 2)
+        cache.get_power(Die(6), 2)
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 2, 0, 0, 0, 0))
+
+    def test_set_max_bytes_evicts_to_new_budget(self):
+        for times in range(2, 6):
+            self.cache.get_power(Die(6), times)
+        last_size = get_size_in_bytes(self.cache.get_power(Die(6), 5))
+        self.cache.set_max_bytes(last_size)
+        info = self.cache.cache_info()
+        self.assertEqual((info.entries, info.evictions), (1, 3))
+        self.assertEqual(info.current_bytes, last_size)
+        self.assertEqual(info.max_bytes, last_size)
+        self.cache.get_power(Die(6), 5)
+        self.assertEqual(self.cache.cache_info().hits, 2)
+
+    def test_clear(self):
+        self.cache.get_power(Die(6), 2)
+        self.cache.get_power(Die(6), 2)
+        self.cache.set_max_bytes(0)
+        self.cache.set_max_bytes(100)
+        self.cache.clear()
+        self.assertEqual(self.cache.cache_info(), CacheInfo(0, 0, 0, 0, 0, 100))
+
+    def test_combine(self):
+        answer = self.cache.combine({1: 1, 2: 1}, WeightedDie({1: 2, 3: 1}), 4)
+        expected = DictCombiner({1: 1, 2: 1}).combine_by_dictionary({1: 2, 3: 1}, 4)
+        self.assertEqual(answer, expected)
+        self.assertEqual(self.cache.cache_info().misses, 1)
+
+    def test_get_power_from_many_threads(self):
+        results = []
+
+        def get_power():
+            results.append(dict(self.cache.get_power(Die(6), 20)))
+
+        threads = [threading.Thread(target=get_power) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        expected = get_power_dict(Die(6), 20)
+        self.assertEqual(results, [expected] * 8)
+        info = self.cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 8)
+        self.assertEqual(info.entries, 1)
+
+
+class TestCombineEvents(unittest.TestCase):
+    def setUp(self):
+        self.cache = PowerCache()
+        self.patcher = mock.patch.object(powercache, "_power_cache", self.cache)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_get_power_cache(self):
+        self.assertIs(powercache.get_power_cache(), self.cache)
+
+    def test_combine_events_die_more_than_once_uses_cache(self):
+        answer = combine_events({0: 1, 1: 1}, Die(6), 3)
+        self.assertEqual(
+            answer, DictCombiner({0: 1, 1: 1}).combine_by_dictionary(Die(6).get_dict(), 3)
+        )
+        combine_events({5: 2}, Die(6), 3)
+        self.assertEqual(self.cache.cache_info()[:3], (1, 1, 0))
+
+    def test_combine_events_once_does_not_use_cache(self):
+        answer = combine_events({0: 1, 1: 1}, Die(6), 1)
+        self.assertEqual(
+            answer, DictCombiner({0: 1, 1: 1}).combine_by_dictionary(Die(6).get_dict(), 1)
+        )
+        self.assertEqual(self.cache.cache_info().misses, 0)
+
+    def test_combine_events_zero_or_negative_times_does_not_use_cache(self):
+        self.assertEqual(combine_events({1: 2}, Die(6), 0), {1: 2})
+        self.assertEqual(combine_events({1: 2}, Die(6), -2), {1: 2})
+        self.assertEqual(self.cache.cache_info().misses, 0)
+
+    def test_combine_events_non_die_does_not_use_cache(self):
+        events = AdditiveEvents({1: 1, 2: 1})
+        answer = combine_events({0: 1}, events, 3)
+        self.assertEqual(answer, {3: 1, 4: 3, 5: 3, 6: 1})
+        self.assertEqual(self.cache.cache_info().misses, 0)
+
+    def test_combine_all_events(self):
+        events_times = [(Die(6), 3), (AdditiveEvents({1: 2, 4: 1}), 2), (Die(20), 1), (Die(2), 0)]
+        expected = {1: 1, 2: 1}
+        for events, times in events_times:
+            expected = DictCombiner(expected).combine_by_dictionary(events.get_dict(), times)
+        self.assertEqual(combine_all_events({1: 1, 2: 1}, events_times), expected)
+        self.assertEqual(self.cache.cache_info()[:3], (0, 1, 0))
+
+    def test_is_identity(self):
+        self.assertTrue(is_identity({0: 1}))
+        self.assertTrue(is_identity(generate_indexed_values_from_dict({0: 1}).view()))
+        self.assertFalse(is_identity({0: 2}))
+        self.assertFalse(is_identity({1: 1}))
+        self.assertFalse(is_identity({0: 1, 1: 1}))
+
+    def test_combine_all_events_identity(self):
+        answer = combine_all_events({0: 1}, [(Die(4), 2), (Die(2), 1)])
+        self.assertEqual(answer, {3: 1, 4: 3, 5: 5, 6: 7, 7: 7, 8: 5, 9: 3, 10: 1})
+
+    def test_combine_all_events_nothing_to_combine(self):
+        dictionary = {1: 2, 3: 4}
+        answer = combine_all_events(dictionary, [(Die(4), 0)])
+        self.assertEqual(answer, {1: 2, 3: 4})
+        self.assertIsNot(answer, dictionary)
+
+    def test_DiceTable_add_die_uses_cache(self):
+        first = DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2)
+        second = DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 2)
+        self.assertEqual(first.get_dict(), second.get_dict())
+        self.assertEqual(
+            first.get_dict(),
+            DiceTable.new().add_die(Die(6), 3).add_die(Die(8), 1).add_die(Die(8)).get_dict(),
+        )
+        self.assertEqual(self.cache.cache_info()[:3], (3, 2, 0))
+
+    def test_AdditiveEvents_combine_uses_cache(self):
+        AdditiveEvents.new().combine(Die(4), 5)
+        answer = AdditiveEvents({1: 1}).combine(Die(4), 5)
+        self.assertEqual(
+            answer.get_dict(), DictCombiner({1: 1}).combine_by_dictionary(Die(4).get_dict(), 5)
+        )
+        self.assertEqual(self.cache.cache_info()[:3], (1, 1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# pylint: disable=missing-docstring, invalid-name, too-many-public-methods, line-too-long
+
+import unittest
+from operator import delitem, setitem
+from unittest import mock
+
+from dicetables.dicerecord import DiceRecord
+from dicetables.dieevents import Die, Modifier, WeightedDie
+from dicetables.tools import powercache, tablecache
+from dicetables.tools.dictcombiner import DictCombiner
+from dicetables.tools.powercache import PowerCache
+from dicetables.tools.tablecache import TableCache, TableCacheInfo, get_size_in_bytes
+
+
+def get_events(record):
+    events = {0: 1}
+    for die, number in record.get_dict().items():
+        events = DictCombiner(events).combine_by_dictionary(die.get_dict(), number)
+    return events
+
+
+class TestTableCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TableCache()
+        self.record = DiceRecord({Die(6): 3, Die(8): 2})
+
+    def test_get_events_empty_record(self):
+        self.assertEqual(self.cache.get_events(DiceRecord.new()), {0: 1})
+        self.assertEqual(
+            self.cache.cache_info(), TableCacheInfo(0, 0, 0, 0, 0, 0, tablecache.DEFAULT_MAX_BYTES)
+        )
+
+    def test_get_events_miss(self):
+        self.assertEqual(self.cache.get_events(self.record), get_events(self.record))
+        info = self.cache.cache_info()
+        self.assertEqual((info.hits, info.partial_hits, info.misses, info.entries), (0, 0, 1, 1))
+        self.assertEqual(info.current_bytes, get_size_in_bytes(get_events(self.record)))
+
+    def test_get_events_hit(self):
+        self.cache.get_events(self.record)
+        answer = self.cache.get_events(DiceRecord({Die(8): 2, Die(6): 3}))
+        self.assertEqual(answer, get_events(self.record))
+        self.assertEqual(self.cache.cache_info()[:3], (1, 0, 1))
+
+    def test_get_events_returns_read_only_view(self):
+        built = self.cache.get_events(self.record)
+        cached = self.cache.get_events(self.record)
+        self.assertRaises(TypeError, setitem, built, 2, 0)
+        self.assertRaises(TypeError, delitem, cached, 3)
+        self.assertFalse(hasattr(self.cache.get_cached_events(self.record), "update"))
+        self.assertEqual(self.cache.get_events(self.record), get_events(self.record))
+
+    def test_get_events_uses_largest_sub_record(self):
+        small = DiceRecord({Die(6): 1})
+        large = DiceRecord({Die(6): 3, Die(8): 1})
+        not_sub_record = DiceRecord({Die(6): 3, Die(8): 1, Modifier(2): 1})
+        for record in (small, large, not_sub_record):
+            self.cache.get_events(record)
+        with mock.patch.object(powercache, "_power_cache", PowerCache()) as power_cache:
+            answer = self.cache.get_events(self.record)
+        self.assertEqual(answer, get_events(self.record))
+        self.assertEqual(self.cache.cache_info()[:3], (0, 3, 1))
+        self.assertEqual(power_cache.cache_info().misses, 0)  # only one Die(8) was combined
+
+    def test_get_events_partial_hit_combines_every_missing_die(self):
+        self.cache.get_events(DiceRecord({Die(6): 1}))
+        record = DiceRecord({Die(6): 4, WeightedDie({1: 2, 3: 1}): 2, Modifier(-3): 1})
+        self.assertEqual(self.cache.get_events(record), get_events(record))
+        self.assertEqual(self.cache.cache_info()[:3], (0, 1, 1))
+
+    def test_get_cached_events(self):
+        self.assertIsNone(self.cache.get_cached_events(self.record))
+        self.cache.get_events(self.record)
+        self.assertEqual(self.cache.get_cached_events(self.record), get_events(self.record))
+        self.assertEqual(self.cache.cache_info()[:3], (1, 0, 2))
+
+    def test_get_cached_events_does_not_build(self):
+        self.cache.get_events(DiceRecord({Die(6): 3}))
+        self.assertIsNone(self.cache.get_cached_events(self.record))
+        self.assertEqual(self.cache.cache_info().entries, 1)
+
+    def test_evicts_least_recently_used(self):
+        first = DiceRecord({Die(6): 2})
+        second = DiceRecord({Die(11): 1})  # same number of small events as first.
+        third = DiceRecord({Die(5): 2})
+        size = get_size_in_bytes(get_events(first))
+        cache = TableCache(max_bytes=size * 2)
+        cache.get_events(first)
+        cache.get_events(second)
+        cache.get_events(first)
+        cache.get_events(third)
+        info = cache.cache_info()
+        self.assertEqual((info.entries, info.evictions), (2, 1))
+        self.assertIsNotNone(cache.get_cached_events(first))
+        self.assertIsNone(cache.get_cached_events(second))
+
+    def test_using_a_sub_record_counts_as_recently_used(self):
+        first = DiceRecord({Die(6): 2})
+        second = DiceRecord({Die(11): 1})
+        size = get_size_in_bytes(get_events(first))
+        cache = TableCache(
+            max_bytes=size * 2 + get_size_in_bytes(get_events(DiceRecord({Die(6): 3})))
+        )
+        cache.get_events(first)
+        cache.get_events(second)
+        cache.get_events(DiceRecord({Die(6): 3}))
+        cache.get_events(DiceRecord({Die(5): 2}))
+        self.assertIsNotNone(cache.get_cached_events(first))
+        self.assertIsNone(cache.get_cached_events(second))
+
+    def test_entry_bigger_than_budget_is_not_stored(self):
+        cache = TableCache(max_bytes=10)
+        self.assertEqual(cache.get_events(self.record), get_events(self.record))
+        self.assertEqual(cache.cache_info(), TableCacheInfo(0, 0, 1, 0, 0, 0, 10))
+
+    def test_set_max_bytes_and_clear(self):
+        self.cache.get_events(DiceRecord({Die(6): 1}))
+        self.cache.get_events(self.record)
+        self.cache.set_max_bytes(get_size_in_bytes(get_events(self.record)))
+        info = self.cache.cache_info()
+        self.assertEqual((info.entries, info.evictions), (1, 1))
+        self.cache.clear()
+        self.assertEqual(self.cache.cache_info(), TableCacheInfo(0, 0, 0, 0, 0, 0, info.max_bytes))
+
+    def test_get_table_cache_and_set_table_cache(self):
+        self.assertIsNone(tablecache.get_table_cache())
+        try:
+            tablecache.set_table_cache(self.cache)
+            self.assertIs(tablecache.get_table_cache(), self.cache)
+        finally:
+            tablecache.set_table_cache(None)
+        self.assertIsNone(tablecache.get_table_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()